@@ -2,6 +2,7 @@ import logging
 import sys
 import warnings
 from collections import defaultdict
+from pathlib import Path
 from typing import IO, Optional, cast
 
 import click
@@ -59,10 +60,14 @@ class LocalStateAwareCommand(ContextAwareCommand):
     """Perform config, context, and local state files validation before running command."""
 
     def invoke(self, ctx: Context):
-        from panoramic.cli.validate import validate_local_state
+        from panoramic.cli.tel_validation import validate_tel
+        from panoramic.cli.validate import load_local_state
+
+        # local files are parsed once, the state is shared with taxonomy and model retriever
+        state, errors = load_local_state()
 
         errors_by_severity: defaultdict = defaultdict(list)
-        for error in validate_local_state():
+        for error in errors:
             errors_by_severity[error.severity].append(error)
 
         if len(errors_by_severity[ValidationErrorSeverity.WARNING]) > 0:
@@ -73,15 +78,40 @@ class LocalStateAwareCommand(ContextAwareCommand):
             echo_errors(errors_by_severity[ValidationErrorSeverity.ERROR])
             sys.exit(1)
 
-        # preload data for taxonomy and calculate TEL metadata
+        # TEL metadata is calculated along the way, invalid expressions fail only `pano validate`
+        taxons, tel_errors = validate_tel(state)
+        if len(tel_errors) > 0:
+            echo_warnings(tel_errors)
+            echo_info('')
+
+        # preload taxons with precalculated TEL metadata, models and the state for the command itself
         from panoramic.cli.husky.core.taxonomy.getters import Taxonomy
+        from panoramic.cli.husky.service.model_retriever.component import ModelRetriever
+        from panoramic.cli.local import preload_state
 
-        Taxonomy.preload_taxons_from_state()
-        Taxonomy.precalculate_tel_metadata()
+        Taxonomy.preload_taxons(taxons)
+        ModelRetriever.preload_state(state)
+        preload_state(state)
 
         return super().invoke(ctx)
 
 
+def diff_options(func):
+    """Options controlling how the difference between local and detected state is shown."""
+    func = click.option(
+        '--diff-json',
+        type=click.Path(dir_okay=False, writable=True),
+        help='Write the difference as JSON to a file, e.g. for CI',
+    )(func)
+    func = click.option(
+        '--max-lines', type=click.IntRange(min=0), help='Show at most this many lines of the difference'
+    )(func)
+    func = click.option(
+        '--summary', is_flag=True, default=False, help='Show only number of changes per dataset and action type'
+    )(func)
+    return func
+
+
 @click.group(context_settings={'help_option_names': ["-h", "--help"]}, help='')
 @click.option('--debug', is_flag=True, help='Enables debug mode')
 @click.version_option(__version__)
@@ -109,11 +139,14 @@ def scan(filter: Optional[str]):
 
 
 @cli.command(help='Validate local files', cls=Command)
+@click.option(
+    '--changed-only', is_flag=True, default=False, help='Validate only datasets with files changed in git working tree'
+)
 @handle_exception
-def validate():
+def validate(changed_only: bool):
     from panoramic.cli.command import validate as validate_command
 
-    if not validate_command():
+    if not validate_command(changed_only=changed_only):
         sys.exit(1)
 
 
@@ -124,11 +157,42 @@ def validate():
 @click.option(
     '--overwrite', is_flag=True, default=False, help='Overwrite joins on local model files by suggestions from remote'
 )
+@click.option(
+    '--verify',
+    is_flag=True,
+    default=False,
+    help='Verify relationships of detected joins on sampled data and drop the wrong ones',
+)
+@click.option(
+    '--sample-size', type=int, default=10000, show_default=True, help='Number of rows sampled for join verification'
+)
+@diff_options
 @handle_exception
-def detect_joins(target_dataset: str, yes: bool, diff: bool, overwrite: bool):
+def detect_joins(
+    target_dataset: str,
+    yes: bool,
+    diff: bool,
+    overwrite: bool,
+    verify: bool,
+    sample_size: int,
+    summary: bool,
+    max_lines: Optional[int],
+    diff_json: Optional[str],
+):
     from panoramic.cli.command import detect_joins as detect_joins_command
-
-    detect_joins_command(target_dataset=target_dataset, diff=diff, overwrite=overwrite, yes=yes)
+    from panoramic.cli.diff import DiffOptions
+
+    detect_joins_command(
+        target_dataset=target_dataset,
+        diff=diff,
+        overwrite=overwrite,
+        yes=yes,
+        verify=verify,
+        sample_size=sample_size,
+        diff_options=DiffOptions(
+            summary=summary, max_lines=max_lines, json_path=Path(diff_json) if diff_json is not None else None
+        ),
+    )
 
 
 @cli.group(name='field')
@@ -160,6 +224,16 @@ def scaffold(target_dataset: str, yes: bool, no_remote: bool):
     scaffold_missing_fields_command(target_dataset=target_dataset, yes=yes, no_remote=no_remote)
 
 
+@field_cli.command(help='Show models and calculations using a field', cls=ContextAwareCommand)
+@click.argument('slug', type=str)
+@click.option('--target-dataset', '-t', type=str, help='Target a specific dataset')
+@handle_exception
+def usages(slug: str, target_dataset: Optional[str]):
+    from panoramic.cli.command import field_usages as field_usages_command
+
+    field_usages_command(slug, target_dataset=target_dataset)
+
+
 @field_cli.command(help='My cmd', cls=LocalStateAwareCommand)
 @handle_exception
 def cmd():
@@ -180,6 +254,49 @@ def cmd():
     print(taxons)
 
 
+@cli.group(name='identifiers')
+def identifiers_cli():
+    """Commands on identifiers of local models."""
+    pass
+
+
+@identifiers_cli.command(name='detect', help='Detect identifiers of models on sampled data', cls=LocalStateAwareCommand)
+@click.option('--target-dataset', '-t', type=str, help='Target a specific dataset')
+@click.option('--yes', '-y', is_flag=True, default=False, help='Automatically confirm all actions')
+@click.option('--diff', '-d', is_flag=True, help='Show the difference between local and detected identifiers')
+@click.option(
+    '--overwrite', is_flag=True, default=False, help='Detect identifiers also for models which already have them'
+)
+@click.option(
+    '--sample-size', type=int, default=10000, show_default=True, help='Number of rows sampled from each table'
+)
+@diff_options
+@handle_exception
+def identifiers_detect(
+    target_dataset: str,
+    yes: bool,
+    diff: bool,
+    overwrite: bool,
+    sample_size: int,
+    summary: bool,
+    max_lines: Optional[int],
+    diff_json: Optional[str],
+):
+    from panoramic.cli.diff import DiffOptions
+    from panoramic.cli.identifier_parser.commands import detect_command
+
+    detect_command(
+        target_dataset=target_dataset,
+        diff=diff,
+        overwrite=overwrite,
+        yes=yes,
+        sample_size=sample_size,
+        diff_options=DiffOptions(
+            summary=summary, max_lines=max_lines, json_path=Path(diff_json) if diff_json is not None else None
+        ),
+    )
+
+
 @cli.group()
 def connection():
     """Connection subcommand for managing a connection.
@@ -297,8 +414,38 @@ def transform_create():
 @click.option(
     '--compile', 'compile_only', is_flag=True, default=False, help='Only compile transforms to sql statements'
 )
+@click.option(
+    '--parameterized',
+    is_flag=True,
+    default=False,
+    help='Execute transforms with values passed as bind parameters instead of inlined in sql',
+)
+@click.option(
+    '--force', is_flag=True, default=False, help='Execute also transforms unchanged since they were last executed'
+)
+@click.option(
+    '--comment',
+    is_flag=True,
+    default=False,
+    help='Record fingerprint of executed sql as comment on the transform view or table',
+)
+@click.option(
+    '--verification',
+    type=click.Choice(['limit_one', 'limit_zero', 'explain', 'columns']),
+    help='Verification of transforms which do not set their own. Defaults to the cheapest one for the dialect',
+)
 @handle_exception
-def transform_exec(yes: bool, compile_only: bool):
+def transform_exec(
+    yes: bool, compile_only: bool, parameterized: bool, force: bool, comment: bool, verification: Optional[str]
+):
     from panoramic.cli.transform.commands import exec_command
-
-    exec_command(yes=yes, compile_only=compile_only)
+    from panoramic.cli.transform.pano_transform import TransformVerification
+
+    exec_command(
+        yes=yes,
+        compile_only=compile_only,
+        parameterized=parameterized,
+        force=force,
+        comment=comment,
+        verification=TransformVerification(verification) if verification is not None else None,
+    )
@@ -2,34 +2,48 @@ import logging
 import re
 from collections import defaultdict
 from copy import deepcopy
-from typing import Dict, Optional
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import click
 from tqdm import tqdm
 
 from panoramic.cli.config.storage import update_context
 from panoramic.cli.connection import Connection
-from panoramic.cli.diff import echo_diff
-from panoramic.cli.errors import JoinException, ValidationError, ValidationErrorSeverity
+from panoramic.cli.diff import DiffOptions, echo_diff
+from panoramic.cli.errors import (
+    ExecuteActionsException,
+    JoinException,
+    ValidationError,
+    ValidationErrorSeverity,
+)
 from panoramic.cli.husky.common.enum import EnumHelper
+from panoramic.cli.husky.core.federated.model.models import FdqModel
+from panoramic.cli.husky.core.model.enums import ModelVisibility
 from panoramic.cli.husky.federated.join_detection.detect import (
     detect_joins as detect_join_for_models,
 )
 from panoramic.cli.husky.federated.transform.exceptions import UnsupportedDialectError
 from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
+from panoramic.cli.join_verification import DEFAULT_SAMPLE_SIZE, verify_join
 from panoramic.cli.local import get_state as get_local_state
 from panoramic.cli.local.executor import LocalExecutor
+from panoramic.cli.local.git import get_changed_files
 from panoramic.cli.local.writer import FileWriter
 from panoramic.cli.metadata.scanner import Scanner
 from panoramic.cli.pano_model import PanoField, PanoModel, PanoModelJoin
+from panoramic.cli.paths import Paths
 from panoramic.cli.print import echo_error, echo_errors, echo_info, echo_warnings
-from panoramic.cli.scan import scan_fields_for_errors
+from panoramic.cli.references import CalculationSlugsCache, ReferenceIndex
+from panoramic.cli.scan import columns_by_model_for_errors, scan_fields_for_errors
 from panoramic.cli.state import Action, ActionList
+from panoramic.cli.tel_validation import validate_tel
+from panoramic.cli.utils.executors import get_pool_executor
 from panoramic.cli.validate import (
+    load_local_state,
     validate_context,
     validate_local_state,
-    validate_missing_files,
-    validate_orphaned_files,
 )
 
 logger = logging.getLogger(__name__)
@@ -40,8 +54,12 @@ def configure():
     update_context('auth', {})
 
 
-def validate() -> bool:
-    """Check local files against schema."""
+def validate(changed_only: bool = False) -> bool:
+    """
+    Check local files against schema and TEL expressions in them.
+
+    When `changed_only` is set, only packages with files changed in git working tree are checked against schema.
+    """
     errors = []
 
     try:
@@ -49,7 +67,15 @@ def validate() -> bool:
     except ValidationError as e:
         errors.append(e)
 
-    errors.extend(validate_local_state())
+    if changed_only:
+        errors.extend(validate_local_state(changed_files=get_changed_files(Path.cwd())))
+    else:
+        state, state_errors = load_local_state()
+        errors.extend(state_errors)
+        if all(error.severity != ValidationErrorSeverity.ERROR for error in state_errors):
+            # TEL expressions reference fields across files, so they are checked only when all files are valid
+            _, tel_errors = validate_tel(state)
+            errors.extend(tel_errors)
 
     errors_by_severity = defaultdict(list)
     for error in errors:
@@ -96,7 +122,7 @@ def scan(filter_reg_ex: Optional[str] = None):
         return
 
     progress_bar = tqdm(total=len(scanner.models))
-    writer = FileWriter()
+    writer = FileWriter(skip_unchanged=True)
     for model in models:
         writer.write_scanned_model(model)
         progress_bar.write(f'Discovered model {model.model_name}')
@@ -104,9 +130,67 @@ def scan(filter_reg_ex: Optional[str] = None):
         progress_bar.update()
 
     progress_bar.write(f'Scanned {progress_bar.total} tables')
-
-
-def detect_joins(target_dataset: Optional[str] = None, diff: bool = False, overwrite: bool = False, yes: bool = False):
+    progress_bar.write(f'Files: {writer.report}')
+
+
+def _detect_joins_for_dataset(models: List[PanoModel]) -> Dict[str, List[PanoModelJoin]]:
+    """Detect joins between models of a single dataset. Runs in a worker process."""
+    fdq_models = [FdqModel.parse_obj({**model.to_dict(), 'visibility': ModelVisibility.available}) for model in models]
+
+    return {
+        model_name: [
+            PanoModelJoin.from_dict(
+                {key: value.value if isinstance(value, Enum) else value for key, value in join_dict.items()}
+            )
+            for join_dict in joins
+        ]
+        for model_name, joins in detect_join_for_models(fdq_models).items()
+    }
+
+
+def _verify_detected_joins(
+    model: PanoModel,
+    joins: List[PanoModelJoin],
+    models_by_name: Dict[str, PanoModel],
+    connection: Dict[str, Any],
+    sample_size: int,
+    bar: tqdm,
+) -> List[PanoModelJoin]:
+    """Verify detected joins on sampled data and drop or correct those with wrong relationship."""
+    verified_joins = []
+    for join in joins:
+        join_description = f'{model.model_name} -> {join.to_model}'
+        try:
+            result = verify_join(model, join, models_by_name[join.to_model], connection, sample_size)
+        except Exception as e:
+            # keep the join unverified, so a failing query does not abort verification of other joins
+            bar.write(f'Could not verify join {join_description}: {str(e)}')
+            logger.debug(f'Failed to verify join {join_description}', exc_info=True)
+            verified_joins.append(join)
+            continue
+
+        verified_join = result.verified_join()
+        if verified_join is None:
+            bar.write(f'Dropped join {join_description}: {result}')
+        elif verified_join.relationship != join.relationship:
+            bar.write(f'Changed join {join_description} to {verified_join.relationship}: {result}')
+            verified_joins.append(verified_join)
+        else:
+            bar.write(f'Verified join {join_description}: {result}')
+            verified_joins.append(verified_join)
+
+    return verified_joins
+
+
+def detect_joins(
+    target_dataset: Optional[str] = None,
+    diff: bool = False,
+    overwrite: bool = False,
+    yes: bool = False,
+    verify: bool = False,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    diff_options: Optional[DiffOptions] = None,
+):
     echo_info('Loading local state...')
     local_state = get_local_state(target_dataset=target_dataset)
 
@@ -120,22 +204,43 @@ def detect_joins(target_dataset: Optional[str] = None, diff: bool = False, overw
         models_by_virtual_data_source[model.virtual_data_source][model.model_name] = model
 
     action_list: ActionList[PanoModel] = ActionList()
+    datasets = list(local_state.data_sources)
+    connection = Connection.get() if verify else {}
+
+    # datasets are independent so detect joins for them in parallel, but report results in order
+    with get_pool_executor(len(datasets)) as pool, tqdm(datasets) as bar:
+        futures = [
+            pool.submit(_detect_joins_for_dataset, list(models_by_virtual_data_source[dataset.dataset_slug].values()))
+            for dataset in datasets
+        ]
 
-    with tqdm(list(local_state.data_sources)) as bar:
-        for dataset in bar:
+        for dataset, future in zip(datasets, futures):
             try:
                 bar.write(f'Detecting joins for dataset {dataset.dataset_slug}')
-                joins_by_model = detect_join_for_models([dataset.dataset_slug])
+                joins_by_model = future.result()
 
-                for model_name, joins in joins_by_model.items():
-                    if not joins:
+                for model_name, detected_join_objects in joins_by_model.items():
+                    current_model = models_by_virtual_data_source[dataset.dataset_slug][model_name]
+
+                    if verify:
+                        detected_join_objects = _verify_detected_joins(
+                            current_model,
+                            detected_join_objects,
+                            models_by_virtual_data_source[dataset.dataset_slug],
+                            connection,
+                            sample_size,
+                            bar,
+                        )
+
+                    if not detected_join_objects:
                         bar.write(f'No joins detected for {model_name} under dataset {dataset.dataset_slug}')
                         continue
 
-                    bar.write(f'Detected {len(joins)} joins for {model_name} under dataset {dataset.dataset_slug}')
+                    bar.write(
+                        f'Detected {len(detected_join_objects)} joins for {model_name} '
+                        f'under dataset {dataset.dataset_slug}'
+                    )
 
-                    detected_join_objects = [PanoModelJoin.from_dict(join_dict) for join_dict in joins]
-                    current_model = models_by_virtual_data_source[dataset.dataset_slug][model_name]
                     desired_model = deepcopy(current_model)
 
                     if overwrite:
@@ -162,7 +267,7 @@ def detect_joins(target_dataset: Optional[str] = None, diff: bool = False, overw
         echo_info('No joins detected')
         return
 
-    echo_diff(action_list)
+    echo_diff(action_list, diff_options)
     if diff:
         # User decided to see the diff only
         return
@@ -173,13 +278,15 @@ def detect_joins(target_dataset: Optional[str] = None, diff: bool = False, overw
 
     echo_info('Updating local state...')
 
-    executor = LocalExecutor()
-    for action in action_list.actions:
-        try:
-            executor.execute(action)
-        except Exception:
-            echo_error(f'Error: Failed to execute action {action.description}')
-        echo_info(f'Updated {executor.success_count}/{executor.total_count} models')
+    writer = FileWriter(skip_unchanged=True)
+    executor = LocalExecutor(writer)
+    try:
+        executor.execute_all(action_list.actions)
+    except ExecuteActionsException as e:
+        echo_error(str(e))
+    echo_info(f'Updated {executor.success_count}/{executor.total_count} models')
+    if executor.failure_count == 0:
+        echo_info(f'Files: {writer.report}')
 
 
 def delete_orphaned_fields(target_dataset: Optional[str] = None, yes: bool = False):
@@ -188,15 +295,15 @@ def delete_orphaned_fields(target_dataset: Optional[str] = None, yes: bool = Fal
     state = get_local_state(target_dataset=target_dataset)
 
     action_list: ActionList[PanoField] = ActionList()
+    reference_index = ReferenceIndex.from_state(state)
 
-    for dataset, (fields, models) in state.get_objects_by_package().items():
-        fields_by_slug = {f.slug: f for f in fields}
-        for idx, error in enumerate(validate_orphaned_files(fields, models, package_name=dataset)):
+    for dataset in state.get_objects_by_package():
+        for idx, field in enumerate(reference_index.orphaned_fields(dataset)):
             if idx == 0:
                 echo_info(f'\nFields without calculation or reference in a model in dataset {dataset}:')
-            echo_info(f'  {error.field_slug}')
+            echo_info(f'  {field.slug}')
             # Add deletion action
-            action_list.add_action(Action(current=fields_by_slug[error.field_slug], desired=None))
+            action_list.add_action(Action(current=field, desired=None))
 
     if action_list.is_empty:
         echo_info('No issues found')
@@ -210,23 +317,53 @@ def delete_orphaned_fields(target_dataset: Optional[str] = None, yes: bool = Fal
     echo_info('Updating local state...')
 
     executor = LocalExecutor()
-    for action in action_list.actions:
-        try:
-            executor.execute(action)
-        except Exception:
-            echo_error(f'Error: Failed to execute action {action.description}')
+    try:
+        executor.execute_all(action_list.actions)
+    except ExecuteActionsException as e:
+        echo_error(str(e))
     echo_info(f'Updated {executor.success_count}/{executor.total_count} fields')
 
 
+def field_usages(slug: str, target_dataset: Optional[str] = None):
+    """Show models and calculations of other fields referencing the field."""
+    echo_info('Loading local state...')
+    state = get_local_state(target_dataset=target_dataset)
+
+    calculation_cache = CalculationSlugsCache.load(Paths.calculation_cache_file())
+    reference_index = ReferenceIndex.from_state(state, calculation_cache)
+    model_references, calculation_references = reference_index.usages(slug)
+    calculation_cache.save()
+
+    if len(model_references) == 0 and len(calculation_references) == 0:
+        echo_info(f'Field {slug} is not used by any model or calculation')
+        return
+
+    if len(model_references) > 0:
+        echo_info(f'\nModels mapping field {slug}:')
+        for model_reference in model_references:
+            identifier = ' (identifier)' if model_reference.identifier else ''
+            echo_info(
+                f'  {model_reference.package}/{model_reference.model_name}: '
+                f'{model_reference.data_reference}{identifier}'
+            )
+
+    if len(calculation_references) > 0:
+        echo_info(f'\nFields using field {slug} in calculation:')
+        for calculation_reference in calculation_references:
+            package = f'{calculation_reference.package}/' if calculation_reference.package is not None else ''
+            echo_info(f'  {package}{calculation_reference.field_slug}: {calculation_reference.calculation}')
+
+
 def scaffold_missing_fields(target_dataset: Optional[str] = None, yes: bool = False, no_remote: bool = True):
     """Scaffold missing field files."""
     echo_info('Loading local state...')
     state = get_local_state(target_dataset=target_dataset)
 
     errors = []
+    reference_index = ReferenceIndex.from_state(state)
 
-    for dataset, (fields, models) in state.get_objects_by_package().items():
-        for idx, error in enumerate(validate_missing_files(fields, models, package_name=dataset)):
+    for dataset in state.get_objects_by_package():
+        for idx, error in enumerate(reference_index.missing_field_errors(dataset)):
             if idx == 0:
                 echo_info(f'\nFields referenced in models without definition in dataset {dataset}:')
             echo_info(f'  {error.field_slug}')
@@ -252,9 +389,9 @@ def scaffold_missing_fields(target_dataset: Optional[str] = None, yes: bool = Fa
         scanner_cls = Scanner.get_scanner(query_runtime)
         scanner = scanner_cls()
 
-        echo_info('Scanning remote storage...')
-        scanner.scan()
-        echo_info('Finished scanning remote storage...')
+        echo_info('Fetching data types from remote storage...')
+        scanner.scan_columns(columns_by_model_for_errors(errors))
+        echo_info('Finished fetching data types from remote storage...')
         loaded_models = scanner.models
 
     echo_info('Scanning fields...')
@@ -263,10 +400,12 @@ def scaffold_missing_fields(target_dataset: Optional[str] = None, yes: bool = Fa
 
     echo_info('Updating local state...')
 
-    executor = LocalExecutor()
-    for action in action_list.actions:
-        try:
-            executor.execute(action)
-        except Exception:
-            echo_error(f'Error: Failed to execute action {action.description}')
+    writer = FileWriter(skip_unchanged=True)
+    executor = LocalExecutor(writer)
+    try:
+        executor.execute_all(action_list.actions)
+    except ExecuteActionsException as e:
+        echo_error(str(e))
     echo_info(f'Updated {executor.success_count}/{executor.total_count} fields')
+    if executor.failure_count == 0:
+        echo_info(f'Files: {writer.report}')
@@ -1,5 +1,5 @@
 import logging
-from typing import IO, Any, Dict, Optional, Tuple, cast
+from typing import IO, Any, Dict, List, Optional, Tuple, cast
 
 import yaml
 from sqlalchemy import create_engine, text
@@ -123,11 +123,19 @@ class Connection:
             return create_engine(cls.get_url(connection)).dialect.name
 
     @classmethod
-    def execute(cls, sql: str, connection) -> Any:
+    def execute(cls, sql: str, connection, parameters: Optional[Dict[str, Any]] = None) -> Any:
         engine = cls.get_connection_engine(connection)
 
         with engine.connect() as connection:
-            return connection.execute(text(sql))
+            return connection.execute(text(sql), parameters or {})
+
+    @classmethod
+    def fetch_all(cls, sql: str, connection, parameters: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Execute query and fetch all resulting rows before the connection is closed."""
+        engine = cls.get_connection_engine(connection)
+
+        with engine.connect() as connection:
+            return connection.execute(text(sql), parameters or {}).fetchall()
 
     @classmethod
     def test(cls, connection) -> Tuple[bool, str]:
@@ -1,38 +1,249 @@
-import difflib
+import json
+from collections import Counter, defaultdict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-from panoramic.cli.file_utils import dump_yaml
+from panoramic.cli.file_utils import write_text_atomic
+from panoramic.cli.pano_model import Actionable
 from panoramic.cli.print import Color, echo_info, echo_style
-from panoramic.cli.state import ActionList
+from panoramic.cli.state import Action, ActionList
+
+
+class ChangeType(Enum):
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+    REORDERED = 'reordered'
+
+
+_CHANGE_TYPE_TO_PREFIX = {
+    ChangeType.ADDED: '+',
+    ChangeType.REMOVED: '-',
+    ChangeType.CHANGED: '~',
+    ChangeType.REORDERED: '~',
+}
 
 _LINE_START_TO_COLOR = {
     '+': Color.GREEN,
     '-': Color.RED,
-    '@': Color.BLUE,
+    '~': Color.BLUE,
 }
 
 
-def echo_diff(actions: ActionList):
+class Change:
+    """Single change of a value in the dictionary representation of an object."""
+
+    type: ChangeType
+    path: str
+    old: Any
+    new: Any
+
+    def __init__(self, *, type: ChangeType, path: str, old: Any = None, new: Any = None):
+        self.type = type
+        self.path = path
+        self.old = old
+        self.new = new
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': self.type.value, 'path': self.path, 'old': self.old, 'new': self.new}
+
+    def __repr__(self) -> str:
+        return f'Change({self.to_dict()})'
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, Change):
+            return False
+
+        return self.to_dict() == o.to_dict()
+
+
+class DiffOptions:
+    """Options of printing the difference."""
+
+    summary: bool
+    max_lines: Optional[int]
+    json_path: Optional[Path]
+
+    def __init__(self, *, summary: bool = False, max_lines: Optional[int] = None, json_path: Optional[Path] = None):
+        self.summary = summary
+        self.max_lines = max_lines
+        self.json_path = json_path
+
+
+def _dump_value(value: Any) -> str:
+    """Compact and stable representation of a value."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _diff_lists(current: List[Any], desired: List[Any], path: str, changes: List[Change]):
+    """Compare items of lists regardless of their position, so inserting an item doesn't change all following items."""
+    current_keys = [_dump_value(item) for item in current]
+    desired_keys = [_dump_value(item) for item in desired]
+
+    desired_counts = Counter(desired_keys)
+    removed = []
+    for item, key in zip(current, current_keys):
+        if desired_counts[key] > 0:
+            desired_counts[key] -= 1
+        else:
+            removed.append(item)
+
+    current_counts = Counter(current_keys)
+    added = []
+    for item, key in zip(desired, desired_keys):
+        if current_counts[key] > 0:
+            current_counts[key] -= 1
+        else:
+            added.append(item)
+
+    if len(removed) == 0 and len(added) == 0:
+        changes.append(Change(type=ChangeType.REORDERED, path=path, old=current, new=desired))
+        return
+
+    changes.extend(Change(type=ChangeType.REMOVED, path=f'{path}[]', old=item) for item in removed)
+    changes.extend(Change(type=ChangeType.ADDED, path=f'{path}[]', new=item) for item in added)
+
+
+def _diff_values(current: Any, desired: Any, path: str, changes: List[Change]):
+    if current == desired:
+        return
+
+    if isinstance(current, dict) and isinstance(desired, dict):
+        # keep order of keys from the current object, new keys go last
+        keys = [*current, *(key for key in desired if key not in current)]
+        for key in keys:
+            key_path = f'{path}.{key}' if path else str(key)
+            if key not in desired:
+                changes.append(Change(type=ChangeType.REMOVED, path=key_path, old=current[key]))
+            elif key not in current:
+                changes.append(Change(type=ChangeType.ADDED, path=key_path, new=desired[key]))
+            else:
+                _diff_values(current[key], desired[key], key_path, changes)
+    elif isinstance(current, list) and isinstance(desired, list):
+        _diff_lists(current, desired, path, changes)
+    else:
+        changes.append(Change(type=ChangeType.CHANGED, path=path, old=current, new=desired))
+
+
+def diff_dicts(current: Dict[str, Any], desired: Dict[str, Any]) -> List[Change]:
+    """Structural difference between dictionary representations of an object."""
+    if current == desired:
+        return []
+
+    changes: List[Change] = []
+    _diff_values(current, desired, '', changes)
+    return changes
+
+
+def _action_type(action: Action) -> str:
+    if action.is_deletion:
+        return 'delete'
+    elif action.is_creation:
+        return 'create'
+    else:
+        return 'update'
+
+
+def _action_object(action: Action) -> Actionable:
+    obj = action.desired if action.desired is not None else action.current
+    assert obj is not None
+    return obj
+
+
+def _action_dataset(action: Action) -> str:
+    return _action_object(action).package or ''
+
+
+def _action_changes(action: Action) -> List[Change]:
+    if action.current is None or action.desired is None:
+        return []
+
+    return diff_dicts(action.current.to_dict(), action.desired.to_dict())
+
+
+def _format_change(change: Change) -> str:
+    prefix = _CHANGE_TYPE_TO_PREFIX[change.type]
+    if change.type == ChangeType.ADDED:
+        return f'  {prefix} {change.path}: {_dump_value(change.new)}'
+    elif change.type == ChangeType.REMOVED:
+        return f'  {prefix} {change.path}: {_dump_value(change.old)}'
+    elif change.type == ChangeType.REORDERED:
+        return f'  {prefix} {change.path}: order changed'
+    else:
+        return f'  {prefix} {change.path}: {_dump_value(change.old)} -> {_dump_value(change.new)}'
+
+
+def summarize_actions(actions: ActionList) -> Dict[str, Dict[str, int]]:
+    """Count actions per dataset and action type."""
+    counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {'create': 0, 'update': 0, 'delete': 0})
+    for action in actions.actions:
+        counts[_action_dataset(action)][_action_type(action)] += 1
+
+    return dict(sorted(counts.items()))
+
+
+def diff_to_dict(actions: ActionList) -> Dict[str, Any]:
+    """Machine-readable representation of the difference."""
+    return {
+        'summary': summarize_actions(actions),
+        'actions': [
+            {
+                'type': _action_type(action),
+                'dataset': _action_dataset(action),
+                'id': list(_action_object(action).id),
+                'changes': [change.to_dict() for change in _action_changes(action)],
+            }
+            for action in actions.actions
+        ],
+    }
+
+
+def _summary_lines(actions: ActionList) -> List[Tuple[str, Optional[Color]]]:
+    lines: List[Tuple[str, Optional[Color]]] = [('Summary:', None)]
+    for dataset, counts in summarize_actions(actions).items():
+        counts_str = ', '.join(f'{count} to {action_type}' for action_type, count in counts.items() if count > 0)
+        lines.append((f'  {dataset or "(company-scoped)"}: {counts_str}', None))
+    return lines
+
+
+def _action_lines(actions: ActionList) -> List[Tuple[str, Optional[Color]]]:
+    lines: List[Tuple[str, Optional[Color]]] = []
     for action in actions.actions:
         if action.is_deletion:
-            echo_style(action.description, fg=Color.RED)
+            lines.append((action.description, Color.RED))
         elif action.is_creation:
-            echo_style(action.description, fg=Color.GREEN)
+            lines.append((action.description, Color.GREEN))
         else:
             # Assumes update
-            echo_style(action.description, fg=Color.YELLOW)
+            lines.append((action.description, Color.YELLOW))
+            for change in _action_changes(action):
+                line = _format_change(change)
+                lines.append((line, _LINE_START_TO_COLOR.get(line.lstrip()[0])))
 
-            current_yaml = dump_yaml(action.current.to_dict()) if action.current is not None else ''
-            desired_yaml = dump_yaml(action.desired.to_dict()) if action.desired is not None else ''
+        lines.append(('', None))
 
-            assert current_yaml is not None and desired_yaml is not None
+    return lines
 
-            current_yaml_lines = current_yaml.splitlines(keepends=True)
-            desired_yaml_lines = desired_yaml.splitlines(keepends=True)
 
-            diff = difflib.unified_diff(current_yaml_lines, desired_yaml_lines, fromfile='current', tofile='desired')
+def echo_diff(actions: ActionList, options: Optional[DiffOptions] = None):
+    """Print compact per-key changes of the actions, or only their summary."""
+    if options is None:
+        options = DiffOptions()
 
-            for line in diff:
-                color = _LINE_START_TO_COLOR.get(line[0])
-                echo_style(line, fg=color, nl=False)
+    if options.json_path is not None:
+        write_text_atomic(options.json_path, json.dumps(diff_to_dict(actions), indent=2, default=str))
 
-        echo_info('')
+    lines = _summary_lines(actions) if options.summary else _action_lines(actions)
+
+    if options.max_lines is not None and len(lines) > options.max_lines:
+        hidden_count = len(lines) - options.max_lines
+        lines = lines[: options.max_lines]
+        lines.append((f'... {hidden_count} more lines not shown', None))
+
+    for line, color in lines:
+        if color is None:
+            echo_info(line)
+        else:
+            echo_style(line, fg=color)
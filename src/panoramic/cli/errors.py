@@ -5,7 +5,7 @@ import sys
 from abc import ABC
 from enum import Enum
 from pathlib import Path
-from typing import Callable, ClassVar, List, Optional
+from typing import Callable, ClassVar, List, Optional, Sequence
 
 from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
 from requests.exceptions import RequestException
@@ -57,6 +57,28 @@ class JoinException(CliBaseException):
         super().__init__(f'Joins could not be detected for {dataset_name}')
 
 
+class JoinVerificationException(CliBaseException):
+    """Join cannot be verified on data because its fields are not plain column references."""
+
+    def __init__(self, model_name: str, field_slug: str):
+        super().__init__(f'Field {field_slug} on model {model_name} is not a column reference')
+
+
+class GitStatusException(CliBaseException):
+    """Changed files cannot be listed using git."""
+
+    def __init__(self, message: str):
+        super().__init__(f'Failed to list changed files using git: {message}')
+
+
+class ExecuteActionsException(CliBaseException):
+    """Actions cannot be applied to local files, no file was changed."""
+
+    def __init__(self, errors: List[str]):
+        error_lines = ''.join(f'\n  {error}' for error in errors)
+        super().__init__(f'Failed to update local files, no changes were made:{error_lines}')
+
+
 class RefreshException(CliBaseException):
     """Error refreshing metadata."""
 
@@ -272,15 +294,22 @@ class DeprecatedConfigProperty(ValidationError):
         return str(self) == str(o)
 
 
+class CachedValidationError(ValidationError):
+    """Error found in a file which did not change since the previous validation."""
+
+
 class JsonSchemaError(ValidationError):
-    def __init__(self, *, path: Path, error: JsonSchemaValidationError):
+    def __init__(self, *, path: Path, errors: Sequence[JsonSchemaValidationError]):
         try:
             path = path.relative_to(Path.cwd())
         except ValueError:
             pass  # Use relative path when possible
 
-        error_path = '.'.join(str(p) for p in error.path)
-        super().__init__(f'{error.message}\n  for path {error_path}\n  in {path}')
+        messages = [
+            f'{error.message}\n  for path {".".join(str(p) for p in error.path)}'
+            for error in sorted(errors, key=lambda e: [str(p) for p in e.path])
+        ]
+        super().__init__('\n'.join(messages) + f'\n  in {path}')
 
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, JsonSchemaError):
@@ -289,6 +318,25 @@ class JsonSchemaError(ValidationError):
         return str(self) == str(o)
 
 
+class TelValidationError(ValidationError):
+    """Invalid TEL expression in a field calculation or a model data reference."""
+
+    def __init__(self, *, path: Path, subject: str, errors: Sequence[str]):
+        try:
+            path = path.relative_to(Path.cwd())
+        except ValueError:
+            pass  # Use relative path when possible
+
+        messages = [f'{error}\n  for {subject}' for error in sorted(errors)]
+        super().__init__('\n'.join(messages) + f'\n  in {path}')
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, TelValidationError):
+            return False
+
+        return str(self) == str(o)
+
+
 class OrphanFieldFileError(ValidationError):
     severity = ValidationErrorSeverity.WARNING
     field_slug: str
@@ -410,6 +458,27 @@ class TransformCompileException(CliBaseException):
         super().__init__(f'Error compiling transform {transform_name}')
 
 
+class InvalidTransformMaterialization(CliBaseException):
+    """Materialization of a Transform is not configured correctly."""
+
+    def __init__(self, transform_name: str, message: str):
+        super().__init__(f'Invalid materialization of transform {transform_name}: {message}')
+
+
+class InvalidTransformVerification(CliBaseException):
+    """Verification of a Transform is not supported."""
+
+    def __init__(self, transform_name: str, message: str):
+        super().__init__(f'Invalid verification of transform {transform_name}: {message}')
+
+
+class TransformVerificationFailed(Exception):
+    """Target of a Transform does not have the expected columns."""
+
+    def __init__(self, transform_name: str, missing_columns: List[str]):
+        super().__init__(f'Target of transform {transform_name} is missing columns {", ".join(missing_columns)}')
+
+
 class TransformExecutionFailed(Exception):
     """Failed to execute a transform on the remote connection"""
 
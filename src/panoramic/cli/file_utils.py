@@ -1,5 +1,8 @@
+import hashlib
 import json
 import logging
+import os
+import uuid
 from pathlib import Path
 from typing import IO, Any, Dict, List, Optional, Union
 
@@ -31,14 +34,68 @@ def ensure_dir(abs_filepath: Path):
     path_obj.mkdir(parents=True, exist_ok=True)
 
 
+def write_text_atomic(abs_filepath: Path, text: str):
+    """
+    Writes text to path through a temporary file that is renamed over the target,
+    so readers never observe a partially written file.
+    """
+    ensure_dir(abs_filepath)
+    tmp_filepath = abs_filepath.with_name(f'.{abs_filepath.name}.{uuid.uuid4().hex}.tmp')
+    try:
+        with open(tmp_filepath, 'w') as f:
+            f.write(text)
+        os.replace(tmp_filepath, abs_filepath)
+    except BaseException:
+        if tmp_filepath.exists():
+            tmp_filepath.unlink()
+        raise
+
+
+def content_hash(data: bytes) -> str:
+    """Hash of file content used to detect unchanged files."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_has_content(abs_filepath: Path, data: bytes) -> bool:
+    """
+    Check whether file exists and has the given content.
+    """
+    try:
+        with open(abs_filepath, 'r') as f:
+            current_data = f.read().encode('utf-8')
+    except (FileNotFoundError, UnicodeDecodeError):
+        return False
+
+    return content_hash(current_data) == content_hash(data)
+
+
 def write_yaml(abs_filepath: Path, yaml_data: Any):
     """
     Writes yaml dict to path
     """
     logger.debug(f'Write yaml {abs_filepath}')
-    ensure_dir(abs_filepath)
-    with open(abs_filepath, 'w') as f:
-        dump_yaml(yaml_data, f)
+    text = dump_yaml(yaml_data)
+    assert text is not None
+    write_text_atomic(abs_filepath, text)
+
+
+def write_yaml_if_changed(abs_filepath: Path, yaml_data: Any) -> Optional[int]:
+    """
+    Writes yaml dict to path unless the file already has identical content.
+
+    Returns number of bytes written or None when the write was skipped.
+    """
+    text = dump_yaml(yaml_data)
+    assert text is not None
+    data = text.encode('utf-8')
+
+    if file_has_content(abs_filepath, data):
+        logger.debug(f'Skip unchanged yaml {abs_filepath}')
+        return None
+
+    logger.debug(f'Write yaml {abs_filepath}')
+    write_text_atomic(abs_filepath, text)
+    return len(data)
 
 
 def read_yaml(path: Path) -> Dict[str, Any]:
@@ -1,11 +1,12 @@
+from typing import List, Sequence
+
 from sqlalchemy import Date, String, literal, literal_column, not_
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql import ColumnElement, FromClause
 from sqlalchemy.sql.compiler import SQLCompiler
-from sqlalchemy.sql.elements import BindParameter, TextClause
+from sqlalchemy.sql.elements import BindParameter, ColumnClause, TextClause
 from sqlalchemy.sql.expression import FunctionElement, cast
 
-from panoramic.cli.husky.core.sql_alchemy_util import get_unique_bind_param_name
 from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
 
 
@@ -29,30 +30,14 @@ class MyTextClause(TextClause):
     """
     Improved TextClause class. It generates unique binding names for all the bindings.
     Fix for https://stackoverflow.com/questions/58203712/sqlalchemy-conflicting-bind-param-names
+
+    Bindings are anonymous, so the compiler names them by their position in the compiled query. Names are therefore
+    unique in any composed query and the same query always compiles to the same SQL.
     """
 
     def __init__(self, text, bind=None):
-        self._bind = bind
-        self._bindparams = {}
-        self._original_to_unique_param_map = {}
-
-        def repl(m):
-            original = m.group(1)
-            unique = get_unique_bind_param_name(m.group(1))
-            self._original_to_unique_param_map[original] = unique
-            self._bindparams[m.group(1)] = BindParameter(unique)
-            return ":%s" % unique
-
-        # scan the string and search for bind parameter names, add them
-        # to the list of bindparams
-        text_unique_params = self._bind_params_regex.sub(repl, text)
-        super().__init__(text_unique_params, bind)
-
-    def bindparams(self, *binds, **orig_names_to_values):
-        unique_names_to_values = {
-            self._original_to_unique_param_map[key]: value for key, value in orig_names_to_values.items()
-        }
-        return super().bindparams(*binds, **unique_names_to_values)
+        super().__init__(text, bind)
+        self._bindparams = {name: BindParameter(name, unique=True) for name in self._bindparams}
 
 
 my_sql_text = MyTextClause
@@ -232,3 +217,42 @@ def compile_extract_bigquery(element: Extract, compiler: SQLCompiler, **kw):
         compiler.process(literal_column('DAYOFWEEK' if element.part == 'DOW' else element.part), **kw),
         compiler.process(element.expr, **kw),
     )
+
+
+class Values(FromClause):
+    """
+    Inline table given by list of rows, rendered as VALUES list with named columns.
+    All columns are of type string.
+    """
+
+    named_with_column = True
+
+    def __init__(self, name: str, column_names: Sequence[str], rows: Sequence[Sequence[ColumnElement]]):
+        self.name = name
+        self.column_names = list(column_names)
+        self.rows = [list(row) for row in rows]
+
+    def _populate_column_collection(self):
+        for column_name in self.column_names:
+            self._columns[column_name] = ColumnClause(column_name, type_=String(), _selectable=self)
+
+    def _copy_internals(self, clone=None, **kw):
+        self.rows = [[clone(value, **kw) for value in row] for row in self.rows]
+
+    def get_children(self, **kwargs) -> List[ColumnElement]:
+        return [value for row in self.rows for value in row]
+
+    @property
+    def _from_objects(self) -> List[FromClause]:
+        return [self]
+
+
+@compiles(Values, HuskyQueryRuntime.snowflake.value)
+@compiles(Values, HuskyQueryRuntime.postgres.value)
+def compile_values(element: Values, compiler: SQLCompiler, **kw):
+    rows = ', '.join('(%s)' % ', '.join(compiler.process(value, **kw) for value in row) for row in element.rows)
+    return "(VALUES %s) AS %s (%s)" % (
+        rows,
+        compiler.preparer.quote(element.name),
+        ', '.join(compiler.preparer.quote(column_name) for column_name in element.column_names),
+    )
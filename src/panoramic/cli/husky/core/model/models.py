@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from schematics.types import BooleanType, DictType, ListType, ModelType, StringType
 
@@ -28,6 +28,7 @@ from panoramic.cli.husky.service.context import (
     SNOWFLAKE_HUSKY_CONTEXT,
     HuskyQueryContext,
 )
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
 
 
 class ModelAttribute(SchematicsModel):
@@ -310,6 +311,15 @@ class HuskyModel(SchematicsModel):
         """
         return {attr.taxon_memoized: attr for attr in self.attributes_memoized.values()}
 
+    @memoized_property
+    def sql_accessors_memoized(self) -> Dict[Tuple[str, HuskyQueryRuntime, str], str]:
+        """
+        Note the memoized property. It is cached on the instance after the first access.
+        Compiled SQL accessors of taxons, keyed by taxon slug, query runtime and unique object name of the model.
+        :return:
+        """
+        return {}
+
     @memoized_property
     def joins_memoized(self):
         """
@@ -340,20 +350,21 @@ class HuskyModel(SchematicsModel):
         """
         attribute = self.get_attribute_by_taxon(taxon_slug)
 
-        # let TEL grammar to render the SQL transformation
-        # on purpose, we dont use 'column' variable here, because we dont really rely on column_name attribute here
-        tel_dialect = model_tel_dialect
-        if tel_dialect is None:
-            # no initialized tel visitor is provided so create a generic one
-            tel_dialect = ModelTelDialect(
-                unique_object_name=self.unique_object_name(ctx),
-                virtual_data_source=self.data_sources[0],
-                model=self,
-            )
-
-        # render the TEL transformation
-        parsed_expression = tel_dialect.render(attribute.tel_transformation, ctx, {})
-        sql_accessor = compile_query(parsed_expression.sql(ctx.dialect), ctx.dialect)
+        if model_tel_dialect is None:
+            # accessor depends only on the attribute, dialect and table alias, so it is rendered only once
+            cache_key = (taxon_slug, ctx.query_runtime, self.unique_object_name(ctx))
+            sql_accessor = self.sql_accessors_memoized.get(cache_key)
+            if sql_accessor is None:
+                # no initialized tel visitor is provided so create a generic one
+                tel_dialect = ModelTelDialect(
+                    unique_object_name=self.unique_object_name(ctx),
+                    virtual_data_source=self.data_sources[0],
+                    model=self,
+                )
+                sql_accessor = self._render_sql_accessor(ctx, attribute, tel_dialect)
+                self.sql_accessors_memoized[cache_key] = sql_accessor
+        else:
+            sql_accessor = self._render_sql_accessor(ctx, attribute, model_tel_dialect)
 
         # we cast arrays to varchar, if requested
         if cast_array and attribute.quantity_type is ValueQuantityType.array:
@@ -361,6 +372,13 @@ class HuskyModel(SchematicsModel):
 
         return sql_accessor
 
+    @staticmethod
+    def _render_sql_accessor(ctx: HuskyQueryContext, attribute: ModelAttribute, tel_dialect: ModelTelDialect) -> str:
+        # let TEL grammar to render the SQL transformation
+        # on purpose, we dont use 'column' variable here, because we dont really rely on column_name attribute here
+        parsed_expression = tel_dialect.render(attribute.tel_transformation, ctx, {})
+        return compile_query(parsed_expression.sql(ctx.dialect), ctx.dialect)
+
     def __hash__(self):
         return hash(self.unique_object_name(SNOWFLAKE_HUSKY_CONTEXT))
 
@@ -1,6 +1,7 @@
-import random
+import copy
+import functools
 import re
-from typing import Dict, Iterable, List, Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 from sqlalchemy import distinct, func
 from sqlalchemy.engine import default
@@ -18,18 +19,6 @@ _SAFE_IDENTIFIER_HASH_SIZE = 18
 """Length of unique hash appended to safe identifiers"""
 
 
-def _random_bind_param_prefix():
-    return str(random.randint(1, 1000000)) + '_'
-
-
-def get_unique_bind_param_name(param_name: str):
-    """
-    Generating random prefix for filters, to ensure they are globally unique in any composed query.
-    https://stackoverflow.com/questions/58203712/sqlalchemy-conflicting-bind-param-names
-    """
-    return f'{_random_bind_param_prefix()}{param_name}'
-
-
 def sort_columns(selectors: List[Union[str, ColumnElement]]) -> List[Union[str, ColumnElement]]:
     """
     Alphabetically sorts the selectors, so writing tests is a bit easier.
@@ -63,6 +52,29 @@ def compile_query(
         return clause
 
 
+@functools.lru_cache()
+def _named_paramstyle_dialect(dialect: default.DefaultDialect) -> default.DefaultDialect:
+    named_dialect = copy.copy(dialect)
+    named_dialect.paramstyle = 'named'
+    named_dialect.positional = False
+    return named_dialect
+
+
+def compile_query_with_params(
+    clause: ClauseElement,
+    dialect: default.DefaultDialect = RUNTIME_DIALECTS[HuskyQueryRuntime.snowflake],
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Compile the query without inlining values of bind parameters.
+
+    Parameters are rendered in named style (:name) regardless of the dialect, so the query can be executed
+    as text with the returned parameters passed separately. Queries differing only in values then share one
+    statement, which lets the warehouse reuse its plan.
+    """
+    compiled = clause.compile(dialect=_named_paramstyle_dialect(dialect))
+    return str(compiled), compiled.params
+
+
 def quote_identifier(value, dialect: default.DefaultDialect):
     """Conditionally quote an identifier.
 
@@ -27,7 +27,7 @@ from panoramic.cli.husky.core.tel.result import (
 )
 from panoramic.cli.husky.core.tel.tel import Tel
 from panoramic.cli.husky.core.tel.tel_dialect import TaxonTelDialect, TelDialect
-from panoramic.cli.husky.core.virtual_state.mappers import VirtualStateMapper
+from panoramic.cli.husky.core.virtual_state.mappers import FieldMapper
 from panoramic.cli.husky.service.context import SNOWFLAKE_HUSKY_CONTEXT
 from panoramic.cli.husky.service.utils.taxon_slug_expression import (
     TaxonExpressionStr,
@@ -35,6 +35,7 @@ from panoramic.cli.husky.service.utils.taxon_slug_expression import (
     TaxonSlugExpression,
 )
 from panoramic.cli.local import get_state
+from panoramic.cli.state import VirtualState
 
 
 class Taxonomy:
@@ -47,13 +48,12 @@ class Taxonomy:
         cls._all_taxons = taxons
 
     @classmethod
-    def preload_taxons_from_state(cls):
-        """Preloads taxons from internal state"""
-        # get virtual state
-        state = get_state()
-        # map it to internal state
-        internal_state = VirtualStateMapper.to_husky(state)
-        cls._all_taxons = internal_state.taxons
+    def preload_taxons_from_state(cls, state: Optional[VirtualState] = None):
+        """Preloads taxons from given virtual state, loading local state when not given"""
+        if state is None:
+            state = get_state()
+        # map fields to internal taxons
+        cls._all_taxons = [FieldMapper.to_husky(field) for field in state.fields]
 
     @classmethod
     def precalculate_tel_metadata(cls):
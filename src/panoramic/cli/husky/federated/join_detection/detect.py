@@ -1,7 +1,7 @@
 import logging
 from collections import defaultdict
 from itertools import combinations
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
 
 from panoramic.cli.husky.core.federated.model.models import (
     FdqModel,
@@ -13,18 +13,53 @@ from panoramic.cli.husky.core.model.enums import JoinType
 logger = logging.getLogger(__name__)
 
 
+def _find_related_model_pairs(identifier_sets: List[Set[str]]) -> List[Tuple[int, int]]:
+    """
+    Find pairs of model indices whose identifier sets are equal or one is a subset of the other.
+
+    Models are grouped by their identifier sets and an inverted index from identifier to identifier sets
+    is used to look up supersets, so models are never compared pairwise.
+    """
+    model_indices_by_ids: Dict[FrozenSet[str], List[int]] = defaultdict(list)
+    for idx, identifier_set in enumerate(identifier_sets):
+        if len(identifier_set) > 0:
+            model_indices_by_ids[frozenset(identifier_set)].append(idx)
+
+    ids_by_identifier: Dict[str, Set[FrozenSet[str]]] = defaultdict(set)
+    for ids in model_indices_by_ids:
+        for identifier in ids:
+            ids_by_identifier[identifier].add(ids)
+
+    pairs: List[Tuple[int, int]] = []
+    for ids, model_indices in model_indices_by_ids.items():
+        # models with equal identifiers
+        pairs.extend(combinations(model_indices, 2))
+
+        # models with identifiers which are superset of these identifiers
+        candidates = sorted((ids_by_identifier[identifier] for identifier in ids), key=len)
+        superset_ids = candidates[0].intersection(*candidates[1:])
+        superset_ids.discard(ids)
+
+        for another_ids in superset_ids:
+            for idx in model_indices:
+                for another_idx in model_indices_by_ids[another_ids]:
+                    pairs.append((idx, another_idx) if idx < another_idx else (another_idx, idx))
+
+    # keep the order in which models would be compared pairwise
+    return sorted(pairs)
+
+
 def detect_joins(models: List[FdqModel]) -> Dict[str, List[Dict[str, Any]]]:
     joins = defaultdict(list)
 
-    for _, (model, another_model) in enumerate(combinations(models, 2)):
-        left_ids, right_ids = set(model.identifiers), set(another_model.identifiers)
-
-        if len(left_ids) == 0:
+    identifier_sets = [set(model.identifiers) for model in models]
+    for model, ids in zip(models, identifier_sets):
+        if len(ids) == 0:
             logger.warning(f'Model {model.model_name} has no ids defined')
-            continue
-        if len(right_ids) == 0:
-            logger.warning(f'Model {model.model_name} has no ids defined')
-            continue
+
+    for idx, another_idx in _find_related_model_pairs(identifier_sets):
+        model, another_model = models[idx], models[another_idx]
+        left_ids, right_ids = identifier_sets[idx], identifier_sets[another_idx]
 
         if left_ids == right_ids:
             logger.info(f'Found possible join: one {model.model_name} to one {another_model.model_name}')
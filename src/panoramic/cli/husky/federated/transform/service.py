@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Dict, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from sqlalchemy import literal_column, select
 from sqlalchemy.sql import ClauseElement
@@ -10,10 +10,14 @@ from panoramic.cli.husky.core.federated.transform.models import TransformRequest
 from panoramic.cli.husky.core.sql_alchemy_util import (
     UNSAFE_IDENTIFIER_CHARS_REGEXP,
     compile_query,
+    compile_query_with_params,
     safe_quote_identifier,
 )
 from panoramic.cli.husky.core.taxonomy.getters import fetch_all_used_taxons_map
 from panoramic.cli.husky.federated.transform.exceptions import UnsupportedDialectError
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
 from panoramic.cli.husky.service.blending.query_builder import QueryBuilder
 from panoramic.cli.husky.service.context import HuskyQueryContext
 from panoramic.cli.husky.service.types.api_data_request_types import (
@@ -29,17 +33,21 @@ class TransformService:
     """Service layer for Federated Transform API"""
 
     @classmethod
-    def _correct_column_aliases(cls, query_context: HuskyQueryContext, df: Dataframe) -> ClauseElement:
+    def output_column_names(cls, query_runtime: HuskyQueryRuntime, slugs: Iterable[str]) -> Dict[str, str]:
+        """
+        Names of columns in output of the transform for given field slugs, keyed by the slug
+
+        :param query_runtime: Runtime the transform is compiled for
+        :param slugs: Field slugs in order of the output columns
+        """
         used_column_names: Dict[str, int] = defaultdict(int)
-        mapping: Dict[str, str] = {}
+        column_names: Dict[str, str] = {}
 
-        if query_context.query_runtime is HuskyQueryRuntime.snowflake:
+        if query_runtime is HuskyQueryRuntime.snowflake:
             # for SF query runtime, we can output everything "as-is"
-            mapping = {
-                safe_quote_identifier(slug_name, query_context.dialect): slug_name for slug_name in df.slug_to_column
-            }
-        elif query_context.query_runtime is HuskyQueryRuntime.bigquery:
-            for slug_name in df.slug_to_column:
+            column_names = {slug_name: slug_name for slug_name in slugs}
+        elif query_runtime is HuskyQueryRuntime.bigquery:
+            for slug_name in slugs:
                 new_column_name = UNSAFE_IDENTIFIER_CHARS_REGEXP.sub('_', slug_name)
                 # cannot start with number
                 if new_column_name[0].isdigit():
@@ -53,25 +61,63 @@ class TransformService:
                     correct_column_name = new_column_name
 
                 used_column_names[correct_column_name] += 1
-                mapping[safe_quote_identifier(slug_name, query_context.dialect)] = correct_column_name
+                column_names[slug_name] = correct_column_name
         else:
             # unsupported dialect
-            raise UnsupportedDialectError(query_context.query_runtime.value)
+            raise UnsupportedDialectError(query_runtime.value)
+
+        return column_names
+
+    @classmethod
+    def _correct_column_aliases(cls, query_context: HuskyQueryContext, df: Dataframe) -> ClauseElement:
+        mapping = {
+            safe_quote_identifier(slug_name, query_context.dialect): column_name
+            for slug_name, column_name in cls.output_column_names(
+                query_context.query_runtime, df.slug_to_column
+            ).items()
+        }
 
         query = select([literal_column(slug).label(label) for slug, label in mapping.items()]).select_from(df.query)
 
         return query
 
     @classmethod
-    def compile_transformation_request(cls, req: TransformRequest, company_id: str) -> Tuple[str, HuskyQueryRuntime]:
+    def compile_transformation_request(
+        cls, req: TransformRequest, company_id: str, override_mapping_stage: Optional[OverrideMappingStage] = None
+    ) -> Tuple[str, HuskyQueryRuntime]:
         """
         Compiles Transform request to its SQL representation
 
         :param req: Input request
         :param company_id: Company ID
+        :param override_mapping_stage: Stage for large override mappings, loaded before the SQL is executed
 
         :return: SQL and type of dialect
         """
+        query, context = cls._build_transformation_query(req, company_id, override_mapping_stage)
+        return compile_query(query, context.dialect), context.query_runtime
+
+    @classmethod
+    def compile_parameterized_transformation_request(
+        cls, req: TransformRequest, company_id: str, override_mapping_stage: Optional[OverrideMappingStage] = None
+    ) -> Tuple[str, str, Dict[str, Any], HuskyQueryRuntime]:
+        """
+        Compiles Transform request to its SQL representation, both with values inlined and with bind parameters
+
+        :param req: Input request
+        :param company_id: Company ID
+        :param override_mapping_stage: Stage for large override mappings, loaded before the SQL is executed
+
+        :return: SQL with inlined values, SQL with bind parameters, values of the parameters and type of dialect
+        """
+        query, context = cls._build_transformation_query(req, company_id, override_mapping_stage)
+        parameterized_sql, parameters = compile_query_with_params(query, context.dialect)
+        return compile_query(query, context.dialect), parameterized_sql, parameters, context.query_runtime
+
+    @classmethod
+    def _build_transformation_query(
+        cls, req: TransformRequest, company_id: str, override_mapping_stage: Optional[OverrideMappingStage] = None
+    ) -> Tuple[ClauseElement, HuskyQueryContext]:
         sorted_fields = sorted(req.requested_fields)
         # prepare origin description
         origin = DataRequestOrigin(
@@ -106,11 +152,11 @@ class TransformService:
 
         query_runtime_name = Connection.get_dialect_name(connection)
         query_runtime = EnumHelper.from_value_safe(HuskyQueryRuntime, query_runtime_name)
-        context = HuskyQueryContext(query_runtime)
+        context = HuskyQueryContext(query_runtime, override_mapping_stage)
 
         husky_dataframe = QueryBuilder.validate_data_request(context, husky_request)
 
         # add another layer of query to use correct names
         final_query = cls._correct_column_aliases(context, husky_dataframe)
 
-        return compile_query(final_query, context.dialect), context.query_runtime
+        return final_query, context
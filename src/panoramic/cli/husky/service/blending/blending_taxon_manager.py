@@ -16,6 +16,7 @@ from panoramic.cli.husky.core.taxonomy.override_mapping.models import OverrideMa
 from panoramic.cli.husky.core.taxonomy.override_mapping.types import OverrideMappingSlug
 from panoramic.cli.husky.core.tel.exceptions import TelExpressionException
 from panoramic.cli.husky.service.blending.exceptions import InvalidComparisonRequest
+from panoramic.cli.husky.service.blending.filter_pushdown import push_down_filters
 from panoramic.cli.husky.service.blending.tel_planner import TelPlan, TelPlanner
 from panoramic.cli.husky.service.constants import TaxonSlugs
 from panoramic.cli.husky.service.context import HuskyQueryContext
@@ -302,6 +303,9 @@ class BlendingTaxonManager:
         self.taxon_map = taxons_map
         self._validate_grouping_sets_taxons()
 
+        # Plan filters of subrequests including the filters pushed down from post aggregation filters
+        push_down_filters(self._request, self.taxon_map)
+
         self.plan = TelPlanner.plan(ctx, self._request, self.get_projection_taxons(), self.taxon_map, self.taxon_to_ds)
 
     def get_used_raw_taxons(self) -> TaxonMap:
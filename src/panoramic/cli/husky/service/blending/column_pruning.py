@@ -0,0 +1,256 @@
+import re
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy.sql import ClauseElement, Select
+from sqlalchemy.sql.elements import ColumnClause, Label, TextClause, _anonymous_label
+from sqlalchemy.sql.selectable import CTE, Alias, Join, SelectBase
+from sqlalchemy.sql.visitors import replacement_traverse
+
+_IDENTIFIER = r'(?:[A-Za-z_][A-Za-z0-9_$]*|"[^"]+"|`[^`]+`)'
+_QUALIFIED_IDENTIFIER_REGEXP = re.compile(rf'^((?:{_IDENTIFIER}\.)*)({_IDENTIFIER})$')
+"""Literal column referencing a column, optionally qualified by name of the table"""
+
+_CONSTANT_REGEXP = re.compile(r"^(?:'[^']*'|-?[0-9]+(?:\.[0-9]+)?|NULL|TRUE|FALSE)$", re.IGNORECASE)
+"""Literal column not referencing any column"""
+
+
+class _OpaqueSql(Exception):
+    """Raised when it is not possible to tell which columns the SQL uses."""
+
+
+def _literal_column_name(name: str, unqualified_only: bool = False) -> Optional[str]:
+    match = _QUALIFIED_IDENTIFIER_REGEXP.match(name.strip())
+    if match:
+        if unqualified_only and match.group(1):
+            return None
+        return match.group(2).strip('"`')
+    if _CONSTANT_REGEXP.match(name.strip()):
+        return None
+
+    raise _OpaqueSql()
+
+
+def _select_from_subquery(from_: ClauseElement) -> Optional[Select]:
+    """Returns select of a subquery used as FROM clause, if its columns can be pruned."""
+    if isinstance(from_, CTE):
+        # CTEs can be referenced from multiple places under different aliases, they are never pruned
+        return None
+    if isinstance(from_, Alias):
+        from_ = from_.element
+
+    return from_ if isinstance(from_, Select) else None
+
+
+def _join_conditions(from_: ClauseElement) -> Iterable[ClauseElement]:
+    if isinstance(from_, Join):
+        yield from _join_conditions(from_.left)
+        yield from _join_conditions(from_.right)
+        yield from_.onclause
+
+
+def _joined_froms(from_: ClauseElement) -> Iterable[ClauseElement]:
+    if isinstance(from_, Join):
+        yield from _joined_froms(from_.left)
+        yield from _joined_froms(from_.right)
+    else:
+        yield from_
+
+
+class _ColumnRequirements:
+    """
+    Names of columns required from each select in the query.
+
+    Select without entry, or with None, keeps all its columns.
+    """
+
+    def __init__(self):
+        self.required_by_id: Dict[int, Optional[Set[str]]] = {}
+
+    def _require(self, select: Select, names: Optional[Set[str]]):
+        if id(select) in self.required_by_id:
+            required = self.required_by_id[id(select)]
+            if required is None:
+                return
+            if names is not None and names <= required:
+                return
+            names = None if names is None else required | names
+
+        self.required_by_id[id(select)] = names
+        self._visit(select, names)
+
+    def _keep_all_in(self, elements: Iterable[ClauseElement]):
+        """Keep all columns of selects nested in the elements, e.g. in scalar subqueries."""
+        for element in elements:
+            if element is None:
+                continue
+            stack = [element]
+            while stack:
+                current = stack.pop()
+                if isinstance(current, Select):
+                    self._require(current, None)
+                elif not isinstance(current, CTE):
+                    stack.extend(current.get_children(column_collections=False))
+
+    @staticmethod
+    def _referenced_names(elements: Iterable[Optional[ClauseElement]], unqualified_only: bool = False) -> Set[str]:
+        """
+        Names of all columns referenced in the elements. Raises _OpaqueSql if some of them are not known.
+
+        :param unqualified_only: Skip columns qualified by table name, e.g. when looking for references to labels
+        """
+        names: Set[str] = set()
+        stack = [element for element in elements if element is not None]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, TextClause):
+                raise _OpaqueSql()
+            elif isinstance(current, ColumnClause):
+                if current.is_literal:
+                    name = _literal_column_name(current.name, unqualified_only)
+                else:
+                    name = None if unqualified_only and current.table is not None else current.name
+                if name is not None:
+                    names.add(name)
+            elif isinstance(current, (SelectBase, CTE)):
+                # nested subqueries are kept as they are
+                continue
+            else:
+                stack.extend(current.get_children(column_collections=False))
+        return names
+
+    def _visit(self, select: Select, required: Optional[Set[str]]):
+        clauses = [select._whereclause, select._having, *select._group_by_clause, *select._order_by_clause]
+        columns = list(select.inner_columns)
+        froms = [joined_from for from_ in select.froms for joined_from in _joined_froms(from_)]
+        subqueries = [subquery for subquery in map(_select_from_subquery, froms) if subquery is not None]
+        join_conditions = [condition for from_ in select.froms for condition in _join_conditions(from_)]
+
+        self._keep_all_in([*columns, *clauses, *join_conditions])
+
+        if required is not None and not select._distinct:
+            try:
+                # clauses of the select (e.g. order by) can reference labels of its own columns
+                labels = {column.name for column in columns if _is_expression_label(column)}
+                required = required | (self._referenced_names(clauses, unqualified_only=True) & labels)
+                columns = [column for column in columns if _is_kept(column, required)]
+            except _OpaqueSql:
+                required = None
+            self.required_by_id[id(select)] = required
+
+        used_names: Optional[Set[str]]
+        try:
+            used_names = self._referenced_names([*columns, *clauses, *join_conditions])
+        except _OpaqueSql:
+            used_names = None
+
+        for subquery in subqueries:
+            self._require(subquery, used_names)
+
+    def collect(self, query: ClauseElement):
+        if isinstance(query, Select):
+            self._require(query, None)
+        else:
+            # e.g. compound select, all its columns are needed
+            self._keep_all_in([query])
+
+
+def _is_expression_label(column: ClauseElement) -> bool:
+    """Label of an expression, not just of a column with the same name"""
+    if not isinstance(column, Label):
+        return False
+    element = column.element
+    return not (isinstance(element, ColumnClause) and not element.is_literal and element.name == column.name)
+
+
+def _is_kept(column: ClauseElement, required: Set[str]) -> bool:
+    """Columns without a known name (e.g. raw SQL text) are always kept."""
+    if isinstance(column, Label):
+        name: Optional[str] = column.name
+    elif isinstance(column, ColumnClause):
+        try:
+            name = _literal_column_name(column.name) if column.is_literal else column.name
+        except _OpaqueSql:
+            name = None
+    else:
+        name = None
+
+    return name is None or isinstance(name, _anonymous_label) or name in required
+
+
+class _Pruner:
+    """Clones the query, replacing selects (and their aliases) by selects with only the required columns."""
+
+    def __init__(self, requirements: _ColumnRequirements):
+        self._requirements = requirements
+        self._replacements: Dict[int, ClauseElement] = {}
+        self._replaced_columns: Dict[int, ClauseElement] = {}
+        self._cloned_select_id: Optional[int] = None
+
+    def _is_pruned(self, select: ClauseElement) -> bool:
+        return (
+            isinstance(select, Select)
+            and id(select) != self._cloned_select_id
+            and self._requirements.required_by_id.get(id(select)) is not None
+            and not select._distinct
+        )
+
+    def _map_columns(self, selectable: ClauseElement, pruned_selectable: ClauseElement):
+        for column in selectable.columns:
+            if column.key in pruned_selectable.columns:
+                self._replaced_columns[id(column)] = pruned_selectable.columns[column.key]
+
+    def _pruned_select(self, select: Select) -> Select:
+        required = self._requirements.required_by_id[id(select)]
+        assert required is not None
+
+        # clone the select first, so subqueries within it are pruned as well
+        previous_cloned_select_id, self._cloned_select_id = self._cloned_select_id, id(select)
+        cloned_select = replacement_traverse(select, {}, self.replace)
+        self._cloned_select_id = previous_cloned_select_id
+
+        columns = list(select.inner_columns)
+        kept_columns = [
+            cloned_column
+            for column, cloned_column in zip(columns, cloned_select.inner_columns)
+            if _is_kept(column, required)
+        ]
+        if len(kept_columns) == 0:
+            # select needs at least one column
+            kept_columns = list(cloned_select.inner_columns)[:1]
+
+        # keep all froms, even those referenced only by removed columns
+        return cloned_select.with_only_columns(kept_columns).select_from(*cloned_select.froms)
+
+    def replace(self, element: ClauseElement) -> Optional[ClauseElement]:
+        if id(element) in self._replacements:
+            return self._replacements[id(element)]
+        if id(element) in self._replaced_columns:
+            return self._replaced_columns[id(element)]
+        if isinstance(element, CTE):
+            # keep existing CTEs, so all their references stay the same object
+            return element
+
+        replacement: Optional[ClauseElement] = None
+        if isinstance(element, Alias) and self._is_pruned(element.element):
+            replacement = self._pruned_select(element.element).alias(element.name)
+        elif self._is_pruned(element):
+            replacement = self._pruned_select(element)
+
+        if replacement is not None:
+            self._replacements[id(element)] = replacement
+            self._map_columns(element, replacement)
+        return replacement
+
+
+def prune_columns(query: ClauseElement) -> ClauseElement:
+    """
+    Removes columns from nested selects that are not used by any select above them.
+
+    Each phase of the blended query selects all columns of the previous phase, so helper columns flow up through
+    every layer, even when they are consumed right away. Columns are removed only when it is known which columns
+    the outer select uses. Selects using raw SQL text, distinct selects, compound selects and CTEs keep all columns.
+    """
+    requirements = _ColumnRequirements()
+    requirements.collect(query)
+
+    return replacement_traverse(query, {}, _Pruner(requirements).replace)
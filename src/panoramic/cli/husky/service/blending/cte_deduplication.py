@@ -0,0 +1,127 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy.sql import ClauseElement, Select
+from sqlalchemy.sql.elements import ColumnClause
+from sqlalchemy.sql.selectable import CTE, Alias, Join, SelectBase
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from panoramic.cli.husky.core.sql_alchemy_util import compile_query, safe_identifier
+from panoramic.cli.husky.service.context import HuskyQueryContext
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
+
+CTE_DEDUPLICATION_RUNTIMES = {HuskyQueryRuntime.snowflake, HuskyQueryRuntime.bigquery, HuskyQueryRuntime.postgres}
+"""
+Runtimes where repeated subqueries are hoisted into CTEs.
+MySQL is left out, since CTEs are not available before MySQL 8.
+"""
+
+
+def _generate_cte_name(idx: int) -> str:
+    return safe_identifier(f'__cte_subquery_{idx}')
+
+
+def _subquery_children(element: ClauseElement) -> List[ClauseElement]:
+    if isinstance(element, CTE):
+        # existing CTEs are rendered only once and left untouched
+        return []
+
+    # column collections only repeat columns of the element itself
+    children = list(element.get_children(column_collections=False))
+    if isinstance(element, Select):
+        # froms that are part of a join are rendered only within the join
+        froms_ids = {id(from_) for from_ in element._froms}
+        displayed_froms_ids = {id(from_) for from_ in element.froms}
+        children = [child for child in children if id(child) not in froms_ids or id(child) in displayed_froms_ids]
+
+    return children
+
+
+def _is_subquery(element: ClauseElement, parent: Optional[ClauseElement]) -> bool:
+    if isinstance(element, Alias):
+        return not isinstance(element, CTE) and isinstance(element.element, SelectBase)
+
+    # select without alias is a subquery only when used as FROM, otherwise it is part of compound select
+    return isinstance(element, SelectBase) and isinstance(parent, (Select, Join))
+
+
+def _subquery_select(element: ClauseElement) -> SelectBase:
+    return element.element if isinstance(element, Alias) else element
+
+
+class _SubqueryOccurrences:
+    """Subqueries used as FROM clauses in the query, grouped by their SQL."""
+
+    def __init__(self, ctx: HuskyQueryContext):
+        self._ctx = ctx
+        self._sql_by_id: Dict[int, str] = {}
+        self.by_sql: Dict[str, List[ClauseElement]] = defaultdict(list)
+
+    def subquery_sql(self, subquery: ClauseElement) -> str:
+        if id(subquery) not in self._sql_by_id:
+            self._sql_by_id[id(subquery)] = compile_query(_subquery_select(subquery), self._ctx.dialect)
+        return self._sql_by_id[id(subquery)]
+
+    def count(self, element: ClauseElement, parent: Optional[ClauseElement] = None):
+        """Count every subquery in the tree."""
+        if _is_subquery(element, parent):
+            self.by_sql[self.subquery_sql(element)].append(element)
+
+        for child in _subquery_children(element):
+            self.count(child, element)
+
+    def collect_repeated(
+        self, element: ClauseElement, repeated: Dict[str, List[ClauseElement]], parent: Optional[ClauseElement] = None
+    ):
+        """Collect outermost repeated subqueries, repeated subqueries within them end up in the CTE body once."""
+        if _is_subquery(element, parent):
+            sql = self.subquery_sql(element)
+            if len(self.by_sql[sql]) > 1:
+                repeated[sql].append(element)
+                return
+
+        for child in _subquery_children(element):
+            self.collect_repeated(child, repeated, element)
+
+
+def deduplicate_subqueries(ctx: HuskyQueryContext, query: Select) -> Select:
+    """
+    Hoists subqueries repeated in the query into CTEs, so each of them is present in the SQL only once.
+
+    Subqueries are compared by their compiled SQL, so structurally identical subqueries built separately
+    (e.g. for data and comparison dataframes) are deduplicated too. Every occurrence is replaced by reference
+    to the CTE, aliased with the original alias name, so the rest of the query does not change.
+    """
+    if ctx.query_runtime not in CTE_DEDUPLICATION_RUNTIMES:
+        return query
+
+    occurrences = _SubqueryOccurrences(ctx)
+    occurrences.count(query)
+
+    repeated: Dict[str, List[ClauseElement]] = defaultdict(list)
+    occurrences.collect_repeated(query, repeated)
+
+    replacements: Dict[int, ClauseElement] = {}
+    replaced_columns: Dict[int, ColumnClause] = {}
+    for idx, subqueries in enumerate(subqueries for subqueries in repeated.values() if len(subqueries) > 1):
+        cte = _subquery_select(subqueries[0]).cte(_generate_cte_name(idx))
+        for subquery in subqueries:
+            replacement = cte.alias(subquery.name) if isinstance(subquery, Alias) else cte
+            replacements[id(subquery)] = replacement
+            for subquery_column in subquery.columns:
+                replaced_columns[id(subquery_column)] = replacement.columns[subquery_column.key]
+
+    if not replacements:
+        return query
+
+    def replace(element: ClauseElement) -> Optional[ClauseElement]:
+        if id(element) in replacements:
+            return replacements[id(element)]
+        if isinstance(element, CTE):
+            # keep existing CTEs, so all their references stay the same object
+            return element
+        if isinstance(element, ColumnClause) and id(getattr(element, 'table', None)) in replacements:
+            return replaced_columns.get(id(element))
+        return None
+
+    return replacement_traverse(query, {}, replace)
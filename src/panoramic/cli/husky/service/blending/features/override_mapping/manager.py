@@ -20,6 +20,7 @@ from panoramic.cli.husky.core.taxonomy.override_mapping.types import (
 from panoramic.cli.husky.service.blending.features.override_mapping.sql import (
     OverrideMappingSql,
 )
+from panoramic.cli.husky.service.context import HuskyQueryContext
 
 
 class OverrideMappingManager:
@@ -37,8 +38,24 @@ class OverrideMappingManager:
         self.mappings = mappings or []
         self.cte_map = mappings_cte_map or {}
 
+    @staticmethod
+    def render_mapping(ctx: HuskyQueryContext, mapping: OverrideMapping) -> Select:
+        """
+        Renders CTE for the mapping. Large mappings are loaded into staging table, if possible.
+        Otherwise mapping is rendered as VALUES list, or union of selects on runtimes without VALUES support.
+        """
+        stage = ctx.override_mapping_stage
+        if stage is not None and len(mapping.definition) >= stage.MIN_STAGED_MAPPING_SIZE:
+            return OverrideMappingSql.render_staged_mapping(stage.stage(mapping), stage.schema)
+
+        if ctx.query_runtime in OverrideMappingSql.VALUES_RUNTIMES:
+            return OverrideMappingSql.render_values_mapping(mapping)
+
+        return OverrideMappingSql.render_direct_mapping(mapping)
+
     @staticmethod
     def initialize(
+        ctx: HuskyQueryContext,
         company_id: Optional[str],
         override_mapping_tel_data: OverrideMappingTelData,
         comparison_override_mapping_tel_data: OverrideMappingTelData,
@@ -46,6 +63,7 @@ class OverrideMappingManager:
         """
         Initializes the manager - loads the mappings and creates necessary SQL primitives
 
+        :param ctx: Husky query context
         :param company_id: Company ID
         :param override_mapping_tel_data:   Override mapping TEL data
         :param comparison_override_mapping_tel_data:    Override mapping TEL data for comparison subqueries
@@ -75,7 +93,7 @@ class OverrideMappingManager:
 
         # generate all CTEs for now (we only support direct override mapping at the moment)
         main_ctes = {
-            om.slug: OverrideMappingSql.render_direct_mapping(om).cte(OverrideMappingSql.generate_cte_name(om.slug))
+            om.slug: OverrideMappingManager.render_mapping(ctx, om).cte(OverrideMappingSql.generate_cte_name(om.slug))
             for om in mappings
         }
 
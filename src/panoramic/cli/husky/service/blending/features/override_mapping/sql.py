@@ -1,14 +1,18 @@
-from typing import Dict
+import hashlib
+import json
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, literal, literal_column, or_, union_all
-from sqlalchemy.sql import Select
+from sqlalchemy import and_, column, literal, literal_column, or_, table, union_all
+from sqlalchemy.sql import ColumnElement, Select
 
+from panoramic.cli.husky.common.sqlalchemy_ext import Values
 from panoramic.cli.husky.core.sql_alchemy_util import safe_identifier
 from panoramic.cli.husky.core.taxonomy.override_mapping.models import OverrideMapping
 from panoramic.cli.husky.core.taxonomy.override_mapping.types import (
     OverrideMappingSlug,
     OverrideMappingTelData,
 )
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
 
 
 class OverrideMappingSql:
@@ -25,6 +29,12 @@ class OverrideMappingSql:
     PANO_NULL = '--PANO-NULL--'
     """Temporary replacement for NULL value in CTE"""
 
+    VALUES_RUNTIMES = {HuskyQueryRuntime.snowflake, HuskyQueryRuntime.postgres}
+    """Runtimes supporting VALUES list as a table in FROM clause"""
+
+    VALUES_TABLE_NAME = 'mapping_values'
+    """Name of the VALUES list within the CTE"""
+
     @staticmethod
     def generate_cte_name(slug: str) -> str:
         """Generated name for CTE representing override mapping with the slug"""
@@ -35,29 +45,77 @@ class OverrideMappingSql:
         """Generate SQL identifier for the mapping"""
         return safe_identifier(f'__om_{column_name}_{slug}_{str(include_unknown_values)}')
 
+    @staticmethod
+    def generate_staging_table_name(mapping: OverrideMapping) -> str:
+        """
+        Generated name for staging table with the mapping.
+        Name contains hash of the definition, so changed mapping is never read from an outdated table.
+        """
+        definition_hash = hashlib.md5(json.dumps(mapping.definition).encode('utf-8')).hexdigest()
+        return safe_identifier(f'__om_staged_{mapping.slug}_{definition_hash[:16]}')
+
+    @classmethod
+    def _render_values(cls, original: Optional[str], changed: Optional[str]) -> Tuple[ColumnElement, ColumnElement]:
+        # using "literal" instead of "literal_column" here to force SQLAlchemy to bind constants as params (safe)
+        if original is None:
+            original_column = literal_column('CAST(NULL AS VARCHAR)')
+        else:
+            original_column = literal(original)
+
+        if changed is None:
+            changed_column = literal(cls.PANO_NULL)
+        else:
+            changed_column = literal(changed)
+
+        return original_column, changed_column
+
     @classmethod
     def render_direct_mapping(cls, mapping: OverrideMapping) -> Select:
         """Renders CTE for direct mapping as union of all values"""
 
         selects = []
         for original, changed in mapping.definition:
-            # using "literal" instead of "literal_column" here to force SQLAlchemy to bind constants as params (safe)
-            if original is None:
-                original_column = literal_column('CAST(NULL AS VARCHAR)')
-            else:
-                original_column = literal(original)
-
-            if changed is None:
-                changed_column = literal(cls.PANO_NULL)
-            else:
-                changed_column = literal(changed)
-
+            original_column, changed_column = cls._render_values(original, changed)
             selects.append(
                 Select([original_column.label(cls.ORIGINAL_COLUMN_NAME), changed_column.label(cls.CHANGED_COLUMN_NAME)])
             )
 
         return union_all(*selects)
 
+    @classmethod
+    def render_values_mapping(cls, mapping: OverrideMapping) -> Select:
+        """Renders CTE for direct mapping as select from VALUES list, which is much shorter than union of selects"""
+        values = Values(
+            cls.VALUES_TABLE_NAME,
+            [cls.ORIGINAL_COLUMN_NAME, cls.CHANGED_COLUMN_NAME],
+            [cls._render_values(original, changed) for original, changed in mapping.definition],
+        )
+
+        return Select(
+            [
+                values.columns[cls.ORIGINAL_COLUMN_NAME].label(cls.ORIGINAL_COLUMN_NAME),
+                values.columns[cls.CHANGED_COLUMN_NAME].label(cls.CHANGED_COLUMN_NAME),
+            ]
+        ).select_from(values)
+
+    @classmethod
+    def render_staged_mapping(cls, table_name: str, schema: Optional[str] = None) -> Select:
+        """Renders CTE for direct mapping loaded to the staging table"""
+        return Select([column(cls.ORIGINAL_COLUMN_NAME), column(cls.CHANGED_COLUMN_NAME)]).select_from(
+            table(table_name, schema=schema)
+        )
+
+    @classmethod
+    def staging_table_rows(cls, mapping: OverrideMapping) -> List[Dict[str, Optional[str]]]:
+        """Rows of the staging table with the mapping, NULL changed value is replaced same way as in the CTE"""
+        return [
+            {
+                cls.ORIGINAL_COLUMN_NAME: original,
+                cls.CHANGED_COLUMN_NAME: cls.PANO_NULL if changed is None else changed,
+            }
+            for original, changed in mapping.definition
+        ]
+
     @classmethod
     def insert_cte_joins(
         cls,
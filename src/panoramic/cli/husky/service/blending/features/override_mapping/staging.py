@@ -0,0 +1,67 @@
+from typing import Dict, Optional, Set
+
+from sqlalchemy import Column, MetaData, String, Table, func, select
+from sqlalchemy.engine import Connection, Engine
+
+from panoramic.cli.husky.core.taxonomy.override_mapping.models import OverrideMapping
+from panoramic.cli.husky.service.blending.features.override_mapping.sql import (
+    OverrideMappingSql,
+)
+
+
+class OverrideMappingStage:
+    """
+    Staging tables for large override mappings, so queries join the table instead of inlining every value.
+
+    Mappings are only registered while queries are compiled, tables are created when the stage is loaded
+    before the queries are executed. Tables are regular (not temporary) tables, because the queries using
+    them run over different connections, and they are never dropped once complete. Name of the table contains hash
+    of the mapping, so existing table with all rows is reused and tables of outdated mappings can be dropped manually.
+    """
+
+    MIN_STAGED_MAPPING_SIZE = 500
+    """Mappings with at least this many values are loaded into staging table"""
+
+    schema: Optional[str]
+    """Schema of the staging tables, default schema of the connection when not set"""
+
+    def __init__(self, schema: Optional[str] = None):
+        self.schema = schema
+        self._mappings_by_table_name: Dict[str, OverrideMapping] = {}
+        self._loaded_table_names: Set[str] = set()
+
+    def stage(self, mapping: OverrideMapping) -> str:
+        """Registers the mapping to be loaded and returns name of its staging table"""
+        table_name = OverrideMappingSql.generate_staging_table_name(mapping)
+        self._mappings_by_table_name[table_name] = mapping
+        return table_name
+
+    def _has_complete_table(self, connection: Connection, staging_table: Table, mapping: OverrideMapping) -> bool:
+        if not connection.dialect.has_table(connection, staging_table.name, schema=self.schema):
+            return False
+
+        row_count = connection.execute(select([func.count()]).select_from(staging_table)).scalar()
+        return row_count == len(mapping.definition)
+
+    def load(self, engine: Engine):
+        """Creates staging tables of registered mappings, which do not exist yet or are incomplete"""
+        for table_name, mapping in self._mappings_by_table_name.items():
+            if table_name in self._loaded_table_names:
+                continue
+
+            staging_table = Table(
+                table_name,
+                MetaData(),
+                Column(OverrideMappingSql.ORIGINAL_COLUMN_NAME, String()),
+                Column(OverrideMappingSql.CHANGED_COLUMN_NAME, String()),
+                schema=self.schema,
+            )
+            with engine.begin() as connection:
+                # complete table with the same name has the same content
+                if not self._has_complete_table(connection, staging_table, mapping):
+                    # DDL commits implicitly on some warehouses, so a failed load can leave incomplete table behind
+                    staging_table.drop(connection, checkfirst=True)
+                    staging_table.create(connection)
+                    connection.execute(staging_table.insert(), OverrideMappingSql.staging_table_rows(mapping))
+
+            self._loaded_table_names.add(table_name)
@@ -0,0 +1,87 @@
+from typing import List, Optional, Set
+
+from panoramic.cli.husky.core.taxonomy.enums import AggregationType
+from panoramic.cli.husky.core.taxonomy.models import taxon_slug_to_sql_friendly_slug
+from panoramic.cli.husky.service.filter_builder.enums import (
+    FilterClauseType,
+    LogicalOperator,
+)
+from panoramic.cli.husky.service.filter_builder.filter_clauses import (
+    FilterClause,
+    GroupFilterClause,
+)
+from panoramic.cli.husky.service.types.api_data_request_types import BlendingDataRequest
+from panoramic.cli.husky.service.utils.taxon_slug_expression import TaxonMap
+
+
+def _and_clauses(clauses: List[FilterClause]) -> FilterClause:
+    if len(clauses) == 1:
+        return clauses[0]
+
+    return GroupFilterClause(
+        {
+            'type': FilterClauseType.GROUP.value,
+            'logical_operator': LogicalOperator.AND.value,
+            'clauses': [clause.to_primitive() for clause in clauses],
+        }
+    )
+
+
+def _conjuncts(filter_clause: FilterClause) -> List[FilterClause]:
+    """Splits the filter clause to clauses that all must hold."""
+    if (
+        isinstance(filter_clause, GroupFilterClause)
+        and filter_clause.logical_operator == LogicalOperator.AND
+        and not filter_clause.negate
+    ):
+        return [conjunct for clause in filter_clause.clauses for conjunct in _conjuncts(clause)]
+
+    return [filter_clause]
+
+
+def _can_push_down_taxon(slug: str, taxon_map: TaxonMap, data_sources: Set[str]) -> bool:
+    """
+    Raw dimension taxon has the same value in the subrequest as in the blended dataframe, so rows can be filtered
+    by it before aggregation.
+    """
+    taxon = taxon_map.get(taxon_slug_to_sql_friendly_slug(slug))
+    if taxon is None or taxon.calculation is not None or taxon.is_comparison_taxon:
+        return False
+    # dimensions aggregated by other taxons (e.g. last_by) depend on rows that would be filtered out
+    if taxon.aggregation is None or taxon.aggregation.type != AggregationType.group_by:
+        return False
+    # namespaced taxon is null in subrequests of other data sources
+    return taxon.data_source is None or data_sources == {taxon.data_source}
+
+
+def push_down_filters(request: BlendingDataRequest, taxon_map: TaxonMap):
+    """
+    Moves post aggregation filters using only raw dimension taxons to preaggregation filters of all data subrequests.
+
+    Rows of the blended dataframe come from exactly one subrequest and keep the subrequest value of every raw
+    dimension, so these filters remove the same groups in either place. Applied in the subrequest, they end up in its
+    WHERE clause and the warehouse does not have to scan and aggregate rows which are later discarded.
+    Filters using metrics or computed dimensions stay where they are.
+    """
+    if request.filters is None or request.grouping_sets:
+        # grouping sets replace dimensions missing in the set by a placeholder value, which would be filtered after
+        return
+
+    data_sources = {subrequest.properties.data_source for subrequest in request.data_subrequests}
+    pushed_clauses: List[FilterClause] = []
+    kept_clauses: List[FilterClause] = []
+    for clause in _conjuncts(request.filters):
+        if all(_can_push_down_taxon(slug, taxon_map, data_sources) for slug in clause.get_taxon_slugs()):
+            pushed_clauses.append(clause)
+        else:
+            kept_clauses.append(clause)
+
+    if not pushed_clauses:
+        return
+
+    for subrequest in request.data_subrequests:
+        preaggregation_filters: Optional[FilterClause] = subrequest.preaggregation_filters
+        existing_clauses = [] if preaggregation_filters is None else [preaggregation_filters]
+        subrequest.preaggregation_filters = _and_clauses(existing_clauses + pushed_clauses)
+
+    request.filters = _and_clauses(kept_clauses) if kept_clauses else None
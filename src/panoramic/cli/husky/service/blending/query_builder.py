@@ -5,9 +5,13 @@ from typing import Optional
 from panoramic.cli.husky.service.blending.blending_taxon_manager import (
     BlendingTaxonManager,
 )
+from panoramic.cli.husky.service.blending.column_pruning import prune_columns
 from panoramic.cli.husky.service.blending.comparison_request_builder import (
     ComparisonRequestBuilder,
 )
+from panoramic.cli.husky.service.blending.cte_deduplication import (
+    deduplicate_subqueries,
+)
 from panoramic.cli.husky.service.blending.dataframe_joins import (
     blend_dataframes,
     left_join_dataframes,
@@ -120,6 +124,8 @@ class QueryBuilder:
         3. build comparison df from subrequests (suggest comparison taxons, if needed and possible)
         4. data left join comparisons
         5. group by request dimensions
+        6. remove columns not used by outer queries
+        7. hoist repeated subqueries into CTEs
         """
         cls._preprocess_request(request)
 
@@ -129,7 +135,7 @@ class QueryBuilder:
         company_id = request.data_subrequests[0].scope.company_id
 
         override_mapping_manager = OverrideMappingManager.initialize(
-            company_id, taxon_manager.plan.override_mappings, taxon_manager.plan.comparison_override_mappings
+            ctx, company_id, taxon_manager.plan.override_mappings, taxon_manager.plan.comparison_override_mappings
         )
 
         # Build data df
@@ -180,7 +186,13 @@ class QueryBuilder:
             request.limit,
         )
 
-        return projected_df
+        # Every phase selects all columns of the previous one, so drop those not needed by the next phase
+        # Data and comparison dataframes often contain identical subqueries, keep only one copy of each of them
+        return Dataframe(
+            deduplicate_subqueries(ctx, prune_columns(projected_df.query)),
+            projected_df.slug_to_column,
+            projected_df.used_model_names,
+        )
 
     @staticmethod
     def validate_data_request(ctx: HuskyQueryContext, data_request: BlendingDataRequest) -> Dataframe:
@@ -1,5 +1,10 @@
+from typing import Optional
+
 from sqlalchemy.engine import default
 
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
 from panoramic.cli.husky.service.helpers import RUNTIME_DIALECTS
 from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
 
@@ -7,8 +12,12 @@ from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
 class HuskyQueryContext:
     _query_runtime: HuskyQueryRuntime
 
-    def __init__(self, query_runtime: HuskyQueryRuntime):
+    override_mapping_stage: Optional[OverrideMappingStage]
+    """Stage for loading large override mappings into tables, not set without connection to the warehouse"""
+
+    def __init__(self, query_runtime: HuskyQueryRuntime, override_mapping_stage: Optional[OverrideMappingStage] = None):
         self._query_runtime = query_runtime
+        self.override_mapping_stage = override_mapping_stage
 
     @property
     def query_runtime(self) -> HuskyQueryRuntime:
@@ -8,6 +8,7 @@ from panoramic.cli.husky.service.model_retriever.model_augments import ModelAugm
 from panoramic.cli.husky.service.types.api_scope_types import Scope
 from panoramic.cli.husky.service.utils.exceptions import ModelNotFoundException
 from panoramic.cli.local import get_state
+from panoramic.cli.state import VirtualState
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +33,21 @@ def does_model_belong_to_scope(model: HuskyModel, scope: Scope) -> bool:
 
 
 class ModelRetriever:
+    _state: Optional[VirtualState] = None
+    """Preloaded virtual state"""
+
+    @classmethod
+    def preload_state(cls, state: VirtualState):
+        """Allows preloading virtual state, so local files are not read again on every request"""
+        cls._state = state
+
     @classmethod
     def _load_all_models(cls) -> List[HuskyModel]:
         """
         Loads all available husky models from internal state
         """
         # get virtual state
-        state = get_state()
+        state = cls._state if cls._state is not None else get_state()
         # map it to internal state
         internal_state = VirtualStateMapper.to_husky(state)
 
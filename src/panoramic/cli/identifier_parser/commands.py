@@ -0,0 +1,182 @@
+import logging
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+from tqdm import tqdm
+
+from panoramic.cli.connection import Connection
+from panoramic.cli.diff import DiffOptions, echo_diff
+from panoramic.cli.errors import ExecuteActionsException
+from panoramic.cli.identifier_parser.heuristics import ColumnFilter
+from panoramic.cli.identifier_parser.parser import (
+    DEFAULT_MAX_COMBINATION_LENGTH,
+    parse_identifiers,
+)
+from panoramic.cli.identifier_parser.sampler import DEFAULT_SAMPLE_SIZE, sample_table
+from panoramic.cli.local import get_state
+from panoramic.cli.local.executor import LocalExecutor
+from panoramic.cli.local.writer import FileWriter
+from panoramic.cli.pano_model import PanoField, PanoModel
+from panoramic.cli.print import echo_error, echo_info
+from panoramic.cli.scan import column_name_from_data_reference
+from panoramic.cli.state import Action, ActionList
+from panoramic.cli.utils.executors import get_pool_executor
+
+logger = logging.getLogger(__name__)
+
+MAX_ALLOWED_COLUMNS = 32
+"""Maximum number of candidate columns per table, the least likely candidates over the limit are dropped"""
+
+
+class _ModelColumn:
+    """Column of a model which can be part of its identifiers."""
+
+    column_name: str
+    data_reference: str
+    field_slug: str
+    data_type: Optional[str]
+
+    def __init__(self, *, column_name: str, data_reference: str, field_slug: str, data_type: Optional[str]):
+        self.column_name = column_name
+        self.data_reference = data_reference
+        self.field_slug = field_slug
+        self.data_type = data_type
+
+
+def _get_model_columns(
+    model: PanoModel, fields_by_id: Dict[Tuple[Optional[str], str], PanoField]
+) -> Dict[str, _ModelColumn]:
+    """Map column names of the model to the fields they are mapped to, ignoring expressions."""
+    columns: Dict[str, _ModelColumn] = {}
+    for model_field in sorted(model.fields, key=lambda f: f.identifier()):
+        column_name = column_name_from_data_reference(model_field.data_reference)
+        if column_name is None or column_name in columns or not model_field.field_map:
+            continue
+
+        field_slug = sorted(model_field.field_map)[0]
+        field = fields_by_id.get((model.virtual_data_source, field_slug)) or fields_by_id.get((None, field_slug))
+        columns[column_name] = _ModelColumn(
+            column_name=column_name,
+            data_reference=model_field.data_reference,
+            field_slug=field_slug,
+            data_type=field.data_type if field is not None else model_field.data_type,
+        )
+
+    return columns
+
+
+def _detect_identifiers_for_model(
+    model_name: str,
+    column_names: List[str],
+    data_references: List[str],
+    connection: Dict[str, Any],
+    sample_size: int,
+) -> List[str]:
+    """Sample the model (table) and find its primary key. Runs in a worker process."""
+    if len(column_names) == 0:
+        return []
+
+    rows = sample_table(model_name, data_references, connection, sample_size)
+    return parse_identifiers(column_names, rows, DEFAULT_MAX_COMBINATION_LENGTH)
+
+
+def detect_command(
+    target_dataset: Optional[str] = None,
+    diff: bool = False,
+    overwrite: bool = False,
+    yes: bool = False,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    diff_options: Optional[DiffOptions] = None,
+):
+    """Detect identifiers of models on sampled data and write them to model files."""
+    echo_info('Loading local state...')
+    state = get_state(target_dataset=target_dataset)
+
+    # models with identifiers are left untouched unless they should be overwritten
+    models = [model for model in state.models if overwrite or not model.identifiers]
+    if len(models) == 0:
+        echo_info('No models to detect identifiers on')
+        return
+
+    connection = Connection.get()
+    fields_by_id = {(field.data_source, field.slug): field for field in state.fields}
+    column_filter = ColumnFilter()
+    action_list: ActionList[PanoModel] = ActionList()
+
+    # tables are independent so sample and process them in parallel, but report results in order
+    with get_pool_executor(len(models)) as pool, tqdm(models) as bar:
+        futures = []
+        model_columns = []
+        for model in models:
+            columns = _get_model_columns(model, fields_by_id)
+            candidates = [
+                columns[column_name]
+                for column_name in column_filter.find_dimensions({name: c.data_type for name, c in columns.items()})
+            ]
+            if len(candidates) > MAX_ALLOWED_COLUMNS:
+                logger.warning(f'Model {model.model_name} has too many columns. Slicing first {MAX_ALLOWED_COLUMNS}')
+                candidates = candidates[:MAX_ALLOWED_COLUMNS]
+
+            model_columns.append(candidates)
+            futures.append(
+                pool.submit(
+                    _detect_identifiers_for_model,
+                    model.model_name,
+                    [c.column_name for c in candidates],
+                    [c.data_reference for c in candidates],
+                    connection,
+                    sample_size,
+                )
+            )
+
+        for model, candidates, future in zip(models, model_columns, futures):
+            try:
+                bar.write(f'Detecting identifiers for {model.model_name}')
+                column_names = future.result()
+
+                if len(column_names) == 0:
+                    bar.write(f'No identifiers detected for {model.model_name}')
+                    continue
+
+                field_slugs_by_column = {c.column_name: c.field_slug for c in candidates}
+                identifiers = [field_slugs_by_column[column_name] for column_name in column_names]
+                bar.write(f'Detected identifiers {", ".join(identifiers)} for {model.model_name}')
+
+                if sorted(identifiers) == sorted(model.identifiers):
+                    continue
+
+                desired_model = deepcopy(model)
+                desired_model.identifiers = identifiers
+                action_list.actions.append(Action(current=model, desired=desired_model))
+            except Exception:
+                error_msg = f'An unexpected error occured when detecting identifiers for {model.model_name}'
+                bar.write(f'Error: {error_msg}')
+                logger.debug(error_msg, exc_info=True)
+            finally:
+                bar.update()
+
+    if action_list.is_empty:
+        echo_info('No identifiers to update')
+        return
+
+    echo_diff(action_list, diff_options)
+    if diff:
+        # User decided to see the diff only
+        return
+
+    if not yes and not click.confirm('Do you want to proceed?'):
+        # User decided not to update local models
+        return
+
+    echo_info('Updating local state...')
+
+    writer = FileWriter(skip_unchanged=True)
+    executor = LocalExecutor(writer)
+    try:
+        executor.execute_all(action_list.actions)
+    except ExecuteActionsException as e:
+        echo_error(str(e))
+    echo_info(f'Updated {executor.success_count}/{executor.total_count} models')
+    if executor.failure_count == 0:
+        echo_info(f'Files: {writer.report}')
@@ -0,0 +1,115 @@
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+from panoramic.cli.husky.common.enum import EnumHelper
+from panoramic.cli.husky.core.taxonomy.enums import ValidationType
+
+NUMERIC_COLUMN_TYPES = {
+    ValidationType.boolean,
+    ValidationType.integer,
+    ValidationType.numeric,
+    ValidationType.percent,
+    ValidationType.money,
+    ValidationType.duration,
+}
+
+STRING_COLUMN_TYPES = {
+    ValidationType.text,
+    ValidationType.enum,
+    ValidationType.url,
+}
+
+COMPLEX_COLUMN_TYPES = {
+    ValidationType.variant,
+}
+
+DATE_COLUMN_NAMES = {
+    'date',
+    'year',
+    'month',
+    'day',
+    'hour',
+    'seconds',
+    'quarter',
+    'week',
+    'start_date',
+}
+"""Names of date columns that might be part of the primary key"""
+
+DEFAULT_IGNORED_COLUMN_NAMES = [
+    # common junk present in ETL vendors such as Fivetran
+    'updated_at',
+    'created_at',
+    'processed_at',
+    'cancelled_at',
+    'deleted_at',
+    'last_modified',
+    'last_updated',
+    'data',
+]
+
+
+class ColumnFilter:
+    """Ranks columns of a table by how likely they are part of its primary key."""
+
+    ignored_column_names: List[str]
+
+    def __init__(self, *, ignored_column_names: Optional[List[str]] = None):
+        self.ignored_column_names = (
+            ignored_column_names if ignored_column_names is not None else DEFAULT_IGNORED_COLUMN_NAMES
+        )
+
+    def _score_all_dimensions(self, columns: Mapping[str, Optional[str]]) -> Iterable[Tuple[int, str]]:
+        for column_name, column_data_type in columns.items():
+            data_type = EnumHelper.from_value_safe(ValidationType, column_data_type)
+
+            if not column_name or data_type is None:
+                continue  # not enough information to apply heuristics
+
+            name = column_name.lower()
+
+            # ignore certain columns by default
+            if name in self.ignored_column_names or name.startswith('_'):
+                continue
+
+            score = 0
+            already_promoted = False
+
+            # prioritize and yield ids directly
+            if name == 'id' or name.endswith('_id') or name.startswith('id_'):
+                score += 1_000_000 + (1 if name == 'id' else 0)
+                yield score, column_name
+                continue
+
+            # maybe promote dimensions
+            if data_type in STRING_COLUMN_TYPES:
+                score += 1_000
+                already_promoted = True
+
+            # maybe promote dates that might be part of the primary key
+            if name in DATE_COLUMN_NAMES:
+                score += 10_000
+                already_promoted = True
+
+            # ignore metrics and complex types
+            if not already_promoted and (data_type in NUMERIC_COLUMN_TYPES or data_type in COMPLEX_COLUMN_TYPES):
+                score = -1_000_000
+
+            # ignore random dates and timestamps
+            if not already_promoted and (
+                data_type is ValidationType.datetime or name.endswith('_at') or name.endswith('_date')
+            ):
+                score = -1_000_000
+
+            yield score, column_name
+
+    def find_dimensions(self, columns: Mapping[str, Optional[str]]) -> Iterable[str]:
+        """Yield names of columns that can be part of the primary key, most likely ones first."""
+        for score, column_name in sorted(
+            self._score_all_dimensions(columns),
+            # sort by score desc (highest first) and column name asc (alphabetically)
+            key=lambda score_and_col: (-score_and_col[0], score_and_col[1]),
+        ):
+            if score < 0:
+                continue
+
+            yield column_name
@@ -0,0 +1,171 @@
+import itertools
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+NON_NULL_VALUES_RATIO = 0.60
+"""Minimal ratio of non-null values in a column to consider it part of the primary key"""
+
+DEFAULT_MAX_COMBINATION_LENGTH = 5
+"""Upper bound on how many columns can form the primary key"""
+
+
+def _factorize(values: Sequence[Any]) -> List[int]:
+    """
+    Encode values of a column as integer codes, equal values get the same code.
+
+    Every null value gets its own code, so rows with null value in any of the columns are never duplicates.
+    """
+    codes_by_value: Dict[Any, int] = {}
+    codes = [-1 if value is None else codes_by_value.setdefault(value, len(codes_by_value)) for value in values]
+    # codes of null values follow codes of all distinct values
+    return [len(codes_by_value) + row if code == -1 else code for row, code in enumerate(codes)]
+
+
+def _count_distinct_keys(column_codes: Sequence[List[int]]) -> int:
+    """
+    Count how many distinct keys (of a single column combination) are present within the sampled table.
+    If every row has a distinct key, the combination of columns is considered to uniquely identify each
+    row of the table, therefore it can be considered a primary key.
+
+    # Sample
+    +------------+-------------+-------------+--------+
+    | Account ID | Campaign ID | Objective   | Status |
+    +============+=============+=============+========+
+    | 1          | 1001        | link clicks | active |
+    +------------+-------------+-------------+--------+
+    | 1          | 1002        | video views | active |
+    +------------+-------------+-------------+--------+
+    | 2          | 1003        | link clicks | active |
+    +------------+-------------+-------------+--------+
+
+    ## Example 1
+    columns = ['Account ID', 'Campaign ID']
+    keys = {(0, 0), (0, 1), (1, 2)}
+    => 3 distinct keys in 3 rows (all rows are unique)
+
+    ## Example 2
+    columns = ['Objective', 'Status']
+    keys = {(0, 0), (1, 0)}
+    => 2 distinct keys in 3 rows (some rows are duplicates)
+    """
+    return len(set(zip(*column_codes)))
+
+
+def _prune_columns(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> List[Tuple[str, List[int]]]:
+    """
+    Drop columns with too many null values - null values can't be parts of the primary key.
+
+    Values of the remaining columns are encoded to integer codes once, so testing combinations of them
+    only works with small integers.
+    """
+    column_values = list(zip(*rows))
+    return [
+        (column, _factorize(values))
+        for column, values in zip(columns, column_values)
+        if sum(1 for value in values if value is not None) / len(rows) >= NON_NULL_VALUES_RATIO
+    ]
+
+
+def _next_level(non_unique: Dict[Tuple[int, ...], int]) -> List[Tuple[int, ...]]:
+    """
+    Generate combinations one column longer than the given non-unique combinations (Apriori candidate generation).
+
+    Combination is generated only when all its sub-combinations are non-unique,
+    because supersets of a unique combination are unique as well.
+    """
+    last_columns_by_prefix: Dict[Tuple[int, ...], List[int]] = defaultdict(list)
+    for combination in sorted(non_unique):
+        last_columns_by_prefix[combination[:-1]].append(combination[-1])
+
+    combinations: List[Tuple[int, ...]] = []
+    for prefix, last_columns in last_columns_by_prefix.items():
+        for first, second in itertools.combinations(last_columns, 2):
+            combination = prefix + (first, second)
+            # sub-combinations without one of the last two columns are the ones the combination was joined from
+            if all(combination[:idx] + combination[idx + 1 :] in non_unique for idx in range(len(prefix))):
+                combinations.append(combination)
+
+    return combinations
+
+
+def find_candidate_ids(
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    max_combination_length: int = DEFAULT_MAX_COMBINATION_LENGTH,
+    shortest_only: bool = False,
+) -> List[List[str]]:
+    """
+    Find minimal combinations of columns uniquely identifying rows of the sampled table.
+
+    Combinations are tested level by level (by their length) and supersets of already found combinations
+    are skipped. Number of distinct keys of tested combinations bounds number of distinct keys of their supersets,
+    so combinations which can't have as many distinct keys as there are rows are not tested at all.
+
+    Combinations are returned shortest first, keeping order of the given columns.
+    When `shortest_only` is set, search stops at the first level with any unique combination.
+    """
+    if len(rows) == 0:
+        return []
+
+    pruned_columns = _prune_columns(columns, rows)
+
+    candidate_ids: List[List[str]] = []
+    # non-unique combinations of the previous level with (upper bound of) their number of distinct keys
+    non_unique: Dict[Tuple[int, ...], int] = {}
+    column_distinct_keys: Dict[int, int] = {}
+    level: List[Tuple[int, ...]] = [(idx,) for idx in range(len(pruned_columns))]
+
+    for length in range(1, min(max_combination_length, len(pruned_columns)) + 1):
+        level_non_unique: Dict[Tuple[int, ...], int] = {}
+
+        for combination in level:
+            if length > 1:
+                max_distinct_keys = min(
+                    non_unique[combination[:idx] + combination[idx + 1 :]] * column_distinct_keys[column]
+                    for idx, column in enumerate(combination)
+                )
+                if max_distinct_keys < len(rows):
+                    # there are more rows than distinct combinations of values, so some rows must be duplicate
+                    level_non_unique[combination] = max_distinct_keys
+                    continue
+
+            distinct_keys = _count_distinct_keys([pruned_columns[idx][1] for idx in combination])
+            if distinct_keys == len(rows):
+                candidate_ids.append([pruned_columns[idx][0] for idx in combination])
+            else:
+                level_non_unique[combination] = distinct_keys
+
+        if length == 1:
+            column_distinct_keys = {combination[0]: keys for combination, keys in level_non_unique.items()}
+
+        if shortest_only and len(candidate_ids) > 0:
+            break
+
+        non_unique = level_non_unique
+        level = _next_level(non_unique)
+
+    logger.debug(f'Found {len(candidate_ids)} candidate identifiers for columns {columns}')
+    return candidate_ids
+
+
+def parse_identifiers(
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    max_combination_length: int = DEFAULT_MAX_COMBINATION_LENGTH,
+) -> List[str]:
+    """
+    Find the best primary key of the sampled table.
+
+    The shortest unique combination of columns is preferred, ties are broken by order of the given columns
+    so pass them sorted by how likely they are part of the primary key.
+    """
+    candidate_ids = find_candidate_ids(columns, rows, max_combination_length, shortest_only=True)
+
+    if len(candidate_ids) == 0:
+        return []
+
+    column_ranks = {column: idx for idx, column in enumerate(columns)}
+    return min(candidate_ids, key=lambda candidate: (len(candidate), [column_ranks[c] for c in candidate]))
@@ -0,0 +1,47 @@
+import logging
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy.engine import default
+
+from panoramic.cli.connection import Connection
+from panoramic.cli.scan import column_name_from_data_reference
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_SIZE = 10000
+"""Number of rows sampled from each table when detecting identifiers"""
+
+
+def column_sql(data_reference: str, dialect: default.DefaultDialect) -> str:
+    """SQL accessor of the column the data reference points to."""
+    column_name = column_name_from_data_reference(data_reference)
+    if column_name is None:
+        raise ValueError(f'Data reference {data_reference} does not point to a column')
+
+    if data_reference.strip().startswith('"'):
+        # quoted reference is case sensitive
+        return dialect.identifier_preparer.quote_identifier(column_name)
+    return column_name
+
+
+def build_sample_query(
+    model_name: str, data_references: Sequence[str], dialect: default.DefaultDialect, sample_size: int
+) -> str:
+    """Build query selecting sample of rows with given columns of the model (table)."""
+    columns = ', '.join(column_sql(data_reference, dialect) for data_reference in data_references)
+    table = '.'.join(dialect.identifier_preparer.quote(part) for part in model_name.split('.'))
+    return f'SELECT {columns} FROM {table} LIMIT {int(sample_size)}'
+
+
+def sample_table(
+    model_name: str,
+    data_references: Sequence[str],
+    connection: Dict[str, Any],
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> List[Tuple[Any, ...]]:
+    """Fetch sample of rows with given columns of the model (table) through the connection."""
+    dialect = Connection.get_connection_engine(connection).dialect
+    query = build_sample_query(model_name, data_references, dialect, sample_size)
+
+    logger.debug(f'Sampling {model_name} with query {query}')
+    return [tuple(row) for row in Connection.fetch_all(query, connection)]
@@ -0,0 +1,171 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.engine import default
+
+from panoramic.cli.connection import Connection
+from panoramic.cli.errors import JoinVerificationException
+from panoramic.cli.identifier_parser.sampler import column_sql
+from panoramic.cli.pano_model import PanoModel, PanoModelJoin
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_SIZE = 10000
+"""Number of rows sampled from each side of a join when verifying it"""
+
+_ONE_TO_ONE = 'one_to_one'
+_MANY_TO_ONE = 'many_to_one'
+
+
+class JoinVerificationResult:
+    """Cardinality statistics measured on sampled rows of both sides of a join."""
+
+    join: PanoModelJoin
+    many_side_rows: int
+    many_side_distinct_keys: int
+    one_side_rows: int
+    one_side_distinct_keys: int
+    matched_rows: int
+
+    def __init__(
+        self,
+        *,
+        join: PanoModelJoin,
+        many_side_rows: int,
+        many_side_distinct_keys: int,
+        one_side_rows: int,
+        one_side_distinct_keys: int,
+        matched_rows: int,
+    ):
+        self.join = join
+        self.many_side_rows = many_side_rows
+        self.many_side_distinct_keys = many_side_distinct_keys
+        self.one_side_rows = one_side_rows
+        self.one_side_distinct_keys = one_side_distinct_keys
+        self.matched_rows = matched_rows
+
+    @property
+    def is_empty(self) -> bool:
+        """True when there is no data to verify the join on."""
+        return self.many_side_rows == 0 or self.one_side_rows == 0
+
+    @property
+    def is_many_side_unique(self) -> bool:
+        return self.many_side_distinct_keys == self.many_side_rows
+
+    @property
+    def is_one_side_unique(self) -> bool:
+        return self.one_side_distinct_keys == self.one_side_rows
+
+    @property
+    def match_rate(self) -> float:
+        """Ratio of sampled rows from the model which have matching row in the joined model."""
+        if self.many_side_rows == 0:
+            return 0.0
+        return self.matched_rows / self.many_side_rows
+
+    def verified_join(self) -> Optional[PanoModelJoin]:
+        """
+        Join with relationship corrected based on measured cardinality or None when the join should be dropped.
+
+        Joins without any data are kept unchanged because there is nothing to verify them on.
+        """
+        if self.is_empty:
+            return self.join
+
+        if not self.is_one_side_unique or self.matched_rows == 0:
+            # keys are not unique in joined model (many to many) or the keys are not related at all
+            return None
+
+        if self.join.relationship == _ONE_TO_ONE and not self.is_many_side_unique:
+            return PanoModelJoin(
+                fields=self.join.fields,
+                join_type=self.join.join_type,
+                relationship=_MANY_TO_ONE,
+                to_model=self.join.to_model,
+            )
+
+        return self.join
+
+    def __str__(self) -> str:
+        if self.is_empty:
+            return 'no sampled rows to verify on'
+
+        return (
+            f'{self.one_side_distinct_keys}/{self.one_side_rows} unique keys in {self.join.to_model}, '
+            f'{self.match_rate:.1%} of sampled rows matched'
+        )
+
+
+def _key_sql(model: PanoModel, field_slug: str, dialect: default.DefaultDialect) -> str:
+    """SQL accessor of a join field on a model."""
+    data_reference = next((f.data_reference for f in model.fields if field_slug in f.field_map), None)
+    if data_reference is None:
+        raise JoinVerificationException(model.model_name, field_slug)
+
+    try:
+        return column_sql(data_reference, dialect)
+    except ValueError:
+        raise JoinVerificationException(model.model_name, field_slug)
+
+
+def _table_sql(model: PanoModel, dialect: default.DefaultDialect) -> str:
+    return '.'.join(dialect.identifier_preparer.quote(part) for part in model.model_name.split('.'))
+
+
+def build_join_verification_query(
+    model: PanoModel, join: PanoModelJoin, to_model: PanoModel, dialect: default.DefaultDialect, sample_size: int
+) -> str:
+    """
+    Build single aggregate query measuring key uniqueness on both sides of the join
+    and how many sampled rows of the model have a matching row in the joined model.
+    """
+    many_keys = [_key_sql(model, field_slug, dialect) for field_slug in join.fields]
+    one_keys = [_key_sql(to_model, field_slug, dialect) for field_slug in join.fields]
+    key_aliases = [f'key_{idx}' for idx in range(len(join.fields))]
+
+    def sample_sql(keys: List[str], table_sql: str) -> str:
+        columns = ', '.join(f'{key} AS {alias}' for key, alias in zip(keys, key_aliases))
+        not_null = ' AND '.join(f'{key} IS NOT NULL' for key in keys)
+        return f'SELECT {columns} FROM {table_sql} WHERE {not_null} LIMIT {int(sample_size)}'
+
+    key_list = ', '.join(key_aliases)
+    match_condition = ' AND '.join(f'one_side.{key} = many_sample.{alias}' for key, alias in zip(one_keys, key_aliases))
+
+    return f'''
+        WITH many_sample AS ({sample_sql(many_keys, _table_sql(model, dialect))}),
+        one_sample AS ({sample_sql(one_keys, _table_sql(to_model, dialect))})
+        SELECT
+            (SELECT COUNT(*) FROM many_sample) AS many_side_rows,
+            (SELECT COUNT(*) FROM (SELECT DISTINCT {key_list} FROM many_sample) many_keys) AS many_side_distinct_keys,
+            (SELECT COUNT(*) FROM one_sample) AS one_side_rows,
+            (SELECT COUNT(*) FROM (SELECT DISTINCT {key_list} FROM one_sample) one_keys) AS one_side_distinct_keys,
+            (
+                SELECT COUNT(*) FROM many_sample
+                WHERE EXISTS (SELECT 1 FROM {_table_sql(to_model, dialect)} one_side WHERE {match_condition})
+            ) AS matched_rows
+        '''
+
+
+def verify_join(
+    model: PanoModel,
+    join: PanoModelJoin,
+    to_model: PanoModel,
+    connection: Dict[str, Any],
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> JoinVerificationResult:
+    """Verify join relationship on sampled data through the connection."""
+    dialect = Connection.get_connection_engine(connection).dialect
+    query = build_join_verification_query(model, join, to_model, dialect, sample_size)
+
+    logger.debug(f'Verifying join {model.model_name} -> {to_model.model_name} with query {query}')
+    row = Connection.fetch_all(query, connection)[0]
+
+    return JoinVerificationResult(
+        join=join,
+        many_side_rows=row['many_side_rows'],
+        many_side_distinct_keys=row['many_side_distinct_keys'],
+        one_side_rows=row['one_side_rows'],
+        one_side_distinct_keys=row['one_side_distinct_keys'],
+        matched_rows=row['matched_rows'],
+    )
@@ -1,3 +1,3 @@
-from panoramic.cli.local.get import get_state
+from panoramic.cli.local.get import get_state, preload_state
 
-__all__ = ['get_state']
+__all__ = ['get_state', 'preload_state']
@@ -1,9 +1,16 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
 
+from panoramic.cli.errors import ExecuteActionsException
 from panoramic.cli.executor import Executor
+from panoramic.cli.local.transaction import FileTransaction
 from panoramic.cli.local.writer import FileWriter
+from panoramic.cli.paths import SystemDirectory
 from panoramic.cli.state import Action
 
+MAX_WRITE_WORKERS = 8
+"""Number of threads serializing and staging files of a batch in parallel"""
+
 
 class LocalExecutor(Executor):
 
@@ -28,3 +35,33 @@ class LocalExecutor(Executor):
             assert action.desired is not None
             assert action.current is not None
             self.writer.write(action.desired, package=action.current.package, file_name=action.current.file_name)
+
+    def execute_all(self, actions: Sequence[Action]):
+        """
+        Execute all actions as a single transaction - either all of them are applied or none.
+
+        Files of independent actions are serialized and staged in parallel, then moved to their place with renames.
+        When any action fails, local files are left untouched and ExecuteActionsException is raised.
+        """
+        transaction = FileTransaction(staging_dir=self.writer.cwd / SystemDirectory.CACHE.value / 'staging')
+        self.writer.transaction = transaction
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as pool:
+                futures = [pool.submit(self._execute, action) for action in actions]
+            failed = [(action, future.exception()) for action, future in zip(actions, futures) if future.exception()]
+
+            if len(failed) > 0:
+                transaction.rollback()
+                self.failure_count += len(failed)
+                raise ExecuteActionsException([f'{action.description} - {error}' for action, error in failed])
+
+            try:
+                transaction.commit()
+            except Exception as e:
+                self.failure_count += len(actions)
+                raise ExecuteActionsException([f'committing changes - {e}'])
+
+            self.success_count += len(actions)
+        finally:
+            self.writer.transaction = None
+            self.total_count += len(actions)
@@ -20,10 +20,34 @@ def get_transforms() -> List[Tuple[PanoTransform, Path]]:
     return sorted_transforms
 
 
+_preloaded_state: Optional[VirtualState] = None
+"""State already loaded from local filesystem by the running command"""
+
+
+def preload_state(state: Optional[VirtualState]):
+    """Allows preloading local state, so local files are not read again by the command"""
+    global _preloaded_state
+    _preloaded_state = state
+
+
+def _filter_state(state: VirtualState, target_dataset: str) -> VirtualState:
+    """Objects of the state in package of the dataset, without company-scoped fields"""
+    data_sources = [data_source for data_source in state.data_sources if data_source.dataset_slug == target_dataset]
+    packages = {data_source.package for data_source in data_sources}
+    return VirtualState(
+        data_sources=data_sources,
+        models=[model for model in state.models if model.package in packages],
+        fields=[field for field in state.fields if field.package is not None and field.package in packages],
+    )
+
+
 def get_state(target_dataset: Optional[str] = None) -> VirtualState:
     """
     Build a representation of what VDS and models are on local filesystem.
     """
+    if _preloaded_state is not None:
+        return _preloaded_state if target_dataset is None else _filter_state(_preloaded_state, target_dataset)
+
     file_reader = FileReader()
     packages = file_reader.get_packages()
     data_sources = []
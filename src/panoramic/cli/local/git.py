@@ -0,0 +1,36 @@
+import subprocess
+from pathlib import Path
+from typing import List
+
+from panoramic.cli.errors import GitStatusException
+
+
+def _run_git(args: List[str], cwd: Path) -> str:
+    try:
+        return subprocess.run(
+            ['git', *args], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, universal_newlines=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise GitStatusException(e.stderr.strip())
+    except OSError as e:
+        raise GitStatusException(str(e))
+
+
+def get_changed_files(cwd: Path) -> List[Path]:
+    """List files changed in git working tree, including staged, untracked and deleted files."""
+    top_level = Path(_run_git(['rev-parse', '--show-toplevel'], cwd).strip())
+    entries = _run_git(['status', '--porcelain', '-z', '--untracked-files=all'], cwd).split('\0')
+
+    changed_files = []
+    entries_iter = iter(entries)
+    for entry in entries_iter:
+        if len(entry) < 4:
+            continue
+
+        # entries are in format "XY path"
+        changed_files.append(top_level / entry[3:])
+        if entry[0] in 'RC':
+            # renamed and copied entries are followed by the original path
+            changed_files.append(top_level / next(entries_iter))
+
+    return changed_files
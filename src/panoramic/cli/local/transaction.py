@@ -0,0 +1,91 @@
+import logging
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from panoramic.cli.file_utils import ensure_dir
+
+logger = logging.getLogger(__name__)
+
+
+class FileTransaction:
+    """
+    Set of file writes and deletes applied to local filesystem all at once.
+
+    Written files are staged in a temporary directory first, so serializing and writing them can happen in parallel
+    and any failure leaves local files untouched. Commit only moves files with renames, replaced and deleted files
+    are moved aside and restored when the commit fails midway.
+    """
+
+    staging_dir: Path
+
+    def __init__(self, *, staging_dir: Path):
+        # staging directory needs to be on the same filesystem as the targets, so renames are atomic
+        self.staging_dir = staging_dir / uuid.uuid4().hex
+        # target path -> staged file, None means the target is deleted
+        self._operations: Dict[Path, Optional[Path]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def _register(self, path: Path, staged_path: Optional[Path]):
+        with self._lock:
+            if path in self._operations:
+                raise ValueError(f'File {path} is changed multiple times in one transaction')
+            self._operations[path] = staged_path
+
+    def write_text(self, path: Path, text: str):
+        """Stage text to be written to the path on commit. Safe to call from multiple threads."""
+        staged_path = self.staging_dir / f'{uuid.uuid4().hex}.staged'
+        ensure_dir(staged_path)
+        with open(staged_path, 'w') as f:
+            f.write(text)
+        self._register(path, staged_path)
+
+    def delete(self, path: Path):
+        """Stage deletion of the path on commit. Missing files are ignored."""
+        self._register(path, None)
+
+    def commit(self):
+        """Move staged files to their targets, restoring all targets when any of the moves fails."""
+        # target path -> backup of its previous content, None means the target did not exist
+        moved: List[Tuple[Path, Optional[Path]]] = []
+        try:
+            for path, staged_path in self._operations.items():
+                backup_path = None
+                if path.exists():
+                    backup_path = self.staging_dir / f'{uuid.uuid4().hex}.backup'
+                    ensure_dir(backup_path)
+                    os.replace(path, backup_path)
+                moved.append((path, backup_path))
+
+                if staged_path is not None:
+                    ensure_dir(path)
+                    os.replace(staged_path, path)
+        except BaseException:
+            logger.debug('Failed to commit file transaction, restoring previous files', exc_info=True)
+            self._restore(moved)
+            raise
+        finally:
+            self._cleanup()
+
+        logger.debug(f'Committed {len(self._operations)} file changes')
+
+    def rollback(self):
+        """Discard all staged changes."""
+        self._operations = {}
+        self._cleanup()
+
+    def _restore(self, moved: List[Tuple[Path, Optional[Path]]]):
+        for path, backup_path in reversed(moved):
+            if backup_path is not None:
+                os.replace(backup_path, path)
+            elif path.exists():
+                path.unlink()
+
+    def _cleanup(self):
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
@@ -0,0 +1,111 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from panoramic.cli.__version__ import __version__
+from panoramic.cli.file_utils import content_hash, write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class FileResult:
+    """Result of validating a single file against its schema."""
+
+    content_hash: str
+    is_validated: bool
+    """False when the file changed and needs to be validated again."""
+    error: Optional[str]
+
+    def __init__(self, *, content_hash: str, is_validated: bool, error: Optional[str]):
+        self.content_hash = content_hash
+        self.is_validated = is_validated
+        self.error = error
+
+
+class ValidationCache:
+    """
+    Results of validating local files from previous runs.
+
+    Results are keyed by path and content hash of the file, so results of renamed or changed files
+    are not reused.
+    """
+
+    path: Path
+
+    def __init__(self, *, path: Path):
+        self.path = path
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._used_files: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, FileResult] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> 'ValidationCache':
+        """Load cache from file, starting with an empty cache when it is missing, broken or outdated."""
+        cache = cls(path=path)
+        try:
+            with path.open('r') as f:
+                data = json.load(f)
+            if data.get('version') == __version__:
+                cache._files = data['files']
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.debug(f'Failed to load validation cache {path}', exc_info=True)
+
+        return cache
+
+    def save(self, prune: bool = True):
+        """
+        Persist results used in this run.
+
+        Results of files not used in this run (e.g. deleted files) are dropped, unless `prune` is False.
+        """
+        files = self._used_files if prune else {**self._files, **self._used_files}
+        data = {'version': __version__, 'files': files}
+        try:
+            write_text_atomic(self.path, json.dumps(data))
+            # keep cache out of version control, so it does not show up as a changed file
+            gitignore_path = self.path.parent / '.gitignore'
+            if not gitignore_path.exists():
+                gitignore_path.write_text('*\n')
+        except OSError:
+            logger.debug(f'Failed to save validation cache {self.path}', exc_info=True)
+
+    def read_file(self, path: Path) -> FileResult:
+        """
+        Return cached result for the file when its content did not change.
+
+        Content is not hashed again when modification time and size of the file match the cached entry.
+        Returned result which is not validated needs to be validated and stored using `store_file`.
+        """
+        key = str(path)
+        if key not in self._results:
+            self._results[key] = self._read_file(path)
+        return self._results[key]
+
+    def _read_file(self, path: Path) -> FileResult:
+        key = str(path)
+        stat = path.stat()
+        entry = self._files.get(key)
+        if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self._used_files[key] = entry
+            return FileResult(content_hash=entry['hash'], is_validated=True, error=entry['error'])
+
+        file_hash = content_hash(path.read_bytes())
+        if entry is not None and entry['hash'] == file_hash:
+            self._used_files[key] = {**entry, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            return FileResult(content_hash=entry['hash'], is_validated=True, error=entry['error'])
+
+        return FileResult(content_hash=file_hash, is_validated=False, error=None)
+
+    def store_file(self, path: Path, result: FileResult):
+        """Store result of validating the file."""
+        self._results[str(path)] = result
+        stat = path.stat()
+        self._used_files[str(path)] = {
+            'hash': result.content_hash,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'error': result.error,
+        }
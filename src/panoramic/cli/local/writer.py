@@ -1,8 +1,17 @@
 import logging
+import threading
 from pathlib import Path
-from typing import Optional
-
-from panoramic.cli.file_utils import delete_file, ensure_dir, write_yaml
+from typing import Any, Optional
+
+from panoramic.cli.file_utils import (
+    delete_file,
+    dump_yaml,
+    ensure_dir,
+    file_has_content,
+    write_yaml,
+    write_yaml_if_changed,
+)
+from panoramic.cli.local.transaction import FileTransaction
 from panoramic.cli.pano_model import (
     Actionable,
     PanoField,
@@ -15,17 +24,83 @@ from panoramic.cli.transform.pano_transform import CompiledTransform, PanoTransf
 logger = logging.getLogger(__name__)
 
 
+class WriteReport:
+    """Summary of files written by FileWriter."""
+
+    written: int
+    skipped: int
+    bytes_written: int
+
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+    def record(self, bytes_written: Optional[int]):
+        """Record outcome of single write, None means the write was skipped. Safe to call from multiple threads."""
+        with self._lock:
+            if bytes_written is None:
+                self.skipped += 1
+            else:
+                self.written += 1
+                self.bytes_written += bytes_written
+
+    def __str__(self) -> str:
+        return f'{self.written} files written ({self.bytes_written} bytes), {self.skipped} unchanged files skipped'
+
+
 class FileWriter:
     """Responsible for writing data to local filesystem."""
 
     cwd: Path
-
-    def __init__(self, *, cwd: Optional[Path] = None):
+    skip_unchanged: bool
+    report: WriteReport
+    transaction: Optional[FileTransaction]
+
+    def __init__(self, *, cwd: Optional[Path] = None, skip_unchanged: bool = False):
+        """
+        When skip_unchanged is set, files with content identical to the serialized
+        object are not rewritten and every write is recorded in the report.
+        """
         if cwd is None:
             cwd = Path.cwd()
 
         # TODO: bunch of methods below ignore self.cwd
         self.cwd = cwd
+        self.skip_unchanged = skip_unchanged
+        self.report = WriteReport()
+        # when set, writes and deletes are staged in the transaction instead of being applied right away
+        self.transaction = None
+
+    def _write_yaml(self, path: Path, data: Any):
+        if self.transaction is not None:
+            self._stage_yaml(self.transaction, path, data)
+        elif self.skip_unchanged:
+            self.report.record(write_yaml_if_changed(path, data))
+        else:
+            write_yaml(path, data)
+
+    def _stage_yaml(self, transaction: FileTransaction, path: Path, data: Any):
+        text = dump_yaml(data)
+        assert text is not None
+        encoded_text = text.encode('utf-8')
+
+        if self.skip_unchanged and file_has_content(path, encoded_text):
+            logger.debug(f'Skip unchanged yaml {path}')
+            self.report.record(None)
+            return
+
+        logger.debug(f'Stage yaml {path}')
+        transaction.write_text(path, text)
+        if self.skip_unchanged:
+            self.report.record(len(encoded_text))
+
+    def _delete_file(self, path: Path):
+        if self.transaction is not None:
+            self.transaction.delete(path)
+        else:
+            delete_file(path)
 
     def delete(self, actionable: Actionable):
         """Delete data from local filesystem."""
@@ -55,14 +130,14 @@ class FileWriter:
         package = package if package is not None else data_source.dataset_slug
         path = self.cwd / package / PresetFileName.DATASET_YAML.value
         logger.debug(f'About to write data source {data_source.id}')
-        write_yaml(path, data_source.to_dict())
+        self._write_yaml(path, data_source.to_dict())
 
     def delete_data_source(self, data_source: PanoVirtualDataSource):
         """Delete data source from local filesystem."""
         assert data_source.package is not None
         path = self.cwd / data_source.package / PresetFileName.DATASET_YAML.value
         logger.debug(f'About to delete data source {data_source.id}')
-        delete_file(path)
+        self._delete_file(path)
 
     def write_empty_model(self, model_name: str):
         """Create an empty model file."""
@@ -80,13 +155,13 @@ class FileWriter:
         """Write scanned model to local filesystem."""
         path = Paths.scanned_dir() / f'{model.model_name}{FileExtension.MODEL_YAML.value}'
         logger.debug(f'About to write model {model.id}')
-        write_yaml(path, model.to_dict())
+        self._write_yaml(path, model.to_dict())
 
     def write_scanned_field(self, field: PanoField):
         """"Write scanned field to local filesystem."""
         path = Paths.scanned_fields_dir() / f'{field.slug}{FileExtension.FIELD_YAML.value}'
         logger.debug(f'About to write field {field.slug}')
-        write_yaml(path, field.to_dict())
+        self._write_yaml(path, field.to_dict())
 
     def write_model(self, model: PanoModel, *, package: Optional[str] = None, file_name: Optional[str] = None):
         """Write model to local filesystem."""
@@ -97,7 +172,7 @@ class FileWriter:
             file_name = f'{model.model_name}{FileExtension.MODEL_YAML.value}'
         path = self.cwd / package_name / file_name
         logger.debug(f'About to write model {model.id}')
-        write_yaml(path, model.to_dict())
+        self._write_yaml(path, model.to_dict())
 
     def delete_model(self, model: PanoModel):
         """Delete model from local filesystem."""
@@ -105,7 +180,7 @@ class FileWriter:
         assert model.file_name is not None
         path = self.cwd / model.package / model.file_name
         logger.debug(f'About to delete model {model.id}')
-        delete_file(path)
+        self._delete_file(path)
 
     def write_field(self, field: PanoField, *, package: Optional[str] = None, file_name: Optional[str] = None):
         """Write model to local filesystem."""
@@ -121,7 +196,7 @@ class FileWriter:
             path = Paths.fields_dir(self.cwd) / file_name
 
         logger.debug(f'About to write field {field.id}')
-        write_yaml(path, field.to_dict())
+        self._write_yaml(path, field.to_dict())
 
     def delete_field(self, field: PanoField):
         """Delete field from local filesystem."""
@@ -135,13 +210,13 @@ class FileWriter:
             path = Paths.fields_dir(self.cwd) / field.file_name
 
         logger.debug(f'About to delete field {field.id}')
-        delete_file(path)
+        self._delete_file(path)
 
     def write_transform(self, transform: PanoTransform):
         file_name = f'{transform.name}{FileExtension.TRANSFORM_YAML.value}'
         path = Paths.transforms_dir() / file_name
 
-        write_yaml(path, transform.to_dict())
+        self._write_yaml(path, transform.to_dict())
 
     def write_compiled_transform(self, compiled_transform: CompiledTransform) -> Path:
         file_name = f'{compiled_transform.transform.name}{FileExtension.COMPILED_TRANSFORM_SQL.value}'
@@ -153,7 +228,7 @@ class FileWriter:
             f.writelines(
                 [
                     '-- Compiled with parameters:\n' f'-- \tcompany_id: {compiled_transform.company_id}\n' '\n',
-                    compiled_transform.compiled_query,
+                    ';\n\n'.join(compiled_transform.compiled_queries),
                 ]
             )
 
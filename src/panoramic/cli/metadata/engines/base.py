@@ -1,6 +1,7 @@
 import abc
-from typing import Dict
+from typing import Dict, Mapping, Set
 
+from panoramic.cli.husky.core.taxonomy.enums import ValidationType
 from panoramic.cli.pano_model import PanoModel, PanoModelField
 
 
@@ -26,7 +27,28 @@ class BaseScanner(metaclass=abc.ABCMeta):
         """Map of scanned table columns"""
         return self._model_fields
 
+    def _add_column(self, model_name: str, column_name: str, data_type: ValidationType):
+        """Add scanned column to its model"""
+        if model_name not in self._models:
+            # create a new model, if no model with the name is found
+            model = PanoModel(model_name=model_name, fields=[], joins=[], identifiers=[])
+            self._models[model_name] = model
+
+        # create the attribute
+        field = PanoModelField(
+            field_map=[column_name.lower()], data_reference=f'"{column_name}"', data_type=data_type.value
+        )
+        if column_name not in self._model_fields:
+            self._model_fields[column_name] = field
+
+        self._models[model_name].fields.append(field)
+
     @abc.abstractmethod
     def scan(self, *, force_reset: bool = False):
         """Scan the database storage"""
         pass
+
+    @abc.abstractmethod
+    def scan_columns(self, columns_by_model: Mapping[str, Set[str]], *, force_reset: bool = False):
+        """Scan only the given columns of the given models (tables)"""
+        pass
@@ -1,14 +1,14 @@
 from datetime import date, datetime, time
-from typing import cast
+from typing import Any, Dict, Mapping, Set, cast
 
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.sql.type_api import TypeEngine
 from tqdm import tqdm
 
 from panoramic.cli.connection import Connection
 from panoramic.cli.husky.core.taxonomy.enums import ValidationType
 from panoramic.cli.metadata.engines.with_connection import WithConnection
-from panoramic.cli.pano_model import PanoModel, PanoModelField
 
 
 class InspectorScanner(WithConnection):
@@ -25,38 +25,41 @@ class InspectorScanner(WithConnection):
         time: ValidationType.datetime,
     }
 
-    def scan(self, *, force_reset: bool = False):
+    def _get_inspector(self) -> Inspector:
         connection = self._get_connection()
+        engine = Connection.get_connection_engine(connection)
+        return Inspector.from_engine(engine)
+
+    def _add_inspected_column(self, model_name: str, column: Dict[str, Any]):
+        # determine data type
+        data_type = self._DATA_TYPES_MAP.get(cast(TypeEngine, column['type']).python_type, ValidationType.text)
+        self._add_column(model_name, column['name'], data_type)
+
+    def scan(self, *, force_reset: bool = False):
+        inspector = self._get_inspector()
 
         if force_reset:
             self.reset()
 
-        engine = Connection.get_connection_engine(connection)
-        inspector = Inspector.from_engine(engine)
         # list all available tables
         for schema_name in tqdm(inspector.get_schema_names()):
             for table_name in tqdm(inspector.get_table_names(schema=schema_name)):
-                model_name = table_name
-
                 for column in tqdm(inspector.get_columns(table_name=table_name)):
-                    column_name = column['name']
-                    data_type_raw = column['type']
-
-                    if model_name not in self._models:
-                        # create a new model, if no model with the name is found
-                        model = PanoModel(model_name=model_name, fields=[], joins=[], identifiers=[])
-                        self._models[model_name] = model
-
-                    # determine data type
-                    data_type = self._DATA_TYPES_MAP.get(
-                        cast(TypeEngine, data_type_raw).python_type, ValidationType.text
-                    )
-
-                    # create the attribute
-                    field = PanoModelField(
-                        field_map=[column_name.lower()], data_reference=f'"{column_name}"', data_type=data_type.value
-                    )
-                    if column_name not in self._model_fields:
-                        self._model_fields[column_name] = field
-
-                    self._models[model_name].fields.append(field)
+                    self._add_inspected_column(table_name, column)
+
+    def scan_columns(self, columns_by_model: Mapping[str, Set[str]], *, force_reset: bool = False):
+        inspector = self._get_inspector()
+
+        if force_reset:
+            self.reset()
+
+        # inspect only requested tables, without listing all schemas and tables first
+        for table_name, column_names in columns_by_model.items():
+            try:
+                columns = inspector.get_columns(table_name=table_name)
+            except NoSuchTableError:
+                continue
+
+            for column in columns:
+                if column['name'] in column_names:
+                    self._add_inspected_column(table_name, column)
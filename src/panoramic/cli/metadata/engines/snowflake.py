@@ -1,11 +1,11 @@
-from typing import Dict
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Mapping, Set, Tuple
 
 from tqdm import tqdm
 
 from panoramic.cli.connection import Connection
 from panoramic.cli.husky.core.taxonomy.enums import ValidationType
 from panoramic.cli.metadata.engines.with_connection import WithConnection
-from panoramic.cli.pano_model import PanoModel, PanoModelField
 
 
 class SnowflakeScanner(WithConnection):
@@ -68,26 +68,61 @@ class SnowflakeScanner(WithConnection):
                 '''
 
             rows = Connection.execute(query, connection)
+            self._add_column_rows(db_name, tqdm(rows))
 
-            for col_row in tqdm(rows):
-                # generate correct model name
-                model_name = '.'.join([db_name, col_row['table_schema'], col_row['table_name']])
-                column_name = col_row['column_name']
-                data_type_raw = col_row['data_type']
-
-                if model_name not in self._models:
-                    # create a new model, if no model with the name is found
-                    model = PanoModel(model_name=model_name, fields=[], joins=[], identifiers=[])
-                    self._models[model_name] = model
+    def scan_columns(self, columns_by_model: Mapping[str, Set[str]], *, force_reset: bool = False):
+        """Scan only given columns, using single query per database"""
+        connection = self._get_connection()
 
-                # determine data type
-                data_type = self._SF_DATA_TYPES_MAP.get(data_type_raw, ValidationType.text)
+        if force_reset:
+            self.reset()
 
-                # create the attribute
-                field = PanoModelField(
-                    field_map=[column_name.lower()], data_reference=f'"{column_name}"', data_type=data_type.value
+        # model names of scanned Snowflake tables are in format <database>.<schema>.<table>
+        columns_by_table_by_db: Dict[str, Dict[Tuple[str, str], Set[str]]] = defaultdict(dict)
+        for model_name, column_names in columns_by_model.items():
+            name_parts = model_name.split('.')
+            if len(name_parts) != 3:
+                continue
+            db_name, schema_name, table_name = name_parts
+            columns_by_table_by_db[db_name][(schema_name, table_name)] = column_names
+
+        for db_name, columns_by_table in columns_by_table_by_db.items():
+            conditions = []
+            params: Dict[str, Any] = {}
+            for table_idx, ((schema_name, table_name), column_names) in enumerate(columns_by_table.items()):
+                column_param_names = []
+                for column_idx, column_name in enumerate(sorted(column_names)):
+                    column_param_name = f'column_{table_idx}_{column_idx}'
+                    column_param_names.append(f':{column_param_name}')
+                    # unquoted identifiers are stored in upper case, so data references are matched case-insensitively
+                    params[column_param_name] = column_name.upper()
+
+                params[f'schema_{table_idx}'] = schema_name
+                params[f'table_{table_idx}'] = table_name
+                conditions.append(
+                    f'(table_schema = :schema_{table_idx} AND table_name = :table_{table_idx} '
+                    f'AND UPPER(column_name) IN ({", ".join(column_param_names)}))'
                 )
-                if column_name not in self._model_fields:
-                    self._model_fields[column_name] = field
 
-                self._models[model_name].fields.append(field)
+            # fetch metadata only about requested columns
+            query = f'''
+                SELECT
+                    table_schema, table_name, column_name, data_type
+                FROM
+                    {db_name}.INFORMATION_SCHEMA.COLUMNS
+                WHERE
+                    {" OR ".join(conditions)}
+                ORDER BY
+                    table_schema, table_name, column_name
+                '''
+
+            rows = Connection.execute(query, connection, params)
+            self._add_column_rows(db_name, rows)
+
+    def _add_column_rows(self, db_name: str, rows: Iterable[Mapping[str, Any]]):
+        for col_row in rows:
+            # generate correct model name
+            model_name = '.'.join([db_name, col_row['table_schema'], col_row['table_name']])
+            # determine data type
+            data_type = self._SF_DATA_TYPES_MAP.get(col_row['data_type'], ValidationType.text)
+            self._add_column(model_name, col_row['column_name'], data_type)
@@ -44,6 +44,22 @@ class Paths:
     def transforms_compiled_dir():
         return Path.cwd() / SystemDirectory.TRANSFORMS.value / '.compiled'
 
+    @staticmethod
+    def cache_dir() -> Path:
+        return Path.cwd() / SystemDirectory.CACHE.value
+
+    @staticmethod
+    def validation_cache_file() -> Path:
+        return Paths.cache_dir() / PresetFileName.VALIDATION_CACHE.value
+
+    @staticmethod
+    def calculation_cache_file() -> Path:
+        return Paths.cache_dir() / PresetFileName.CALCULATION_CACHE.value
+
+    @staticmethod
+    def transform_fingerprints_file() -> Path:
+        return Paths.cache_dir() / PresetFileName.TRANSFORM_FINGERPRINTS.value
+
     @staticmethod
     def dataset_schema_file() -> Path:
         with importlib_resources.path(panoramic.cli.schemas, PresetFileName.DATASET_SCHEMA.value) as path:
@@ -86,9 +102,13 @@ class PresetFileName(Enum):
     FIELD_SCHEMA = 'field.schema.json'
     DATASET_SCHEMA = 'dataset.schema.json'
     CONTEXT_SCHEMA = 'context.schema.json'
+    VALIDATION_CACHE = 'validation.json'
+    CALCULATION_CACHE = 'calculations.json'
+    TRANSFORM_FINGERPRINTS = 'transforms.json'
 
 
 class SystemDirectory(Enum):
     SCANNED = 'scanned'
     TRANSFORMS = 'transforms'
     FIELDS = 'fields'
+    CACHE = '.pano_cache'
@@ -0,0 +1,268 @@
+import json
+import logging
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from panoramic.cli.__version__ import __version__
+from panoramic.cli.errors import MissingFieldFileError, OrphanFieldFileError
+from panoramic.cli.file_utils import write_text_atomic
+from panoramic.cli.husky.core.taxonomy.constants import NAMESPACE_DELIMITER
+from panoramic.cli.husky.core.tel.tel import Tel
+from panoramic.cli.pano_model import PanoField, PanoModel
+from panoramic.cli.state import VirtualState
+
+logger = logging.getLogger(__name__)
+
+
+class ModelReference:
+    """Attribute of a model mapping its data reference to the field."""
+
+    package: str
+    model_name: str
+    data_reference: str
+    identifier: bool
+
+    def __init__(self, *, package: str, model_name: str, data_reference: str, identifier: bool):
+        self.package = package
+        self.model_name = model_name
+        self.data_reference = data_reference
+        self.identifier = identifier
+
+
+class CalculationReference:
+    """Calculation of another field using the field."""
+
+    package: Optional[str]
+    field_slug: str
+    calculation: str
+
+    def __init__(self, *, package: Optional[str], field_slug: str, calculation: str):
+        self.package = package
+        self.field_slug = field_slug
+        self.calculation = calculation
+
+
+class CalculationSlugsCache:
+    """
+    Field slugs used in calculations, persisted between runs.
+
+    Entries are keyed by the calculation itself, so only new or changed calculations are parsed again.
+    """
+
+    path: Optional[Path]
+
+    def __init__(self, *, path: Optional[Path] = None):
+        self.path = path
+        self._slugs_by_calculation: Dict[str, List[str]] = {}
+        self._used_calculations: Dict[str, List[str]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> 'CalculationSlugsCache':
+        """Load cache from file, starting with an empty cache when it is missing, broken or outdated."""
+        cache = cls(path=path)
+        try:
+            with path.open('r') as f:
+                data = json.load(f)
+            if data.get('version') == __version__:
+                cache._slugs_by_calculation = data['calculations']
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.debug(f'Failed to load calculation cache {path}', exc_info=True)
+
+        return cache
+
+    def save(self):
+        """Persist parsed calculations used in this run."""
+        if self.path is None:
+            return
+
+        data = {'version': __version__, 'calculations': self._used_calculations}
+        try:
+            write_text_atomic(self.path, json.dumps(data))
+        except OSError:
+            logger.debug(f'Failed to save calculation cache {self.path}', exc_info=True)
+
+    def used_slugs(self, calculation: str) -> List[str]:
+        """Slugs of fields used in the calculation, including their namespace. Invalid calculations use no fields."""
+        slugs = self._slugs_by_calculation.get(calculation)
+        if slugs is None:
+            try:
+                used_taxons = Tel.get_used_taxon_slugs_shallow(calculation)
+                slugs = sorted(used_taxons.all_slugs)
+            except Exception:
+                logger.debug(f'Failed to parse calculation {calculation}', exc_info=True)
+                slugs = []
+            self._slugs_by_calculation[calculation] = slugs
+
+        self._used_calculations[calculation] = slugs
+        return slugs
+
+
+class ReferenceIndex:
+    """
+    Index of references to fields from models and calculations of other fields.
+
+    Index is built from the local state once per command and it is not updated afterwards, so looking up
+    usages of a field or checking for orphaned and missing field files does not scan all models.
+    Calculations are parsed only when their references are looked up for the first time.
+    """
+
+    def __init__(self, *, calculation_cache: Optional[CalculationSlugsCache] = None):
+        self._calculation_cache = calculation_cache if calculation_cache is not None else CalculationSlugsCache()
+        # field slug -> attributes of models mapped to it
+        self._model_references: Dict[str, List[ModelReference]] = defaultdict(list)
+        # package -> field slug -> number of model attributes in the package mapped to it
+        self._referenced_slugs_by_package: Dict[str, Counter] = defaultdict(Counter)
+        # package -> field slug -> field, None package holds company-scoped fields
+        self._fields_by_package: Dict[Optional[str], Dict[str, PanoField]] = defaultdict(dict)
+        # field slug -> package of the field -> calculations using the field, built on first lookup
+        self._calculation_references: Optional[Dict[str, Dict[Optional[str], List[CalculationReference]]]] = None
+        # data source used as namespace of field slugs -> package with the data source
+        self._package_by_data_source: Dict[str, str] = {}
+
+    @classmethod
+    def from_state(
+        cls, state: VirtualState, calculation_cache: Optional[CalculationSlugsCache] = None
+    ) -> 'ReferenceIndex':
+        """Build index of all models and fields in the state."""
+        return cls.from_objects(state.fields, state.models, calculation_cache)
+
+    @classmethod
+    def from_objects(
+        cls,
+        fields: Iterable[PanoField],
+        models: Iterable[PanoModel],
+        calculation_cache: Optional[CalculationSlugsCache] = None,
+    ) -> 'ReferenceIndex':
+        index = cls(calculation_cache=calculation_cache)
+        for field in fields:
+            index._add_field(field)
+        for model in models:
+            index._add_model(model)
+        return index
+
+    @staticmethod
+    def _model_package(model: PanoModel) -> str:
+        # models always have a package
+        assert model.package is not None
+        return model.package
+
+    def _add_model(self, model: PanoModel):
+        package = self._model_package(model)
+        if model.virtual_data_source is not None:
+            self._package_by_data_source[model.virtual_data_source] = package
+        for model_field in model.fields:
+            for slug in model_field.field_map:
+                self._model_references[slug].append(
+                    ModelReference(
+                        package=package,
+                        model_name=model.model_name,
+                        data_reference=model_field.data_reference,
+                        identifier=slug in model.identifiers,
+                    )
+                )
+                self._referenced_slugs_by_package[package][slug] += 1
+
+    def _add_field(self, field: PanoField):
+        self._fields_by_package[field.package][field.slug] = field
+        if field.package is not None and field.data_source is not None:
+            self._package_by_data_source[field.data_source] = field.package
+
+    def _resolve_slug(self, slug: str) -> Tuple[Optional[str], str]:
+        """Package and slug of the field with the namespaced slug, None package for company-scoped fields."""
+        if NAMESPACE_DELIMITER not in slug:
+            return None, slug
+
+        namespace, slug = slug.split(NAMESPACE_DELIMITER, 1)
+        return self._package_by_data_source.get(namespace, namespace), slug
+
+    def _build_calculation_references(self) -> Dict[str, Dict[Optional[str], List[CalculationReference]]]:
+        references: Dict[str, Dict[Optional[str], List[CalculationReference]]] = defaultdict(lambda: defaultdict(list))
+        for fields in self._fields_by_package.values():
+            for field in fields.values():
+                if field.calculation is None:
+                    continue
+                for used_slug in self._calculation_cache.used_slugs(field.calculation):
+                    package, slug = self._resolve_slug(used_slug)
+                    # field from the same dataset takes precedence over company-scoped field
+                    if package is None and field.package is not None and slug in self._fields_by_package[field.package]:
+                        package = field.package
+                    references[slug][package].append(
+                        CalculationReference(
+                            package=field.package, field_slug=field.slug, calculation=field.calculation
+                        )
+                    )
+        return references
+
+    def model_references(self, slug: str) -> List[ModelReference]:
+        """Attributes of models mapped to the field, namespaced slug limits them to the dataset of the field."""
+        package, slug = self._resolve_slug(slug)
+        references = self._model_references.get(slug, [])
+        if package is None:
+            return references
+
+        return [reference for reference in references if reference.package == package]
+
+    def calculation_references(self, slug: str) -> List[CalculationReference]:
+        """Calculations of fields using the field, namespaced slug limits them to the dataset of the field."""
+        if self._calculation_references is None:
+            self._calculation_references = self._build_calculation_references()
+
+        package, slug = self._resolve_slug(slug)
+        references_by_package = self._calculation_references.get(slug, {})
+        if package is not None:
+            return references_by_package.get(package, [])
+
+        # calculation can use fields with the same slug from several packages
+        unique_references = {
+            (reference.package, reference.field_slug): reference
+            for references in references_by_package.values()
+            for reference in references
+        }
+        return list(unique_references.values())
+
+    def is_orphaned(self, field: PanoField) -> bool:
+        """Dataset-scoped field without calculation is orphaned when no model in its dataset maps to it."""
+        if field.package is None or field.calculation is not None:
+            return False
+
+        return self._referenced_slugs_by_package[field.package][field.slug] == 0
+
+    def orphaned_fields(self, package: str) -> List[PanoField]:
+        """Fields in the package not used by any model."""
+        return [field for field in self._fields_by_package[package].values() if self.is_orphaned(field)]
+
+    def missing_field_slugs(self, package: str) -> List[str]:
+        """Slugs mapped by models in the package without definition in the package."""
+        fields = self._fields_by_package[package]
+        return [slug for slug in self._referenced_slugs_by_package[package] if slug not in fields]
+
+    def orphaned_field_errors(self, package: str) -> List[OrphanFieldFileError]:
+        return [
+            OrphanFieldFileError(field_slug=field.slug, dataset_slug=package) for field in self.orphaned_fields(package)
+        ]
+
+    def missing_field_errors(self, package: str) -> List[MissingFieldFileError]:
+        errors = []
+        for slug in self.missing_field_slugs(package):
+            # take one model for every field
+            reference = self._last_model_reference(slug, package)
+            errors.append(
+                MissingFieldFileError(
+                    field_slug=slug,
+                    dataset_slug=package,
+                    data_reference=reference.data_reference,
+                    identifier=reference.identifier,
+                    model_name=reference.model_name,
+                )
+            )
+        return errors
+
+    def _last_model_reference(self, slug: str, package: str) -> ModelReference:
+        return next(r for r in reversed(self._model_references[slug]) if r.package == package)
+
+    def usages(self, slug: str) -> Tuple[List[ModelReference], List[CalculationReference]]:
+        """All references to the field."""
+        return self.model_references(slug), self.calculation_references(slug)
@@ -1,7 +1,8 @@
 import itertools
 import logging
+import re
 from collections import defaultdict
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from panoramic.cli.errors import MissingFieldFileError
 from panoramic.cli.husky.common.enum import EnumHelper
@@ -14,6 +15,8 @@ from panoramic.cli.pano_model import Aggregation, PanoField, PanoModel
 
 logger = logging.getLogger(__name__)
 
+_COLUMN_REFERENCE_RE = re.compile(r'^"(?P<quoted>[^"]+)"$|^(?P<plain>[A-Za-z_][A-Za-z0-9_$]*)$')
+
 
 def _group_errors_by_column(
     errors: Sequence[MissingFieldFileError],
@@ -25,6 +28,24 @@ def _group_errors_by_column(
     return dict(errors_by_column)
 
 
+def column_name_from_data_reference(data_reference: str) -> Optional[str]:
+    """Column name for data references pointing directly to a column, None for expressions."""
+    match = _COLUMN_REFERENCE_RE.match(data_reference.strip())
+    if match is None:
+        return None
+    return match.group('quoted') or match.group('plain')
+
+
+def columns_by_model_for_errors(errors: Sequence[MissingFieldFileError]) -> Dict[str, Set[str]]:
+    """Group column names referenced by missing field files by model name (table)."""
+    columns_by_model: Dict[str, Set[str]] = defaultdict(set)
+    for error in errors:
+        column_name = column_name_from_data_reference(error.data_reference)
+        if column_name is not None:
+            columns_by_model[error.model_name].add(column_name)
+    return dict(columns_by_model)
+
+
 def scan_fields_for_errors(
     errors: Sequence[MissingFieldFileError], loaded_models: Dict[str, PanoModel]
 ) -> List[PanoField]:
@@ -0,0 +1,184 @@
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+
+from panoramic.cli.errors import TelValidationError, ValidationError
+from panoramic.cli.husky.core.errors import BaseDieselException
+from panoramic.cli.husky.core.federated.model.models import FdqModelAttribute
+from panoramic.cli.husky.core.federated.model.tel.data_structures import (
+    AttributeValidationTelVisitorParams,
+)
+from panoramic.cli.husky.core.federated.model.tel.visitor import (
+    AttributeValidationTelVisitor,
+)
+from panoramic.cli.husky.core.taxonomy.enums import TaxonTypeEnum
+from panoramic.cli.husky.core.taxonomy.getters import (
+    Taxonomy,
+    UsedTaxons,
+    get_taxon_tel_metadata,
+)
+from panoramic.cli.husky.core.taxonomy.models import Taxon, TaxonTelMetadata
+from panoramic.cli.husky.core.tel.tel_dialect import ModelTelDialect, TaxonTelDialect
+from panoramic.cli.husky.core.virtual_state.mappers import FieldMapper
+from panoramic.cli.husky.service.context import SNOWFLAKE_HUSKY_CONTEXT
+from panoramic.cli.pano_model import PanoField, PanoModel
+from panoramic.cli.paths import Paths
+from panoramic.cli.state import VirtualState
+from panoramic.cli.utils.executors import get_pool_executor
+
+logger = logging.getLogger(__name__)
+
+MIN_EXPRESSIONS_PER_WORKER = 200
+"""Expressions are validated in worker processes only when there are enough of them to outweigh starting workers"""
+
+_TaxonResults = Dict[str, Tuple[Optional[TaxonTelMetadata], List[str]]]
+_ModelResults = List[Tuple[Optional[str], str, str, List[str]]]
+
+
+def _validate_calculation(taxon: Taxon, calculation: str) -> List[str]:
+    """Type-check calculation of the taxon, the same way it is checked when rendering a query."""
+    used_taxons = UsedTaxons.in_taxon_definition(taxon)
+    root_context, validation_context = TaxonTelDialect().setup_tel_contexts(
+        SNOWFLAKE_HUSKY_CONTEXT,
+        used_taxons.all_taxons,
+        taxon.aggregation,
+        taxon_slug=taxon.slug,
+        taxon_type=TaxonTypeEnum(taxon.taxon_type),
+    )
+    tel_expression = TaxonTelDialect.visit(calculation, root_context)
+    tel_expression.validate(validation_context)
+    return sorted(validation_context.errors)
+
+
+def _check_taxon(taxon: Taxon) -> Tuple[Optional[TaxonTelMetadata], List[str]]:
+    """Validate calculation of the taxon and calculate its TEL metadata when it is valid."""
+    try:
+        errors = _validate_calculation(taxon, taxon.calculation) if taxon.calculation else []
+        if len(errors) > 0:
+            return None, errors
+
+        return get_taxon_tel_metadata(taxon), []
+    except BaseDieselException as e:
+        # unknown taxons, syntax errors and cyclic references
+        return None, [str(e)]
+    except Exception as e:
+        logger.debug(f'Failed to validate calculation of {taxon.slug}', exc_info=True)
+        return None, [f'Unexpected error - {e}']
+
+
+def _check_model(model: PanoModel) -> _ModelResults:
+    """Validate TEL expressions in data references of the model, including references to other fields of the model."""
+    attributes = [FdqModelAttribute(data_reference=f.data_reference, field_map=f.field_map) for f in model.fields]
+    available_taxon_slugs = {slug for attribute in attributes for slug in attribute.field_map}
+
+    results = []
+    for attribute in attributes:
+        errors = []
+        try:
+            tree = ModelTelDialect.parse(attribute.data_reference)
+            taxon_slug = next(filter(None, attribute.field_map), None)
+            if taxon_slug is not None:
+                visitor = AttributeValidationTelVisitor(AttributeValidationTelVisitorParams(taxon_slug, attributes))
+                visitor.visit(tree)
+                missing_taxon_slugs = visitor.result.used_taxon_slugs - available_taxon_slugs
+                if len(missing_taxon_slugs) > 0:
+                    errors.append(f'{", ".join(sorted(missing_taxon_slugs))} not available in this model')
+        except BaseDieselException as e:
+            errors.append(str(e))
+
+        if len(errors) > 0:
+            results.append((model.package, model.model_name, attribute.data_reference, errors))
+
+    return results
+
+
+def _check_expressions(
+    taxons: List[Taxon], taxon_slugs: List[str], models: List[PanoModel]
+) -> Tuple[_TaxonResults, _ModelResults]:
+    """Validate calculations of the given taxons and data references of the given models. Runs in a worker process."""
+    Taxonomy.preload_taxons(taxons)
+    taxons_by_slug = {taxon.slug: taxon for taxon in taxons}
+
+    taxon_results = {slug: _check_taxon(taxons_by_slug[slug]) for slug in taxon_slugs}
+    model_results = [result for model in models for result in _check_model(model)]
+    return taxon_results, model_results
+
+
+def _get_field_path(field: PanoField) -> Path:
+    package_dir = Path.cwd() / field.package if field.package is not None else Path.cwd()
+    return Paths.fields_dir(package_dir) / (field.file_name or f'{field.slug}.field.yaml')
+
+
+def _get_model_path(model: PanoModel) -> Path:
+    return Path.cwd() / (model.package or '') / (model.file_name or f'{model.model_name}.model.yaml')
+
+
+def validate_tel(state: VirtualState) -> Tuple[List[Taxon], List[ValidationError]]:
+    """
+    Parse and type-check TEL expressions in field calculations and model data references.
+
+    Expressions are checked in parallel. Returned taxons have precalculated TEL metadata, so they can be
+    preloaded to taxonomy without parsing the calculations again.
+    """
+    errors: List[ValidationError] = []
+    fields_by_taxon_slug: Dict[str, PanoField] = {}
+    taxons = []
+    for field in state.fields:
+        try:
+            taxon = FieldMapper.to_husky(field)
+        except PydanticValidationError as e:
+            errors.append(
+                TelValidationError(path=_get_field_path(field), subject=f'field {field.slug}', errors=[str(e)])
+            )
+            continue
+
+        fields_by_taxon_slug[taxon.slug] = field
+        taxons.append(taxon)
+
+    taxon_slugs = [taxon.slug for taxon in taxons]
+    expressions_count = len(taxon_slugs) + sum(len(model.fields) for model in state.models)
+    workers_count = max(1, min(os.cpu_count() or 1, math.ceil(expressions_count / MIN_EXPRESSIONS_PER_WORKER)))
+
+    taxon_results: _TaxonResults = {}
+    model_results: _ModelResults = []
+    with get_pool_executor(workers_count) as executor:
+        futures = [
+            executor.submit(
+                _check_expressions, taxons, taxon_slugs[idx::workers_count], state.models[idx::workers_count]
+            )
+            for idx in range(workers_count)
+        ]
+        for future in futures:
+            worker_taxon_results, worker_model_results = future.result()
+            taxon_results.update(worker_taxon_results)
+            model_results.extend(worker_model_results)
+
+    for taxon in taxons:
+        metadata, taxon_errors = taxon_results[taxon.slug]
+        taxon.tel_metadata = metadata
+        if len(taxon_errors) > 0:
+            field = fields_by_taxon_slug[taxon.slug]
+            errors.append(
+                TelValidationError(
+                    path=_get_field_path(field), subject=f'calculation of field {field.slug}', errors=taxon_errors
+                )
+            )
+
+    # models with the same name can be in different packages
+    models_by_key = {(model.package, model.model_name): model for model in state.models}
+    for package, model_name, data_reference, model_errors in sorted(
+        model_results, key=lambda result: (result[0] or '', result[1], result[2])
+    ):
+        errors.append(
+            TelValidationError(
+                path=_get_model_path(models_by_key[(package, model_name)]),
+                subject=f'data reference {data_reference} of model {model_name}',
+                errors=model_errors,
+            )
+        )
+
+    return taxons, errors
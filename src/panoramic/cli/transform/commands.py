@@ -1,17 +1,25 @@
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import click
 from tqdm import tqdm
 
 from panoramic.cli.config.companies import get_company_id
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
 from panoramic.cli.local.get import get_transforms
 from panoramic.cli.local.writer import FileWriter
 from panoramic.cli.paths import FileExtension, Paths
 from panoramic.cli.print import echo_error, echo_info
 from panoramic.cli.transform.compiler import TransformCompiler
 from panoramic.cli.transform.executor import TransformExecutor
-from panoramic.cli.transform.pano_transform import CompiledTransform, PanoTransform
+from panoramic.cli.transform.fingerprints import TransformFingerprints
+from panoramic.cli.transform.pano_transform import (
+    CompiledTransform,
+    PanoTransform,
+    TransformVerification,
+)
 
 
 def create_command():
@@ -33,6 +41,10 @@ def create_command():
 def exec_command(
     compile_only: bool = False,
     yes: bool = False,
+    parameterized: bool = False,
+    force: bool = False,
+    comment: bool = False,
+    verification: Optional[TransformVerification] = None,
 ):
     compiled_transforms: List[Tuple[CompiledTransform, Path]] = []
 
@@ -42,7 +54,16 @@ def exec_command(
         echo_info('No transforms found...')
         return
 
-    transform_compiler = TransformCompiler(get_company_id())
+    override_mapping_stage = None
+    if not compile_only:
+        connection = TransformExecutor.get_connection()
+        # large override mappings are loaded into staging tables, only possible with connection to the warehouse
+        if connection.get('url'):
+            override_mapping_stage = OverrideMappingStage(schema=connection.get('staging_schema'))
+
+    transform_compiler = TransformCompiler(
+        get_company_id(), verification=verification, override_mapping_stage=override_mapping_stage
+    )
 
     file_writer = FileWriter()
 
@@ -50,7 +71,7 @@ def exec_command(
     with tqdm(transforms_with_path) as compiling_bar:
         for transform, transform_path in compiling_bar:
             try:
-                compiled_transform = transform_compiler.compile(transform=transform)
+                compiled_transform = transform_compiler.compile(transform=transform, parameterized=parameterized)
                 compiled_transforms.append((compiled_transform, transform_path))
 
                 compiled_sql_path = file_writer.write_compiled_transform(compiled_transform)
@@ -63,18 +84,54 @@ def exec_command(
         echo_info('No transforms to execute...')
         return
 
-    if compile_only or not yes and not click.confirm('Do you want to execute transforms?'):
+    if compile_only:
+        return
+
+    fingerprints = TransformFingerprints.load(Paths.transform_fingerprints_file())
+
+    # views with the same compiled sql as the deployed ones would be replaced by identical views
+    transforms_to_execute = [
+        (compiled_transform, transform_path)
+        for compiled_transform, transform_path in compiled_transforms
+        if force or not fingerprints.is_deployed(compiled_transform, connection)
+    ]
+    skipped_count = len(compiled_transforms) - len(transforms_to_execute)
+
+    if len(transforms_to_execute) == 0:
+        echo_info(f'No changed transforms to execute, skipped {skipped_count} unchanged transforms...')
+        return
+
+    if not yes and not click.confirm(f'Do you want to execute {len(transforms_to_execute)} transforms?'):
         return
 
+    if override_mapping_stage is not None:
+        try:
+            TransformExecutor.load_override_mappings(override_mapping_stage)
+        except Exception as e:
+            echo_error(f'Failed to load override mappings into staging tables:\n  {str(e)}')
+            return
+
+    executed_count = 0
     echo_info('Executing transforms...')
-    with tqdm(compiled_transforms) as exec_bar:
+    with tqdm(transforms_to_execute) as exec_bar:
         for (compiled_transform, transform_path) in exec_bar:
+            transform_name = compiled_transform.transform.name
             try:
-                exec_bar.write(f'Executing: {compiled_transform.transform.name}')
+                exec_bar.write(f'Executing: {transform_name}')
 
-                TransformExecutor.execute(compiled_transform)
-                exec_bar.write(f'\u2713 {transform.name}')
+                TransformExecutor.execute(compiled_transform, comment=comment)
+                fingerprints.store(compiled_transform, connection)
+                executed_count += 1
+                exec_bar.write(f'\u2713 {transform_name}')
             except Exception as e:
                 exec_bar.write(
-                    f'\u2717 {transform.name} \nError: Failed to execute transform {transform_path}:\n  {str(e)}'
+                    f'\u2717 {transform_name} \nError: Failed to execute transform {transform_path}:\n  {str(e)}'
                 )
+
+    fingerprints.save()
+
+    failed_count = len(transforms_to_execute) - executed_count
+    echo_info(
+        f'Executed {executed_count} transforms, skipped {skipped_count} unchanged transforms, '
+        f'{failed_count} transforms failed'
+    )
@@ -1,25 +1,101 @@
+from typing import Optional, Tuple
+
 from requests import RequestException
 
 from panoramic.cli.errors import TransformCompileException
 from panoramic.cli.husky.core.federated.transform.models import TransformRequest
 from panoramic.cli.husky.federated.transform.service import TransformService
-from panoramic.cli.transform.pano_transform import CompiledTransform, PanoTransform
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
+from panoramic.cli.husky.service.helpers import RUNTIME_DIALECTS
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
+from panoramic.cli.transform.materialization import TransformMaterializer
+from panoramic.cli.transform.pano_transform import (
+    CompiledTransform,
+    PanoTransform,
+    TransformVerification,
+)
+from panoramic.cli.transform.verification import TransformVerifier
+
+FINGERPRINT_COMMENT_PREFIX = 'pano fingerprint: '
+"""Prefix of fingerprint of the compiled queries in comment on the transform target"""
 
 
 class TransformCompiler:
     company_id: str
+    verification: Optional[TransformVerification]
+    """Verification of transforms which do not set their own"""
+    override_mapping_stage: Optional[OverrideMappingStage]
+    """Stage collecting large override mappings of compiled transforms, which must be loaded before execution"""
 
-    def __init__(self, company_id: str):
+    def __init__(
+        self,
+        company_id: str,
+        verification: Optional[TransformVerification] = None,
+        override_mapping_stage: Optional[OverrideMappingStage] = None,
+    ):
         self.company_id = company_id
+        self.verification = verification
+        self.override_mapping_stage = override_mapping_stage
 
-    def compile(self, transform: PanoTransform) -> CompiledTransform:
+    def compile(self, transform: PanoTransform, parameterized: bool = False) -> CompiledTransform:
+        """
+        Compile transform to statements creating its target view or table.
+
+        Compiled query always has values inlined. When parameterized, the transform also carries statements
+        with bind parameters and their values, which are used for execution instead.
+        """
         try:
             transform_request = TransformRequest(fields=transform.fields, filter=transform.filters)
-            compiled_query, _ = TransformService.compile_transformation_request(transform_request, self.company_id)
-            create_view_statement = f"CREATE OR REPLACE VIEW {transform.target} AS ({compiled_query})"
+            if not parameterized:
+                compiled_query, query_runtime = TransformService.compile_transformation_request(
+                    transform_request, self.company_id, self.override_mapping_stage
+                )
+                materializer, verifier = self._create_materializer_and_verifier(transform, query_runtime)
+                compiled_transform = CompiledTransform(
+                    transform=transform,
+                    company_id=self.company_id,
+                    compiled_query=materializer.statement(compiled_query),
+                    setup_queries=materializer.setup_statements(compiled_query),
+                    correctness_query=verifier.query(),
+                    expected_columns=verifier.expected_columns(),
+                )
+            else:
+                (
+                    compiled_query,
+                    parameterized_query,
+                    parameters,
+                    query_runtime,
+                ) = TransformService.compile_parameterized_transformation_request(
+                    transform_request, self.company_id, self.override_mapping_stage
+                )
+                materializer, verifier = self._create_materializer_and_verifier(transform, query_runtime)
+                compiled_transform = CompiledTransform(
+                    transform=transform,
+                    company_id=self.company_id,
+                    compiled_query=materializer.statement(compiled_query),
+                    parameterized_query=materializer.statement(parameterized_query),
+                    parameters=parameters,
+                    setup_queries=materializer.setup_statements(compiled_query),
+                    parameterized_setup_queries=materializer.setup_statements(parameterized_query),
+                    correctness_query=verifier.query(),
+                    expected_columns=verifier.expected_columns(),
+                )
 
-            return CompiledTransform(
-                transform=transform, company_id=self.company_id, compiled_query=create_view_statement
+            compiled_transform.comment_query = materializer.comment_statement(
+                f'{FINGERPRINT_COMMENT_PREFIX}{compiled_transform.fingerprint}'
             )
+            return compiled_transform
         except RequestException as request_exception:
             raise TransformCompileException(transform.name).extract_request_id(request_exception)
+
+    def _create_materializer_and_verifier(
+        self, transform: PanoTransform, query_runtime: HuskyQueryRuntime
+    ) -> Tuple[TransformMaterializer, TransformVerifier]:
+        dialect = RUNTIME_DIALECTS[query_runtime]
+        column_names = TransformService.output_column_names(query_runtime, transform.fields)
+        return (
+            TransformMaterializer(transform, dialect, column_names),
+            TransformVerifier(transform, dialect, column_names, self.verification),
+        )
@@ -1,7 +1,15 @@
 import logging
+from typing import Any, Dict
 
 from panoramic.cli.connection import Connection
-from panoramic.cli.errors import ConnectionNotFound, TransformExecutionFailed
+from panoramic.cli.errors import (
+    ConnectionNotFound,
+    TransformExecutionFailed,
+    TransformVerificationFailed,
+)
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
 from panoramic.cli.transform.pano_transform import CompiledTransform
 
 logger = logging.getLogger(__name__)
@@ -9,21 +17,61 @@ logger = logging.getLogger(__name__)
 
 class TransformExecutor:
     @classmethod
-    def execute(cls, compiled_transform: CompiledTransform):
+    def get_connection(cls) -> Dict[str, Any]:
         try:
-            connection = Connection.get()
+            return Connection.get()
         except ValueError:
             raise ConnectionNotFound()
 
+    @classmethod
+    def load_override_mappings(cls, override_mapping_stage: OverrideMappingStage):
+        """Create staging tables of large override mappings used by the compiled transforms."""
+        connection = cls.get_connection()
+        override_mapping_stage.load(Connection.get_connection_engine(connection))
+
+    @classmethod
+    def execute(cls, compiled_transform: CompiledTransform, comment: bool = False):
+        """
+        Execute queries creating target of the transform and verify the target can be queried.
+
+        :param comment: Also record fingerprint of the compiled queries as comment on the target
+        """
+        connection = cls.get_connection()
+
         try:
             logger.debug(f'Executing transform {compiled_transform.transform.name}')
             # TODO: Consider moving into SQL Executor class that manages connection state
-            Connection.execute(sql=compiled_transform.compiled_query, connection=connection)
+            parameterized_queries = compiled_transform.parameterized_queries
+            if parameterized_queries is not None:
+                for query in parameterized_queries:
+                    Connection.execute(sql=query, connection=connection, parameters=compiled_transform.parameters)
+            else:
+                for query in compiled_transform.compiled_queries:
+                    Connection.execute(sql=query, connection=connection)
 
             logger.debug(f'Verifying transform {compiled_transform.transform.name}')
-            Connection.execute(sql=compiled_transform.correctness_query, connection=connection)
+            cls._verify(compiled_transform, connection)
+
+            if comment and compiled_transform.comment_query is not None:
+                Connection.execute(sql=compiled_transform.comment_query, connection=connection)
+        except TransformVerificationFailed:
+            raise
         except Exception:
             raise TransformExecutionFailed(
                 transform_name=compiled_transform.transform.name,
-                compiled_sql=compiled_transform.compiled_query,
+                compiled_sql=';\n\n'.join(compiled_transform.compiled_queries),
             )
+
+    @classmethod
+    def _verify(cls, compiled_transform: CompiledTransform, connection: Dict[str, Any]):
+        expected_columns = compiled_transform.expected_columns
+        if expected_columns is None:
+            Connection.execute(sql=compiled_transform.correctness_query, connection=connection)
+            return
+
+        rows = Connection.fetch_all(sql=compiled_transform.correctness_query, connection=connection)
+        # column names are case insensitive in information schema of some warehouses
+        existing_columns = {row[0].lower() for row in rows}
+        missing_columns = [column for column in expected_columns if column.lower() not in existing_columns]
+        if missing_columns:
+            raise TransformVerificationFailed(compiled_transform.transform.name, missing_columns)
@@ -0,0 +1,70 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from panoramic.cli.file_utils import content_hash, write_text_atomic
+from panoramic.cli.transform.pano_transform import (
+    CompiledTransform,
+    TransformMaterialization,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TransformFingerprints:
+    """
+    Fingerprints of transforms deployed to the warehouse, persisted between runs.
+
+    Entries are keyed by target of the transform and the connection it was deployed over, so transforms
+    deployed to another warehouse are not considered deployed.
+    """
+
+    path: Path
+
+    def __init__(self, *, path: Path):
+        self.path = path
+        self._fingerprints: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> 'TransformFingerprints':
+        """Load fingerprints from file, starting with no fingerprints when it is missing or broken."""
+        fingerprints = cls(path=path)
+        try:
+            with path.open('r') as f:
+                fingerprints._fingerprints = json.load(f)['fingerprints']
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.debug(f'Failed to load transform fingerprints {path}', exc_info=True)
+
+        return fingerprints
+
+    def save(self):
+        """Persist fingerprints of deployed transforms."""
+        try:
+            write_text_atomic(self.path, json.dumps({'fingerprints': self._fingerprints}))
+        except OSError:
+            logger.debug(f'Failed to save transform fingerprints {self.path}', exc_info=True)
+
+    @staticmethod
+    def _key(compiled_transform: CompiledTransform, connection: Dict[str, Any]) -> str:
+        # hash of connection url keeps credentials out of the file
+        connection_hash = content_hash(str(connection.get('url')).encode('utf-8'))
+        return f'{connection_hash}:{compiled_transform.transform.target}'
+
+    def is_deployed(self, compiled_transform: CompiledTransform, connection: Dict[str, Any]) -> bool:
+        """
+        Check whether executing the transform would not change its target.
+
+        Only views are considered, tables are filled with current data on every execution.
+        """
+        if compiled_transform.transform.materialization is not TransformMaterialization.VIEW:
+            return False
+
+        fingerprint: Optional[str] = self._fingerprints.get(self._key(compiled_transform, connection))
+        return fingerprint == compiled_transform.fingerprint
+
+    def store(self, compiled_transform: CompiledTransform, connection: Dict[str, Any]):
+        """Store fingerprint of the executed transform."""
+        self._fingerprints[self._key(compiled_transform, connection)] = compiled_transform.fingerprint
@@ -0,0 +1,126 @@
+from typing import Dict, List
+
+from sqlalchemy.engine.interfaces import Dialect
+
+from panoramic.cli.errors import InvalidTransformMaterialization
+from panoramic.cli.transform.pano_transform import (
+    PanoTransform,
+    TransformMaterialization,
+)
+
+_OPTIONS_DESCRIPTION_DIALECTS = {'bigquery'}
+"""Dialects storing comment of the object as its description option, COMMENT ON statement is used elsewhere"""
+
+_NEW_ROWS_ALIAS = 'new_rows'
+_EXISTING_ROWS_ALIAS = 'existing_rows'
+
+
+class TransformMaterializer:
+    """
+    Generates statements creating target of the transform from its compiled query.
+
+    Statements are generated for the given query, so they can wrap query with values inlined as well as query with
+    bind parameters. The compiled query is embedded into every statement which reads its rows.
+    """
+
+    def __init__(self, transform: PanoTransform, dialect: Dialect, column_names: Dict[str, str]):
+        """
+        :param transform: Transform to materialize
+        :param dialect: Dialect of the warehouse with the target
+        :param column_names: Names of columns in output of the transform query, keyed by field slug
+        """
+        self._transform = transform
+        self._dialect = dialect
+        self._column_names = column_names
+
+        if transform.materialization is TransformMaterialization.INCREMENTAL:
+            if transform.time_field is None and transform.unique_key is None:
+                raise InvalidTransformMaterialization(
+                    transform.name, 'incremental transform requires time_field or unique_key'
+                )
+            for field in [transform.time_field, transform.unique_key]:
+                if field is not None and field not in transform.fields:
+                    raise InvalidTransformMaterialization(transform.name, f'field {field} is not in transform fields')
+
+    def _column(self, field: str) -> str:
+        return self._dialect.identifier_preparer.quote(self._column_names[field])
+
+    def _max_time_query(self) -> str:
+        assert self._transform.time_field is not None
+        return f'(SELECT MAX({self._column(self._transform.time_field)}) FROM {self._transform.target})'
+
+    def _rows_query(self, query: str) -> str:
+        """
+        Rows of the transform query to write to the target
+
+        With time field, only rows of the last time in the target and newer are written, so rows arriving later
+        for the last time are not lost. They are merged by unique key, or the rows of the last time are deleted
+        from the target by setup statement and written again.
+        """
+        rows_query = f'SELECT * FROM ({query}) AS {_NEW_ROWS_ALIAS}'
+        if self._transform.time_field is None:
+            return rows_query
+
+        time_column = self._column(self._transform.time_field)
+        max_time_query = self._max_time_query()
+        # without unique key, maximum is already lowered by deleting rows of the last time
+        operator = '>=' if self._transform.unique_key is not None else '>'
+        # all rows are new when the target is empty
+        return (
+            f'{rows_query} WHERE {max_time_query} IS NULL '
+            f'OR {_NEW_ROWS_ALIAS}.{time_column} {operator} {max_time_query}'
+        )
+
+    def setup_statements(self, query: str) -> List[str]:
+        """Statements preparing the target, executed before the main statement"""
+        if self._transform.materialization is not TransformMaterialization.INCREMENTAL:
+            return []
+
+        target = self._transform.target
+        # empty table with columns of the transform, so new rows can be written on the first execution as well
+        statements = [
+            f'CREATE TABLE IF NOT EXISTS {target} AS SELECT * FROM ({query}) AS {_NEW_ROWS_ALIAS} WHERE 1 = 0'
+        ]
+        if self._transform.time_field is not None and self._transform.unique_key is None:
+            # rows of the last time may be incomplete, they are inserted again by the main statement
+            time_column = self._column(self._transform.time_field)
+            statements.append(f'DELETE FROM {target} WHERE {time_column} >= {self._max_time_query()}')
+
+        return statements
+
+    def statement(self, query: str) -> str:
+        """
+        Main statement writing result of the query to the target
+
+        CREATE OR REPLACE TABLE and MERGE are supported by Snowflake and BigQuery, the only runtimes of transforms.
+        """
+        target = self._transform.target
+        materialization = self._transform.materialization
+        if materialization is TransformMaterialization.TABLE:
+            return f'CREATE OR REPLACE TABLE {target} AS ({query})'
+
+        if materialization is TransformMaterialization.INCREMENTAL:
+            if self._transform.unique_key is None:
+                return f'INSERT INTO {target} {self._rows_query(query)}'
+
+            key_column = self._column(self._transform.unique_key)
+            columns = [self._column(field) for field in self._transform.fields]
+            return (
+                f'MERGE INTO {target} AS {_EXISTING_ROWS_ALIAS} USING ({self._rows_query(query)}) AS {_NEW_ROWS_ALIAS} '
+                f'ON {_EXISTING_ROWS_ALIAS}.{key_column} = {_NEW_ROWS_ALIAS}.{key_column} '
+                'WHEN MATCHED THEN UPDATE SET '
+                + ', '.join(f'{column} = {_NEW_ROWS_ALIAS}.{column}' for column in columns)
+                + f' WHEN NOT MATCHED THEN INSERT ({", ".join(columns)}) VALUES ('
+                + ', '.join(f'{_NEW_ROWS_ALIAS}.{column}' for column in columns)
+                + ')'
+            )
+
+        return f'CREATE OR REPLACE VIEW {target} AS ({query})'
+
+    def comment_statement(self, comment: str) -> str:
+        """Statement setting comment on the target"""
+        object_type = 'VIEW' if self._transform.materialization is TransformMaterialization.VIEW else 'TABLE'
+        comment_literal = "'{}'".format(comment.replace("'", "''"))
+        if self._dialect.name in _OPTIONS_DESCRIPTION_DIALECTS:
+            return f'ALTER {object_type} {self._transform.target} SET OPTIONS (description = {comment_literal})'
+        return f'COMMENT ON {object_type} {self._transform.target} IS {comment_literal}'
@@ -1,5 +1,37 @@
+from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from panoramic.cli.file_utils import content_hash
+
+
+class TransformMaterialization(Enum):
+    """How the transform target is created in the warehouse"""
+
+    VIEW = 'view'
+    """View computing the transform query on every read"""
+
+    TABLE = 'table'
+    """Table with result of the transform query, fully rebuilt on every execution"""
+
+    INCREMENTAL = 'incremental'
+    """Table with result of the transform query, only new or changed rows are written on every execution"""
+
+
+class TransformVerification(Enum):
+    """How the transform target is verified after it is created"""
+
+    LIMIT_ONE = 'limit_one'
+    """Select first row of the target"""
+
+    LIMIT_ZERO = 'limit_zero'
+    """Select no rows of the target, the query is planned but no data is read"""
+
+    EXPLAIN = 'explain'
+    """Only explain query selecting from the target"""
+
+    COLUMNS = 'columns'
+    """Compare columns of the target in information schema with the expected output columns"""
+
 
 class PanoTransform:
     API_VERSION = 'v1'
@@ -9,6 +41,13 @@ class PanoTransform:
     target: str
     datasets: Optional[List[str]]
     filters: Optional[str]
+    materialization: TransformMaterialization
+    time_field: Optional[str]
+    """Field of incremental transform, rows newer than all rows in the target are written"""
+    unique_key: Optional[str]
+    """Field of incremental transform, rows with existing key are updated instead of inserted"""
+    verification: Optional[TransformVerification]
+    """How the target is verified, default of the execution is used when not set"""
 
     def __init__(
         self,
@@ -17,12 +56,20 @@ class PanoTransform:
         target: str,
         datasets: Optional[List[str]] = None,
         filters: Optional[str] = None,
+        materialization: TransformMaterialization = TransformMaterialization.VIEW,
+        time_field: Optional[str] = None,
+        unique_key: Optional[str] = None,
+        verification: Optional[TransformVerification] = None,
     ):
         self.name = name
         self.fields = fields
         self.target = target
         self.datasets = datasets
         self.filters = filters
+        self.materialization = materialization
+        self.time_field = time_field
+        self.unique_key = unique_key
+        self.verification = verification
 
     @classmethod
     def from_dict(cls, inputs: Dict[str, Any]):
@@ -32,12 +79,26 @@ class PanoTransform:
             target=inputs['target'],
             datasets=inputs.get('datasets'),
             filters=inputs.get('filters'),
+            materialization=TransformMaterialization(
+                inputs.get('materialization', TransformMaterialization.VIEW.value)
+            ),
+            time_field=inputs.get('time_field'),
+            unique_key=inputs.get('unique_key'),
+            verification=TransformVerification(inputs['verification']) if 'verification' in inputs else None,
         )
 
     def to_dict(self) -> Dict[str, Any]:
         data = {'api_version': self.API_VERSION, 'name': self.name, 'fields': self.fields, 'target': self.target}
         if self.filters is not None:
             data['filters'] = self.filters
+        if self.materialization is not TransformMaterialization.VIEW:
+            data['materialization'] = self.materialization.value
+        if self.time_field is not None:
+            data['time_field'] = self.time_field
+        if self.unique_key is not None:
+            data['unique_key'] = self.unique_key
+        if self.verification is not None:
+            data['verification'] = self.verification.value
 
         return data
 
@@ -46,12 +107,60 @@ class CompiledTransform:
     transform: PanoTransform
     company_id: str
     compiled_query: str
+    parameterized_query: Optional[str]
+    parameters: Dict[str, Any]
+    setup_queries: List[str]
+    """Queries preparing the target, executed before the compiled query"""
+    parameterized_setup_queries: List[str]
+    comment_query: Optional[str]
+    """Query recording fingerprint of the compiled queries as comment on the target"""
+    expected_columns: Optional[List[str]]
+    """Columns of the target, returned by the correctness query when set"""
 
-    def __init__(self, transform: PanoTransform, company_id: str, compiled_query: str):
+    def __init__(
+        self,
+        transform: PanoTransform,
+        company_id: str,
+        compiled_query: str,
+        parameterized_query: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        setup_queries: Optional[List[str]] = None,
+        parameterized_setup_queries: Optional[List[str]] = None,
+        comment_query: Optional[str] = None,
+        correctness_query: Optional[str] = None,
+        expected_columns: Optional[List[str]] = None,
+    ):
         self.transform = transform
         self.company_id = company_id
         self.compiled_query = compiled_query
+        self.parameterized_query = parameterized_query
+        self.parameters = parameters or {}
+        self.setup_queries = setup_queries or []
+        self.parameterized_setup_queries = parameterized_setup_queries or []
+        self.comment_query = comment_query
+        self._correctness_query = correctness_query
+        self.expected_columns = expected_columns
+
+    @property
+    def compiled_queries(self) -> List[str]:
+        """All queries creating the target, with values inlined"""
+        return [*self.setup_queries, self.compiled_query]
+
+    @property
+    def parameterized_queries(self) -> Optional[List[str]]:
+        """All queries creating the target, with bind parameters"""
+        if self.parameterized_query is None:
+            return None
+        return [*self.parameterized_setup_queries, self.parameterized_query]
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the compiled queries, same for transforms creating the same target with the same content"""
+        return content_hash('\n'.join([self.company_id, *self.compiled_queries]).encode('utf-8'))
 
     @property
     def correctness_query(self) -> str:
+        """Query verifying the target was created correctly"""
+        if self._correctness_query is not None:
+            return self._correctness_query
         return f'SELECT * from {self.transform.target} limit 1'
@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine.interfaces import Dialect
+
+from panoramic.cli.errors import InvalidTransformVerification
+from panoramic.cli.transform.pano_transform import (
+    PanoTransform,
+    TransformVerification,
+)
+
+DEFAULT_VERIFICATIONS: Dict[str, TransformVerification] = {
+    'snowflake': TransformVerification.EXPLAIN,
+    'bigquery': TransformVerification.COLUMNS,
+}
+"""Default verification of transforms by dialect, LIMIT 0 is used elsewhere"""
+
+_UNSUPPORTED_VERIFICATIONS: Dict[str, List[TransformVerification]] = {'bigquery': [TransformVerification.EXPLAIN]}
+"""Verifications not supported by the dialect"""
+
+_IDENTIFIER_QUOTES = '"`'
+
+
+class TransformVerifier:
+    """
+    Generates query verifying target of the transform after it is created.
+
+    Verification is taken from the transform, then from the execution and then from defaults of the dialect.
+    """
+
+    verification: TransformVerification
+
+    def __init__(
+        self,
+        transform: PanoTransform,
+        dialect: Dialect,
+        column_names: Dict[str, str],
+        verification: Optional[TransformVerification] = None,
+    ):
+        """
+        :param transform: Transform to verify
+        :param dialect: Dialect of the warehouse with the target
+        :param column_names: Names of columns in output of the transform query, keyed by field slug
+        :param verification: Verification used when the transform does not set one
+        """
+        self._transform = transform
+        self._dialect = dialect
+        self._column_names = column_names
+        self.verification = (
+            transform.verification
+            or verification
+            or DEFAULT_VERIFICATIONS.get(dialect.name, TransformVerification.LIMIT_ZERO)
+        )
+
+        if self.verification in _UNSUPPORTED_VERIFICATIONS.get(dialect.name, []):
+            raise InvalidTransformVerification(
+                transform.name, f'{self.verification.value} is not supported by {dialect.name}'
+            )
+
+    def _literal(self, value: str) -> str:
+        return "'{}'".format(value.replace("'", "''"))
+
+    def _columns_query(self) -> str:
+        """Query selecting names of columns of the target from information schema"""
+        *schema_parts, table_name = [part.strip(_IDENTIFIER_QUOTES) for part in self._transform.target.split('.')]
+        if self._dialect.name == 'bigquery':
+            # information schema of BigQuery is scoped to the dataset
+            dataset = '.'.join(schema_parts)
+            return (
+                f'SELECT column_name FROM `{dataset}`.INFORMATION_SCHEMA.COLUMNS '
+                f'WHERE table_name = {self._literal(table_name)}'
+            )
+
+        if len(schema_parts) == 2:
+            database, schema = schema_parts
+            information_schema = f'{database}.information_schema'
+            schema_condition = f'UPPER(table_schema) = UPPER({self._literal(schema)})'
+        else:
+            information_schema = 'information_schema'
+            schema_condition = (
+                f'UPPER(table_schema) = UPPER({self._literal(schema_parts[0])})'
+                if schema_parts
+                else 'table_schema = CURRENT_SCHEMA()'
+            )
+        # unquoted identifiers are stored in upper case by some warehouses
+        return (
+            f'SELECT column_name FROM {information_schema}.columns '
+            f'WHERE {schema_condition} AND UPPER(table_name) = UPPER({self._literal(table_name)})'
+        )
+
+    def query(self) -> str:
+        """Query verifying the target"""
+        target = self._transform.target
+        if self.verification is TransformVerification.LIMIT_ONE:
+            return f'SELECT * from {target} limit 1'
+        if self.verification is TransformVerification.LIMIT_ZERO:
+            return f'SELECT * from {target} limit 0'
+        if self.verification is TransformVerification.EXPLAIN:
+            return f'EXPLAIN SELECT * from {target}'
+        return self._columns_query()
+
+    def expected_columns(self) -> Optional[List[str]]:
+        """Columns the verification query must return, when it selects columns of the target"""
+        if self.verification is not TransformVerification.COLUMNS:
+            return None
+        return [self._column_names[field] for field in self._transform.fields]
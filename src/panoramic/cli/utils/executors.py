@@ -0,0 +1,14 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def get_pool_executor(tasks_count: int) -> Executor:
+    """
+    Process pool with a worker per task, up to the number of CPUs, when there are multiple tasks.
+
+    A single task runs in a thread, so no process is spawned for it.
+    """
+    if tasks_count > 1:
+        return ProcessPoolExecutor(max_workers=min(tasks_count, os.cpu_count() or 1))
+
+    return ThreadPoolExecutor(max_workers=1)
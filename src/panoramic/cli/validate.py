@@ -1,29 +1,29 @@
 import functools
-import itertools
 import json
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-import jsonschema
-from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
+from jsonschema.validators import validator_for
 
 from panoramic.cli.errors import (
+    CachedValidationError,
     DeprecatedAttributeWarning,
     DeprecatedConfigProperty,
     DuplicateFieldSlugError,
     DuplicateModelNameError,
     InvalidYamlFile,
     JsonSchemaError,
-    MissingFieldFileError,
-    OrphanFieldFileError,
     ValidationError,
 )
 from panoramic.cli.file_utils import read_yaml
 from panoramic.cli.local.reader import FilePackage, FileReader, GlobalPackage
-from panoramic.cli.pano_model import PanoField, PanoModel
-from panoramic.cli.paths import Paths
+from panoramic.cli.local.validation_cache import FileResult, ValidationCache
+from panoramic.cli.pano_model import PanoField, PanoModel, PanoVirtualDataSource
+from panoramic.cli.paths import Paths, SystemDirectory
+from panoramic.cli.references import ReferenceIndex
+from panoramic.cli.state import VirtualState
 
 
 class JsonSchemas:
@@ -56,6 +56,44 @@ class JsonSchemas:
             return json.load(f)
 
 
+def _build_validator(schema: Dict[str, Any]) -> Any:
+    """Check the schema and build validator for it."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+class JsonSchemaValidators:
+    """
+    Validators are built once per process and are safe to share between threads,
+    because validation does not modify them.
+    """
+
+    @staticmethod
+    @functools.lru_cache()
+    def dataset() -> Any:
+        """Return validator of dataset files."""
+        return _build_validator(JsonSchemas.dataset())
+
+    @staticmethod
+    @functools.lru_cache()
+    def model() -> Any:
+        """Return validator of model files."""
+        return _build_validator(JsonSchemas.model())
+
+    @staticmethod
+    @functools.lru_cache()
+    def field() -> Any:
+        """Return validator of field files."""
+        return _build_validator(JsonSchemas.field())
+
+    @staticmethod
+    @functools.lru_cache()
+    def context() -> Any:
+        """Return validator of context file."""
+        return _build_validator(JsonSchemas.context())
+
+
 def _check_model_deprecations(data: Dict[str, Any], path: Path) -> List[DeprecatedAttributeWarning]:
     """Check for deprecated attributes in a model."""
 
@@ -73,49 +111,80 @@ def _check_properties_deprecations(fp: Path, schema: Dict[str, Any]):
     return errors
 
 
-def _validate_data(data: Dict[str, Any], schema: Dict[str, Any]):
-    """Validate file against schema."""
-    jsonschema.validate(data, schema)
+def _validate_data(data: Dict[str, Any], validator: Any, path: Path):
+    """Validate file data against schema, reporting all problems in the file at once."""
+    errors = list(validator.iter_errors(data))
+    if len(errors) > 0:
+        raise JsonSchemaError(path=path, errors=errors)
 
 
-def _validate_file(fp: Path, schema: Dict[str, Any]):
+def _validate_file(fp: Path, validator: Any):
     """Validate file against schema."""
-    try:
-        data = read_yaml(fp)
-        _validate_data(data, schema)
-    except JsonSchemaValidationError as e:
-        raise JsonSchemaError(path=fp, error=e)
+    _validate_data(read_yaml(fp), validator, fp)
 
 
-def _validate_package_dataset(package: FilePackage) -> List[ValidationError]:
-    """Validate all files in a given package."""
-    errors: List[ValidationError] = []
-    try:
-        _validate_data(package.read_data_source(), JsonSchemas.dataset())
-    except InvalidYamlFile as e:
-        errors.append(e)
-    except JsonSchemaValidationError as e:
-        errors.append(JsonSchemaError(path=package.data_source_file, error=e))
+def _load_file(path: Path, validator: Any, cache: Optional[ValidationCache]) -> Dict[str, Any]:
+    """
+    Read and validate file, reusing result of the previous validation when the file did not change.
 
-    return errors
+    Only the result is cached, the file is always parsed again so the data keep their YAML types.
+    """
+    if cache is None:
+        data = read_yaml(path)
+        _validate_data(data, validator, path)
+        return data
+
+    result = cache.read_file(path)
+    if result.error is not None:
+        raise CachedValidationError(result.error)
 
+    try:
+        data = read_yaml(path)
+        if not result.is_validated:
+            _validate_data(data, validator, path)
+    except (InvalidYamlFile, JsonSchemaError) as e:
+        cache.store_file(path, FileResult(content_hash=result.content_hash, is_validated=True, error=str(e)))
+        raise
+
+    if not result.is_validated:
+        cache.store_file(path, FileResult(content_hash=result.content_hash, is_validated=True, error=None))
+    return data
+
+
+def _validate_package_dataset(
+    package: FilePackage, cache: Optional[ValidationCache] = None
+) -> Tuple[Optional[PanoVirtualDataSource], List[ValidationError]]:
+    """Validate dataset file in a given package."""
+    try:
+        data_source_data = _load_file(package.data_source_file, JsonSchemaValidators.dataset(), cache)
+        return PanoVirtualDataSource.from_dict({**data_source_data, 'package': package.name}), []
+    except (InvalidYamlFile, JsonSchemaError, CachedValidationError) as e:
+        return None, [e]
 
-def _validate_package_models(package: FilePackage) -> Tuple[List[PanoModel], List[ValidationError]]:
+
+def _validate_package_models(
+    package: FilePackage, cache: Optional[ValidationCache] = None, data_source: Optional[str] = None
+) -> Tuple[List[PanoModel], List[ValidationError]]:
     """Validate models in a given package."""
     errors: List[ValidationError] = []
     models = []
     model_paths_by_name: Dict[str, List[Path]] = defaultdict(list)
-    for model_data, model_path in package.read_models():
+    for model_path in package.model_files:
         try:
-            _validate_data(model_data, JsonSchemas.model())
-            model = PanoModel.from_dict(model_data)
+            model_data = _load_file(model_path, JsonSchemaValidators.model(), cache)
+            model = PanoModel.from_dict(
+                {
+                    **model_data,
+                    'package': package.name,
+                    'file_name': model_path.name,
+                    'virtual_data_source': data_source,
+                }
+            )
             models.append(model)
             model_paths_by_name[model.model_name].append(model_path)
             errors.extend(_check_model_deprecations(model_data, model_path))
-        except InvalidYamlFile as e:
+        except (InvalidYamlFile, JsonSchemaError, CachedValidationError) as e:
             errors.append(e)
-        except JsonSchemaValidationError as e:
-            errors.append(JsonSchemaError(path=model_path, error=e))
 
     # check for duplicate model names
     for model_name, paths in model_paths_by_name.items():
@@ -126,21 +195,23 @@ def _validate_package_models(package: FilePackage) -> Tuple[List[PanoModel], Lis
 
 
 def _validate_package_fields(
-    package: Union[FilePackage, GlobalPackage]
+    package: Union[FilePackage, GlobalPackage],
+    cache: Optional[ValidationCache] = None,
+    data_source: Optional[str] = None,
 ) -> Tuple[List[PanoField], List[ValidationError]]:
     errors: List[ValidationError] = []
     fields = []
     field_paths_by_id: Dict[str, List[Path]] = defaultdict(list)
-    for field_data, field_path in package.read_fields():
+    for field_path in package.field_files:
         try:
-            _validate_data(field_data, JsonSchemas.field())
-            field = PanoField.from_dict(field_data)
+            field_data = _load_file(field_path, JsonSchemaValidators.field(), cache)
+            if isinstance(package, FilePackage):
+                field_data = {**field_data, 'package': package.name, 'data_source': data_source}
+            field = PanoField.from_dict({**field_data, 'file_name': field_path.name})
             fields.append(field)
             field_paths_by_id[field.slug].append(field_path)
-        except InvalidYamlFile as e:
+        except (InvalidYamlFile, JsonSchemaError, CachedValidationError) as e:
             errors.append(e)
-        except JsonSchemaValidationError as e:
-            errors.append(JsonSchemaError(path=field_path, error=e))
 
     # check for duplicate field slugs
     for field_slug, paths in field_paths_by_id.items():
@@ -150,79 +221,94 @@ def _validate_package_fields(
     return fields, errors
 
 
-def validate_missing_files(
-    fields: List[PanoField], models: List[PanoModel], package_name: str
-) -> List[MissingFieldFileError]:
-    """Check for missing field files based on field map in model files."""
-    fields_slugs_from_fields = {f.slug for f in fields}
-    # take one model for every field
-    data_reference_by_field_slugs = {
-        field_name: (f.data_reference, field_name in model.identifiers, model.model_name)
-        for model in models
-        for f in model.fields
-        for field_name in f.field_map
-    }
-
-    field_slugs_with_no_files = data_reference_by_field_slugs.keys() - fields_slugs_from_fields
-
-    return [
-        MissingFieldFileError(
-            field_slug=slug,
-            dataset_slug=package_name,
-            data_reference=data_reference_by_field_slugs[slug][0],
-            identifier=data_reference_by_field_slugs[slug][1],
-            model_name=data_reference_by_field_slugs[slug][2],
-        )
-        for slug in field_slugs_with_no_files
-    ]
-
-
-def validate_orphaned_files(
-    fields: List[PanoField], models: List[PanoModel], package_name: str
-) -> List[OrphanFieldFileError]:
-    """Check for field files not linked to any models."""
-    # Fields with calculation without model link are normal
-    fields_slugs_from_fields = {f.slug for f in fields if f.calculation is None}
-    fields_slugs_from_models = set(itertools.chain.from_iterable(f.field_map for model in models for f in model.fields))
-
-    extraneous_field_slugs = fields_slugs_from_fields.difference(fields_slugs_from_models)
-
-    return [OrphanFieldFileError(field_slug=slug, dataset_slug=package_name) for slug in extraneous_field_slugs]
-
-
-def _validate_package(package: FilePackage) -> List[ValidationError]:
-    """Validate all files in a given package."""
+def _validate_package(
+    package: FilePackage, cache: Optional[ValidationCache] = None
+) -> Tuple[VirtualState, List[ValidationError]]:
+    """Validate all files in a given package and build objects defined in them."""
     errors: List[ValidationError] = []
-    errors.extend(_validate_package_dataset(package))
+    data_source, data_source_errors = _validate_package_dataset(package, cache)
+    errors.extend(data_source_errors)
+    data_source_slug = data_source.dataset_slug if data_source is not None else None
 
-    models, model_errors = _validate_package_models(package)
+    models, model_errors = _validate_package_models(package, cache, data_source_slug)
     errors.extend(model_errors)
 
-    fields, field_errors = _validate_package_fields(package)
+    fields, field_errors = _validate_package_fields(package, cache, data_source_slug)
     errors.extend(field_errors)
 
-    missing_file_errors = validate_missing_files(fields, models, package_name=package.name)
-    errors.extend(missing_file_errors)
+    data_sources = [data_source] if data_source is not None else []
+    return VirtualState(data_sources=data_sources, models=models, fields=fields), errors
 
-    orphan_file_errors = validate_orphaned_files(fields, models, package_name=package.name)
-    errors.extend(orphan_file_errors)
 
-    return errors
+def _get_changed_package_names(changed_files: Iterable[Path]) -> Set[str]:
+    """Names of packages containing any of the files, company-scoped fields are under the fields directory."""
+    cwd = Path.cwd().resolve()
+    package_names = set()
+    for path in changed_files:
+        try:
+            package_names.add(path.resolve().relative_to(cwd).parts[0])
+        except (ValueError, IndexError):
+            pass  # file outside of the project
+
+    return package_names
 
 
-def validate_local_state() -> List[ValidationError]:
-    """Check local state against defined schemas."""
+def load_local_state(changed_files: Optional[Iterable[Path]] = None) -> Tuple[VirtualState, List[ValidationError]]:
+    """
+    Parse and validate all local files in a single pass.
+
+    Objects are built only from valid files, so the state is complete only when there are no errors.
+    Files which did not change since the previous run are not parsed nor validated again.
+    When changed files are given, only packages containing any of them are loaded.
+    """
+    cache = ValidationCache.load(Paths.validation_cache_file())
     file_reader = FileReader()
-    packages = file_reader.get_packages()
-    _, errors = _validate_package_fields(file_reader.get_global_package())
+    packages = list(file_reader.get_packages())
+    load_global_package = True
+
+    if changed_files is not None:
+        changed_package_names = _get_changed_package_names(changed_files)
+        packages = [package for package in packages if package.name in changed_package_names]
+        load_global_package = SystemDirectory.FIELDS.value in changed_package_names
+
+    data_sources: List[PanoVirtualDataSource] = []
+    models: List[PanoModel] = []
+    fields: List[PanoField] = []
+    errors: List[ValidationError] = []
+
+    if load_global_package:
+        global_fields, global_field_errors = _validate_package_fields(file_reader.get_global_package(), cache)
+        fields.extend(global_fields)
+        errors.extend(global_field_errors)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for package_state, package_errors in executor.map(functools.partial(_validate_package, cache=cache), packages):
+            data_sources.extend(package_state.data_sources)
+            models.extend(package_state.models)
+            fields.extend(package_state.fields)
+            errors.extend(package_errors)
+
+    # cross-references are checked using one index of the whole loaded state
+    reference_index = ReferenceIndex.from_objects(fields, models)
+    for package in packages:
+        errors.extend(reference_index.missing_field_errors(package.name))
+        errors.extend(reference_index.orphaned_field_errors(package.name))
+
+    # keep results of packages not loaded in this run
+    cache.save(prune=changed_files is None)
+    return VirtualState(data_sources=data_sources, models=models, fields=fields), errors
+
 
-    executor = ThreadPoolExecutor(max_workers=4)
-    for package_errors in executor.map(_validate_package, packages):
-        errors.extend(package_errors)
+def validate_local_state(changed_files: Optional[Iterable[Path]] = None) -> List[ValidationError]:
+    """
+    Check local state against defined schemas.
 
+    When changed files are given, only packages containing any of them are validated.
+    """
+    _, errors = load_local_state(changed_files)
     return errors
 
 
 def validate_context():
     """Check context file against schema."""
-    _validate_file(Paths.context_file(), JsonSchemas.context())
+    _validate_file(Paths.context_file(), JsonSchemaValidators.context())
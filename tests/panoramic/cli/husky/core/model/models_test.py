@@ -0,0 +1,26 @@
+from unittest.mock import patch
+
+from panoramic.cli.husky.core.tel.tel_dialect import ModelTelDialect
+from panoramic.cli.husky.service.context import SNOWFLAKE_HUSKY_CONTEXT
+from tests.panoramic.cli.husky.test.mocks.husky_model import get_mock_husky_model
+
+
+def test_taxon_sql_accessor_is_rendered_once():
+    model = get_mock_husky_model()
+
+    with patch.object(ModelTelDialect, 'render', autospec=True, side_effect=ModelTelDialect.render) as mock_render:
+        accessors = [model.taxon_sql_accessor(SNOWFLAKE_HUSKY_CONTEXT, 'gender') for _ in range(3)]
+
+    assert accessors == ['database_a_company_a_table_a_0c1c3f7d9ae4c141.gender'] * 3
+    assert mock_render.call_count == 1
+
+
+def test_taxon_sql_accessor_respects_table_alias():
+    model = get_mock_husky_model()
+    assert (
+        model.taxon_sql_accessor(SNOWFLAKE_HUSKY_CONTEXT, 'gender')
+        == 'database_a_company_a_table_a_0c1c3f7d9ae4c141.gender'
+    )
+
+    model.table_alias = 'alias'
+    assert model.taxon_sql_accessor(SNOWFLAKE_HUSKY_CONTEXT, 'gender') == 'alias.gender'
@@ -0,0 +1,31 @@
+import pytest
+from sqlalchemy import column, literal, select, table
+
+from panoramic.cli.husky.common.sqlalchemy_ext import MyTextClause
+from panoramic.cli.husky.core.sql_alchemy_util import (
+    compile_query,
+    compile_query_with_params,
+)
+from panoramic.cli.husky.service.helpers import RUNTIME_DIALECTS
+
+
+@pytest.mark.parametrize('dialect', RUNTIME_DIALECTS.values())
+def test_compile_query_with_params(dialect):
+    query = select([column('a'), literal('value').label('b')]).select_from(table('t')).where(column('a') == 10)
+
+    sql, params = compile_query_with_params(query, dialect)
+
+    assert ':param_1' in sql and ':a_1' in sql
+    assert params == {'param_1': 'value', 'a_1': 10}
+    # literal compilation is not affected
+    assert "'value'" in compile_query(query, dialect)
+
+
+def test_compile_query_with_params_text_clause():
+    clause = MyTextClause('a = :value').bindparams(value='x')
+
+    sql, params = compile_query_with_params(clause)
+
+    assert len(params) == 1
+    assert sql == f'a = :{next(iter(params))}'
+    assert list(params.values()) == ['x']
@@ -1,10 +1,16 @@
+import random
+from itertools import combinations
+
 from panoramic.cli.husky.core.federated.model.models import (
     FdqModelAttribute,
     FdqModelJoin,
     FdqModelJoinRelationship,
 )
 from panoramic.cli.husky.core.model.enums import JoinType
-from panoramic.cli.husky.federated.join_detection.detect import detect_joins
+from panoramic.cli.husky.federated.join_detection.detect import (
+    _find_related_model_pairs,
+    detect_joins,
+)
 from tests.panoramic.cli.husky.federated.join_detection.test_utils import (
     create_temp_internal_from_api_model,
 )
@@ -114,3 +120,67 @@ def test_detects_many_to_one():
             ).dict(by_alias=True)
         ]
     }
+
+
+def _model_with_ids(name, identifiers):
+    fields = [FdqModelAttribute(data_reference=f'"{id}"', field_map=[id]) for id in identifiers]
+    return create_temp_internal_from_api_model(name=name, fields=fields, identifiers=identifiers)
+
+
+def _detect_joins_pairwise(models):
+    """Reference implementation comparing every pair of models."""
+    joins = {}
+    for model, another_model in combinations(models, 2):
+        left_ids, right_ids = set(model.identifiers), set(another_model.identifiers)
+        if len(left_ids) == 0 or len(right_ids) == 0:
+            continue
+
+        if left_ids == right_ids:
+            join = (model.model_name, another_model.model_name, 'one_to_one', left_ids)
+        elif left_ids.issubset(right_ids):
+            join = (another_model.model_name, model.model_name, 'many_to_one', left_ids)
+        elif right_ids.issubset(left_ids):
+            join = (model.model_name, another_model.model_name, 'many_to_one', right_ids)
+        else:
+            continue
+
+        from_model, to_model, relationship, fields = join
+        joins.setdefault(from_model, []).append((to_model, relationship, sorted(fields)))
+
+    return joins
+
+
+def _simplify_joins(joins):
+    return {
+        model_name: [(join['to_model'], join['relationship'].value, sorted(join['fields'])) for join in model_joins]
+        for model_name, model_joins in joins.items()
+    }
+
+
+def test_matches_pairwise_detection():
+    rng = random.Random(42)
+    identifiers = [f'id_{idx}' for idx in range(8)]
+    models = [_model_with_ids(f'model_{idx}', rng.sample(identifiers, rng.randint(0, 3))) for idx in range(300)]
+
+    result = detect_joins(models)
+
+    assert list(result.keys()) == list(_detect_joins_pairwise(models).keys())
+    assert _simplify_joins(result) == _detect_joins_pairwise(models)
+
+
+def test_detect_joins_compares_only_related_models():
+    models = []
+    for entity_idx in range(1000):
+        # three models on the same entity and two more granular models under it
+        models.extend(_model_with_ids(f'entity_{entity_idx}_{idx}', [f'entity_{entity_idx}']) for idx in range(3))
+        models.extend(
+            _model_with_ids(f'entity_{entity_idx}_detail_{idx}', [f'entity_{entity_idx}', f'detail_{entity_idx}_{idx}'])
+            for idx in range(2)
+        )
+
+    result = detect_joins(models)
+
+    assert len(models) == 5000
+    assert sum(len(joins) for joins in result.values()) == 1000 * (3 + 2 * 3)
+    # only pairs resulting in a join are compared instead of all 12.5M pairs of models
+    assert len(_find_related_model_pairs([set(model.identifiers) for model in models])) == 1000 * (3 + 2 * 3)
@@ -0,0 +1,58 @@
+from sqlalchemy import func, literal_column, text
+from sqlalchemy.sql import Select, column, table
+
+from panoramic.cli.husky.core.sql_alchemy_util import compile_query
+from panoramic.cli.husky.service.blending.column_pruning import prune_columns
+
+
+def _inner_query() -> Select:
+    return Select(
+        columns=[column('date'), column('spend'), column('impressions'), literal_column('__cpm1')],
+        from_obj=table('table1'),
+    )
+
+
+def test_prunes_unused_columns_of_nested_selects():
+    aggregated = (
+        Select(columns=[column('date'), func.sum(column('spend')).label('spend'), column('impressions')])
+        .select_from(_inner_query())
+        .group_by(column('date'))
+    ).alias('q0')
+    query = Select(columns=[aggregated.c.spend]).select_from(aggregated).order_by(aggregated.c.date)
+
+    assert compile_query(prune_columns(query)) == (
+        'SELECT q0.spend \n'
+        'FROM (SELECT date, sum(spend) AS spend \n'
+        'FROM (SELECT date, spend \n'
+        'FROM table1) GROUP BY date) AS q0 ORDER BY q0.date'
+    )
+
+
+def test_keeps_columns_used_by_text():
+    inner_query = _inner_query()
+    query = Select(columns=[text('sum(spend)')]).select_from(inner_query)
+
+    assert compile_query(prune_columns(query)) == compile_query(query)
+
+
+def test_keeps_columns_of_distinct_select():
+    inner_query = _inner_query().distinct()
+    query = Select(columns=[column('date')]).select_from(inner_query)
+
+    assert compile_query(prune_columns(query)) == compile_query(query)
+
+
+def test_keeps_columns_used_by_select_itself():
+    inner_query = (
+        Select(columns=[column('spend'), (column('impressions') * 2).label('double_impressions')])
+        .select_from(_inner_query())
+        .order_by(column('double_impressions'))
+    )
+    query = Select(columns=[column('spend')]).select_from(inner_query)
+
+    assert compile_query(prune_columns(query)) == (
+        'SELECT spend \n'
+        'FROM (SELECT spend, impressions * 2 AS double_impressions \n'
+        'FROM (SELECT spend, impressions \n'
+        'FROM table1) ORDER BY double_impressions)'
+    )
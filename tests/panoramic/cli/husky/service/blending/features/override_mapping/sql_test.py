@@ -25,7 +25,7 @@ def mapping_definition():
 
 class TestRenderDirectMappingCte(BaseTest):
     @staticmethod
-    def _prepare_sql(dialect):
+    def _prepare_sql(dialect, values=False):
         mapping_definition = OverrideMapping(
             slug='slug-1',
             name='My mapping',
@@ -36,7 +36,10 @@ class TestRenderDirectMappingCte(BaseTest):
             created_at=now(),
         )
 
-        query = OverrideMappingSql.render_direct_mapping(mapping_definition)
+        if values:
+            query = OverrideMappingSql.render_values_mapping(mapping_definition)
+        else:
+            query = OverrideMappingSql.render_direct_mapping(mapping_definition)
         return str(query.compile(compile_kwargs={"literal_binds": True}, dialect=dialect()))
 
     def test_snowflake_dialect(self):
@@ -46,6 +49,13 @@ class TestRenderDirectMappingCte(BaseTest):
         expected_query = self.read_test_expectations('query.sql')
         self.assertEqual(expected_query, str(sql))
 
+    def test_snowflake_dialect_values(self):
+        sql = self._prepare_sql(SnowflakeDialect, values=True)
+
+        self.write_test_expectations('query.sql', str(sql))
+        expected_query = self.read_test_expectations('query.sql')
+        self.assertEqual(expected_query, str(sql))
+
 
 @pytest.mark.parametrize(
     'include_unknown_values,expected',
@@ -59,3 +69,25 @@ def test_generate_identifier(mapping_definition, include_unknown_values, expecte
 def test_generate_cte_name(mapping_definition):
     identifier = OverrideMappingSql.generate_cte_name(mapping_definition.slug)
     assert identifier == '__om_slug_1_609591aff3bc337e'
+
+
+def test_render_staged_mapping():
+    query = OverrideMappingSql.render_staged_mapping('__om_staged_table')
+    assert str(query.compile(dialect=SnowflakeDialect())) == 'SELECT original, changed \nFROM __om_staged_table'
+
+
+def test_staging_table_rows(mapping_definition):
+    assert OverrideMappingSql.staging_table_rows(mapping_definition) == [
+        {'original': 'orig_1', 'changed': 'changed_1'},
+        {'original': 'orig_2', 'changed': 'changed_2'},
+        {'original': None, 'changed': 'changed_3'},
+        {'original': 'orig_4', 'changed': '--PANO-NULL--'},
+    ]
+
+
+def test_generate_staging_table_name(mapping_definition):
+    changed_mapping = mapping_definition.copy(update={'definition': [['orig_1', 'changed_2']]})
+
+    name = OverrideMappingSql.generate_staging_table_name(mapping_definition)
+    assert name.startswith('__om_staged_slug_1_')
+    assert name != OverrideMappingSql.generate_staging_table_name(changed_mapping)
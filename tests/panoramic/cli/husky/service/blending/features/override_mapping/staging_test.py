@@ -0,0 +1,104 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+
+from panoramic.cli.datacol.tztools import now
+from panoramic.cli.husky.core.sql_alchemy_util import compile_query
+from panoramic.cli.husky.core.taxonomy.override_mapping.enums import MappingSourceType
+from panoramic.cli.husky.core.taxonomy.override_mapping.models import OverrideMapping
+from panoramic.cli.husky.service.blending.features.override_mapping.manager import (
+    OverrideMappingManager,
+)
+from panoramic.cli.husky.service.blending.features.override_mapping.sql import (
+    OverrideMappingSql,
+)
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
+from panoramic.cli.husky.service.context import HuskyQueryContext
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
+
+
+def _mapping(size: int) -> OverrideMapping:
+    return OverrideMapping(
+        slug='slug-1',
+        name='My mapping',
+        company_id='company_id',
+        definition=[[f'orig_{idx}', f'changed_{idx}'] for idx in range(size - 1)] + [[None, None]],
+        source_type=MappingSourceType.DIRECT,
+        created_by='user',
+        created_at=now(),
+    )
+
+
+@pytest.fixture
+def engine():
+    # in-memory database is kept for the single connection of the engine
+    yield create_engine('sqlite://')
+
+
+def test_stage_mapping(engine):
+    stage = OverrideMappingStage(schema='main')
+    mapping = _mapping(3)
+
+    table_name = stage.stage(mapping)
+    assert stage.stage(mapping) == table_name
+    # tables are created only when the stage is loaded
+    assert not engine.has_table(table_name, schema='main')
+
+    stage.load(engine)
+
+    query = OverrideMappingSql.render_staged_mapping(table_name, stage.schema)
+    rows = engine.execute(compile_query(query)).fetchall()
+    assert rows == [('orig_0', 'changed_0'), ('orig_1', 'changed_1'), (None, OverrideMappingSql.PANO_NULL)]
+
+
+def test_stage_mapping_keeps_existing_table(engine):
+    stage = OverrideMappingStage()
+    table_name = stage.stage(_mapping(2))
+    engine.execute(f'CREATE TABLE {table_name} (original VARCHAR, changed VARCHAR)')
+    engine.execute(f"INSERT INTO {table_name} VALUES ('orig', 'loaded_earlier'), (NULL, 'loaded_earlier')")
+
+    stage.load(engine)
+    stage.load(Mock())
+
+    rows = engine.execute(compile_query(OverrideMappingSql.render_staged_mapping(table_name))).fetchall()
+    assert rows == [('orig', 'loaded_earlier'), (None, 'loaded_earlier')]
+
+
+def test_stage_mapping_reloads_incomplete_table(engine):
+    stage = OverrideMappingStage()
+    table_name = stage.stage(_mapping(2))
+    # table left over from a load which failed after the table was created
+    engine.execute(f'CREATE TABLE {table_name} (original VARCHAR, changed VARCHAR)')
+
+    stage.load(engine)
+
+    rows = engine.execute(compile_query(OverrideMappingSql.render_staged_mapping(table_name))).fetchall()
+    assert rows == [('orig_0', 'changed_0'), (None, OverrideMappingSql.PANO_NULL)]
+
+
+@pytest.mark.parametrize(
+    'runtime,size,expected_from',
+    [
+        (HuskyQueryRuntime.snowflake, 3, 'FROM (VALUES'),
+        (HuskyQueryRuntime.postgres, 3, 'FROM (VALUES'),
+        (HuskyQueryRuntime.bigquery, 3, 'UNION ALL'),
+        (HuskyQueryRuntime.snowflake, OverrideMappingStage.MIN_STAGED_MAPPING_SIZE, 'FROM __om_staged_slug_1_'),
+    ],
+)
+def test_render_mapping(runtime, size, expected_from):
+    ctx = HuskyQueryContext(runtime, OverrideMappingStage())
+
+    query = OverrideMappingManager.render_mapping(ctx, _mapping(size))
+
+    assert expected_from in compile_query(query, ctx.dialect)
+
+
+def test_render_mapping_without_stage():
+    ctx = HuskyQueryContext(HuskyQueryRuntime.snowflake)
+
+    query = OverrideMappingManager.render_mapping(ctx, _mapping(OverrideMappingStage.MIN_STAGED_MAPPING_SIZE))
+
+    assert 'FROM (VALUES' in compile_query(query, ctx.dialect)
@@ -0,0 +1,2 @@
+SELECT mapping_values.original AS original, mapping_values.changed AS changed 
+FROM (VALUES ('orig_1', 'changed_1'), ('orig_2', 'changed_2'), (CAST(NULL AS VARCHAR), 'changed_3'), ('orig_4', '--PANO-NULL--')) AS mapping_values (original, changed)
\ No newline at end of file
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+
+from panoramic.cli.husky.service.blending.filter_pushdown import push_down_filters
+from panoramic.cli.husky.service.filter_builder.filter_clauses import (
+    TaxonValueFilterClause,
+)
+from panoramic.cli.husky.service.types.api_data_request_types import BlendingDataRequest
+from tests.panoramic.cli.husky.test.mocks.core.taxonomy import TAXON_MAP
+from tests.panoramic.cli.husky.test.util import TEST_COMPANY_ID_50
+
+
+def _filter(taxon: str, value: Any, operator: str = '=') -> Dict[str, Any]:
+    return {'type': 'taxon_value', 'taxon': taxon, 'value': value, 'operator': operator}
+
+
+def _and(*clauses: Dict[str, Any]) -> Dict[str, Any]:
+    return {'type': 'group', 'logical_operator': 'AND', 'clauses': list(clauses), 'negate': False}
+
+
+def _request(data_sources: List[str], filters: Dict[str, Any], grouping_sets: Optional[List[List[str]]] = None):
+    return BlendingDataRequest(
+        {
+            'data_subrequests': [
+                {
+                    'scope': {'company_id': TEST_COMPANY_ID_50},
+                    'properties': {'data_sources': [data_source]},
+                    'taxons': ['date', 'spend'],
+                }
+                for data_source in data_sources
+            ],
+            'filters': filters,
+            'grouping_sets': grouping_sets,
+        }
+    )
+
+
+def _primitive(clause) -> Optional[Dict[str, Any]]:
+    return None if clause is None else clause.to_primitive()
+
+
+def test_pushes_down_dimension_filters():
+    request = _request(
+        ['facebook_ads', 'twitter'],
+        _and(_filter('date', '2020-01-01', '>='), _filter('spend', 10, '>'), _filter('facebook_ads|gender', 'f')),
+    )
+    request.data_subrequests[0].preaggregation_filters = TaxonValueFilterClause(_filter('ad_id', '123'))
+
+    push_down_filters(request, TAXON_MAP)
+
+    assert _primitive(request.filters) == _and(_filter('spend', 10, '>'), _filter('facebook_ads|gender', 'f'))
+    assert _primitive(request.data_subrequests[0].preaggregation_filters) == _and(
+        _filter('ad_id', '123'), _filter('date', '2020-01-01', '>=')
+    )
+    assert _primitive(request.data_subrequests[1].preaggregation_filters) == _filter('date', '2020-01-01', '>=')
+
+
+def test_pushes_down_namespaced_dimension_filter_of_single_data_source():
+    request = _request(['facebook_ads'], _filter('facebook_ads|gender', 'f'))
+
+    push_down_filters(request, TAXON_MAP)
+
+    assert request.filters is None
+    assert _primitive(request.data_subrequests[0].preaggregation_filters) == _filter('facebook_ads|gender', 'f')
+
+
+def test_keeps_filters_of_computed_dimensions_and_grouping_sets():
+    request = _request(['facebook_ads', 'twitter'], _filter('fb_tw_merged_ad_id', '123'))
+    push_down_filters(request, TAXON_MAP)
+    assert _primitive(request.filters) == _filter('fb_tw_merged_ad_id', '123')
+
+    request = _request(['facebook_ads', 'twitter'], _filter('date', '2020-01-01'), grouping_sets=[['date']])
+    push_down_filters(request, TAXON_MAP)
+    assert _primitive(request.filters) == _filter('date', '2020-01-01')
+    assert request.data_subrequests[0].preaggregation_filters is None
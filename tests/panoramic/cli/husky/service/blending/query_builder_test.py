@@ -138,6 +138,40 @@ class TestDataframeBlending(BaseTest):
         self.assertEqual(['date', 'spend', 'cpm'], list(df.slug_to_column.keys()))
         self.assertSetEqual({'adwords_table', 'fb_table'}, df.used_model_names)
 
+    @patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons)
+    @patch('panoramic.cli.husky.service.query_builder.QueryBuilder.build_query')
+    def test_no_comparison_dimension_postagg_filters_pushed_down(self, mock__husky_build_query, mock__get_taxons):
+        self._blending_request.comparison = None
+        self._blending_request.filters = TaxonValueFilterClause(
+            {"type": "taxon_value", "taxon": "date", "value": '2020-01-01', "operator": ">="}
+        )
+
+        adwords_df = Dataframe(
+            create_single_query_mock('adwords'),
+            get_mocked_dataframe_columns_map(['spend', 'impressions', 'date']),
+            {'adwords_table'},
+        )
+        fb_df = Dataframe(
+            create_single_query_mock('facebook'),
+            get_mocked_dataframe_columns_map(['spend', 'impressions', 'date']),
+            {'fb_table'},
+        )
+
+        mock__husky_build_query.side_effect = [adwords_df, fb_df]
+
+        df = QueryBuilder.build_query(SNOWFLAKE_HUSKY_CONTEXT, self._blending_request, self._info)
+        self.write_test_expectations('query.sql', compile_query(df.query))
+        expected_query = self.read_test_expectations('query.sql')
+        self.assertEqual(expected_query, compile_query(df.query))
+
+        # filter on dimension is applied to every subrequest, instead of the aggregated data
+        for call in mock__husky_build_query.call_args_list:
+            subrequest: InternalDataRequest = call[0][1]
+            self.assertDictEqual(
+                {"type": "taxon_value", "taxon": "date", "value": '2020-01-01', "operator": ">="},
+                subrequest.preaggregation_filters.to_primitive(),
+            )
+
     @patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons)
     @patch('panoramic.cli.husky.service.query_builder.QueryBuilder.build_query')
     def test_full_blending_simple_comparison(self, mock__husky_build_query, mock__get_taxons):
@@ -226,6 +260,37 @@ class TestDataframeBlending(BaseTest):
             {'fb_comparison_table', 'adwords_comparison_table', 'adwords_table', 'fb_table'}, df.used_model_names
         )
 
+    def _build_comparison_with_same_subqueries(self, mock__husky_build_query) -> Dataframe:
+        # comparison subrequests end up with the same queries as data subrequests
+        mock__husky_build_query.side_effect = [
+            Dataframe(
+                create_single_query_mock(data_source),
+                get_mocked_dataframe_columns_map(['spend', 'impressions', 'objective', 'date']),
+                {f'{data_source}_table'},
+            )
+            for data_source in ['adwords', 'facebook', 'adwords', 'facebook']
+        ]
+        return QueryBuilder.build_query(SNOWFLAKE_HUSKY_CONTEXT, self._blending_request, self._info)
+
+    @patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons)
+    @patch('panoramic.cli.husky.service.query_builder.QueryBuilder.build_query')
+    def test_full_blending_comparison_deduplicates_subqueries(self, mock__husky_build_query, mock__get_taxons):
+        self._blending_request.comparison = ComparisonConfig({"taxons": ["objective"]})
+
+        with patch(
+            'panoramic.cli.husky.service.blending.query_builder.deduplicate_subqueries', side_effect=lambda ctx, q: q
+        ):
+            inlined_sql = compile_query(self._build_comparison_with_same_subqueries(mock__husky_build_query).query)
+
+        df = self._build_comparison_with_same_subqueries(mock__husky_build_query)
+        self.write_test_expectations('query.sql', compile_query(df.query))
+        expected_query = self.read_test_expectations('query.sql')
+        self.assertEqual(expected_query, compile_query(df.query))
+
+        self.assertEqual(2, inlined_sql.count('FROM adwords_table_mock'))
+        self.assertEqual(1, expected_query.count('FROM adwords_table_mock'))
+        self.assertLess(len(expected_query), len(inlined_sql))
+
     @patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons)
     @patch('panoramic.cli.husky.service.query_builder.QueryBuilder.build_query')
     def test_full_blending_with_grouping_sets(self, mock__husky_build_query, mock__get_taxons):
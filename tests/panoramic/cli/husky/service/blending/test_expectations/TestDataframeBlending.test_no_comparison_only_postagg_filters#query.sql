@@ -1,5 +1,5 @@
 SELECT cpm AS cpm, date AS date, spend AS spend 
-FROM (SELECT __cpm1 / nullif(__cpm2, 0) AS cpm, date AS date, facebook_ads_impressions_0bf2e36fb4e71190 AS facebook_ads_impressions_0bf2e36fb4e71190, spend AS spend 
+FROM (SELECT __cpm1 / nullif(__cpm2, 0) AS cpm, date AS date, spend AS spend 
 FROM (SELECT sum(1000 * spend) AS __cpm1, sum(impressions) AS __cpm2, date AS date, sum(facebook_ads_impressions_0bf2e36fb4e71190) AS facebook_ads_impressions_0bf2e36fb4e71190, sum(spend) AS spend 
 FROM (SELECT date, impressions, spend 
 FROM (SELECT date, impressions, spend 
@@ -1,7 +1,7 @@
 SELECT fb_tw_merged_objective AS fb_tw_merged_objective, spend AS spend, sumiff_spend_with_merged_objective AS sumiff_spend_with_merged_objective, twitter_impressions_ef12a84724a0ad7d AS twitter_impressions_ef12a84724a0ad7d 
 FROM (SELECT fb_tw_merged_objective AS fb_tw_merged_objective, spend AS spend, sumiff_spend_with_merged_objective AS sumiff_spend_with_merged_objective, twitter_impressions_ef12a84724a0ad7d AS twitter_impressions_ef12a84724a0ad7d 
 FROM (SELECT fb_tw_merged_objective AS fb_tw_merged_objective, sum(spend) AS spend, sum(CASE WHEN (__sumiff_spend_with_merged_objective3 = 'LINK_CLICKS') THEN (coalesce(facebook_ads_spend_5811c78c7c741b5a, 0) + coalesce(twitter_spend_68657fbb141b10c8, 0)) * 1.5 ELSE coalesce(facebook_ads_spend_5811c78c7c741b5a, 0) + coalesce(twitter_spend_68657fbb141b10c8, 0) END) AS sumiff_spend_with_merged_objective, sum(twitter_impressions_ef12a84724a0ad7d) AS twitter_impressions_ef12a84724a0ad7d 
-FROM (SELECT __fb_tw_merged_objective1, __fb_tw_merged_objective2, __sumiff_spend_with_merged_objective1, __sumiff_spend_with_merged_objective2, coalesce(__sumiff_spend_with_merged_objective1, __sumiff_spend_with_merged_objective2) AS __sumiff_spend_with_merged_objective3, facebook_ads_spend_5811c78c7c741b5a, coalesce(__fb_tw_merged_objective1, __fb_tw_merged_objective2) AS fb_tw_merged_objective, spend, twitter_impressions_ef12a84724a0ad7d, twitter_spend_68657fbb141b10c8 
+FROM (SELECT coalesce(__sumiff_spend_with_merged_objective1, __sumiff_spend_with_merged_objective2) AS __sumiff_spend_with_merged_objective3, facebook_ads_spend_5811c78c7c741b5a, coalesce(__fb_tw_merged_objective1, __fb_tw_merged_objective2) AS fb_tw_merged_objective, spend, twitter_impressions_ef12a84724a0ad7d, twitter_spend_68657fbb141b10c8 
 FROM (SELECT __fb_tw_merged_objective1, __fb_tw_merged_objective2, __sumiff_spend_with_merged_objective1, __sumiff_spend_with_merged_objective2, facebook_ads_spend_5811c78c7c741b5a, spend, twitter_impressions_ef12a84724a0ad7d, twitter_spend_68657fbb141b10c8 
 FROM (SELECT sum(q1.facebook_ads_spend_5811c78c7c741b5a) as facebook_ads_spend_5811c78c7c741b5a, sum(coalesce(q0.spend,0)+coalesce(q1.spend,0)) as spend, sum(q0.twitter_impressions_ef12a84724a0ad7d) as twitter_impressions_ef12a84724a0ad7d, sum(q0.twitter_spend_68657fbb141b10c8) as twitter_spend_68657fbb141b10c8, __fb_tw_merged_objective1, __sumiff_spend_with_merged_objective1, __fb_tw_merged_objective2, __sumiff_spend_with_merged_objective2 
 FROM (SELECT twitter_column_mock, __data_source 
@@ -1,9 +1,9 @@
 SELECT __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a AS __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a 
 FROM (SELECT __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a AS __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a 
 FROM (SELECT __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a AS __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a 
-FROM (SELECT ___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d, coalesce(___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d) AS __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a, facebook_ads_objective_c6ca42e81dd77539, facebook_ads_spend_5811c78c7c741b5a, spend, twitter_impressions_ef12a84724a0ad7d, twitter_objective_bf8f938b0fc50b79, twitter_spend_68657fbb141b10c8 
-FROM (SELECT ___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d, facebook_ads_objective_c6ca42e81dd77539, facebook_ads_spend_5811c78c7c741b5a, spend, twitter_impressions_ef12a84724a0ad7d, twitter_objective_bf8f938b0fc50b79, twitter_spend_68657fbb141b10c8 
-FROM (SELECT q1.facebook_ads_objective_c6ca42e81dd77539 AS facebook_ads_objective_c6ca42e81dd77539, sum(q1.facebook_ads_spend_5811c78c7c741b5a) as facebook_ads_spend_5811c78c7c741b5a, sum(coalesce(q0.spend,0)+coalesce(q1.spend,0)) as spend, sum(q0.twitter_impressions_ef12a84724a0ad7d) as twitter_impressions_ef12a84724a0ad7d, q0.twitter_objective_bf8f938b0fc50b79 AS twitter_objective_bf8f938b0fc50b79, sum(q0.twitter_spend_68657fbb141b10c8) as twitter_spend_68657fbb141b10c8, ___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d 
+FROM (SELECT coalesce(___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d) AS __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a 
+FROM (SELECT ___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d 
+FROM (SELECT sum(q1.facebook_ads_spend_5811c78c7c741b5a) as facebook_ads_spend_5811c78c7c741b5a, sum(coalesce(q0.spend,0)+coalesce(q1.spend,0)) as spend, sum(q0.twitter_impressions_ef12a84724a0ad7d) as twitter_impressions_ef12a84724a0ad7d, sum(q0.twitter_spend_68657fbb141b10c8) as twitter_spend_68657fbb141b10c8, ___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d 
 FROM (SELECT twitter_column_mock, __data_source 
 FROM twitter_table_mock) AS q0 FULL OUTER JOIN (SELECT facebook_column_mock, __data_source 
 FROM facebook_table_mock) AS q1 ON q0.__data_source = q1.__data_source GROUP BY q1.facebook_ads_objective_c6ca42e81dd77539, q0.twitter_objective_bf8f938b0fc50b79, ___d_merge_concat_facebook_ads_objective_____101509183fd611cc, ___d_merge_concat_facebook_ads_objective_____5264ccf946d1960d))) GROUP BY __d_merge_concat_facebook_ads_objective____f_4f154f8026184c1a))
@@ -1,9 +1,10 @@
 WITH __om_om_slug_425e4946debaef61 AS 
-(SELECT 'my-val' AS original, 'new-val' AS changed UNION ALL SELECT CAST(NULL AS VARCHAR) AS original, 'Another val' AS changed UNION ALL SELECT 'orig-val' AS original, '--PANO-NULL--' AS changed)
+(SELECT mapping_values.original AS original, mapping_values.changed AS changed 
+FROM (VALUES ('my-val', 'new-val'), (CAST(NULL AS VARCHAR), 'Another val'), ('orig-val', '--PANO-NULL--')) AS mapping_values (original, changed))
  SELECT __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8 AS __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8, spend AS spend 
 FROM (SELECT __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8 AS __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8, spend AS spend 
 FROM (SELECT __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8 AS __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8, sum(spend) AS spend 
-FROM (SELECT ___d_override_merge_concat_facebook_ads_obje_8100b95e21b7ea8a, ___d_override_merge_concat_facebook_ads_obje_9dda2d8f1425ce63, CASE WHEN (__om_coalesce____d_override_merge_concat_fac_1d2dea7a969e487e.changed = '--PANO-NULL--') THEN NULL ELSE coalesce(__om_coalesce____d_override_merge_concat_fac_1d2dea7a969e487e.changed, 'Unknown') END AS __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8, facebook_ads_objective_c6ca42e81dd77539, facebook_ads_spend_5811c78c7c741b5a, objective, spend, twitter_impressions_ef12a84724a0ad7d, twitter_objective_bf8f938b0fc50b79, twitter_spend_68657fbb141b10c8 
+FROM (SELECT CASE WHEN (__om_coalesce____d_override_merge_concat_fac_1d2dea7a969e487e.changed = '--PANO-NULL--') THEN NULL ELSE coalesce(__om_coalesce____d_override_merge_concat_fac_1d2dea7a969e487e.changed, 'Unknown') END AS __d_override_merge_concat_facebook_ads_objec_e9af42c0626df8b8, spend 
 FROM (SELECT ___d_override_merge_concat_facebook_ads_obje_8100b95e21b7ea8a, ___d_override_merge_concat_facebook_ads_obje_9dda2d8f1425ce63, facebook_ads_objective_c6ca42e81dd77539, facebook_ads_spend_5811c78c7c741b5a, objective, spend, twitter_impressions_ef12a84724a0ad7d, twitter_objective_bf8f938b0fc50b79, twitter_spend_68657fbb141b10c8 
 FROM (SELECT q1.facebook_ads_objective_c6ca42e81dd77539 AS facebook_ads_objective_c6ca42e81dd77539, sum(q1.facebook_ads_spend_5811c78c7c741b5a) as facebook_ads_spend_5811c78c7c741b5a, coalesce(q0.objective, q1.objective) AS objective, sum(coalesce(q0.spend,0)+coalesce(q1.spend,0)) as spend, sum(q0.twitter_impressions_ef12a84724a0ad7d) as twitter_impressions_ef12a84724a0ad7d, q0.twitter_objective_bf8f938b0fc50b79 AS twitter_objective_bf8f938b0fc50b79, sum(q0.twitter_spend_68657fbb141b10c8) as twitter_spend_68657fbb141b10c8, ___d_override_merge_concat_facebook_ads_obje_9dda2d8f1425ce63, ___d_override_merge_concat_facebook_ads_obje_8100b95e21b7ea8a 
 FROM (SELECT twitter_column_mock, __data_source 
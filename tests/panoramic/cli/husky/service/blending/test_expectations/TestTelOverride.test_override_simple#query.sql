@@ -1,11 +1,12 @@
 WITH __om_om_slug_425e4946debaef61 AS 
-(SELECT 'my-val' AS original, 'new-val' AS changed UNION ALL SELECT CAST(NULL AS VARCHAR) AS original, 'Another val' AS changed UNION ALL SELECT 'orig-val' AS original, '--PANO-NULL--' AS changed)
+(SELECT mapping_values.original AS original, mapping_values.changed AS changed 
+FROM (VALUES ('my-val', 'new-val'), (CAST(NULL AS VARCHAR), 'Another val'), ('orig-val', '--PANO-NULL--')) AS mapping_values (original, changed))
  SELECT __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a AS __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a, spend AS spend 
 FROM (SELECT __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a AS __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a, spend AS spend 
 FROM (SELECT __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a AS __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a, sum(spend) AS spend 
-FROM (SELECT ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3, ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e, coalesce(CASE WHEN (__om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9.changed = '--PANO-NULL--') THEN NULL ELSE coalesce(__om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9.changed, 'Unknown') END, CASE WHEN (__om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc.changed = '--PANO-NULL--') THEN NULL ELSE coalesce(__om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc.changed, 'Unknown') END) AS __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a, facebook_ads_objective_c6ca42e81dd77539, facebook_ads_spend_5811c78c7c741b5a, objective, spend, twitter_impressions_ef12a84724a0ad7d, twitter_objective_bf8f938b0fc50b79, twitter_spend_68657fbb141b10c8 
-FROM (SELECT ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3, ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e, facebook_ads_objective_c6ca42e81dd77539, facebook_ads_spend_5811c78c7c741b5a, objective, spend, twitter_impressions_ef12a84724a0ad7d, twitter_objective_bf8f938b0fc50b79, twitter_spend_68657fbb141b10c8 
-FROM (SELECT q1.facebook_ads_objective_c6ca42e81dd77539 AS facebook_ads_objective_c6ca42e81dd77539, sum(q1.facebook_ads_spend_5811c78c7c741b5a) as facebook_ads_spend_5811c78c7c741b5a, coalesce(q0.objective, q1.objective) AS objective, sum(coalesce(q0.spend,0)+coalesce(q1.spend,0)) as spend, sum(q0.twitter_impressions_ef12a84724a0ad7d) as twitter_impressions_ef12a84724a0ad7d, q0.twitter_objective_bf8f938b0fc50b79 AS twitter_objective_bf8f938b0fc50b79, sum(q0.twitter_spend_68657fbb141b10c8) as twitter_spend_68657fbb141b10c8, ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3, ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e 
+FROM (SELECT coalesce(CASE WHEN (__om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9.changed = '--PANO-NULL--') THEN NULL ELSE coalesce(__om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9.changed, 'Unknown') END, CASE WHEN (__om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc.changed = '--PANO-NULL--') THEN NULL ELSE coalesce(__om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc.changed, 'Unknown') END) AS __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a, spend 
+FROM (SELECT ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3, ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e, spend 
+FROM (SELECT sum(q1.facebook_ads_spend_5811c78c7c741b5a) as facebook_ads_spend_5811c78c7c741b5a, sum(coalesce(q0.spend,0)+coalesce(q1.spend,0)) as spend, sum(q0.twitter_impressions_ef12a84724a0ad7d) as twitter_impressions_ef12a84724a0ad7d, sum(q0.twitter_spend_68657fbb141b10c8) as twitter_spend_68657fbb141b10c8, ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3, ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e 
 FROM (SELECT twitter_column_mock, __data_source 
 FROM twitter_table_mock) AS q0 FULL OUTER JOIN (SELECT facebook_column_mock, __data_source 
 FROM facebook_table_mock) AS q1 ON q0.__data_source = q1.__data_source GROUP BY q1.facebook_ads_objective_c6ca42e81dd77539, coalesce(q0.objective, q1.objective), q0.twitter_objective_bf8f938b0fc50b79, ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3, ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e)) LEFT OUTER JOIN __om_om_slug_425e4946debaef61 AS __om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9 ON __om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9.original = ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3 OR __om____d_merge_override_concat_facebook_ads_cefa4a61f0e445f9.original IS NULL AND ___d_merge_override_concat_facebook_ads_obje_2b20e798c0798de3 IS NULL LEFT OUTER JOIN __om_om_slug_425e4946debaef61 AS __om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc ON __om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc.original = ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e OR __om____d_merge_override_concat_facebook_ads_28efcbbe128aa8dc.original IS NULL AND ___d_merge_override_concat_facebook_ads_obje_abeb6d845656f37e IS NULL) GROUP BY __d_merge_override_concat_facebook_ads_objec_60f7aeaec08bce2a))
@@ -25,9 +25,6 @@ from tests.panoramic.cli.husky.test.mocks.husky_model import (
     get_mock_metric_gender_model,
     get_mock_metric_model,
 )
-from tests.panoramic.cli.husky.test.mocks.mock_alchemy_bind_param import (
-    mock_alchemy_bind_param,
-)
 from tests.panoramic.cli.husky.test.test_base import BaseTest
 
 
@@ -40,7 +37,6 @@ class TestProjectionBuilder(BaseTest):
             [get_mock_entity_model(), get_mock_metric_model(), get_mock_metric_gender_model()]
         ).build_graph()
 
-    @mock_alchemy_bind_param
     def test_basic_build_query_with_order_by(self):
         selected_taxons = ['impressions', 'ad_id']
         query, taxon_model_info_map, _ = SelectBuilder(
@@ -71,7 +67,6 @@ class TestProjectionBuilder(BaseTest):
 
         self.assertEqual(expected, compile_query(final_dataframe.query))
 
-    @mock_alchemy_bind_param
     def test_basic_build_query_with_pre_filter(self):
         projected_taxons = ['impressions', 'spend']
 
@@ -139,19 +134,15 @@ class TestProjectionBuilder(BaseTest):
 
         assert compile_query(final_dataframe.query) == expected
 
-    @mock_alchemy_bind_param
     def test_basic_build_query(self):
         self._run_basic_test(['impressions', 'ad_id'])
 
-    @mock_alchemy_bind_param
     def test_basic_build_query_counts(self):
         self._run_basic_test(['ad_id', 'account_id', 'simple_count_all', 'simple_count_distinct'])
 
-    @mock_alchemy_bind_param
     def test_basic_build_query_min_max(self):
         self._run_basic_test(['ad_id', 'simple_min', 'simple_max'])
 
-    @mock_alchemy_bind_param
     def test_basic_build_query_first_last_by(self):
         self._run_basic_test(
             ['ad_id', 'simple_first_by', 'simple_last_by'], ['ad_id', 'simple_first_by', 'simple_last_by', 'objective']
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 from panoramic.cli.husky.core.sql_alchemy_util import compile_query
@@ -16,16 +20,62 @@ from tests.panoramic.cli.husky.test.mocks.husky_model import (
     get_mock_entity_model,
     get_mock_metric_model,
 )
-from tests.panoramic.cli.husky.test.mocks.mock_alchemy_bind_param import (
-    mock_alchemy_bind_param,
-)
 from tests.panoramic.cli.husky.test.test_base import BaseTest
 
 
+def compile_request_with_bind_params() -> str:
+    """Build query for a request with filters and compile it without inlining values of bind parameters."""
+    request = InternalDataRequest(
+        {
+            'scope': {
+                'project_id': 'project',
+                'company_id': 'company',
+                'preaggregation_filters': {
+                    'type': 'group',
+                    'logical_operator': 'AND',
+                    'clauses': [
+                        {'type': 'taxon_value', 'taxon': 'account_id', 'operator': '=', 'value': '595126134331606'},
+                        {'type': 'taxon_value', 'taxon': 'ad_name', 'operator': 'LIKE', 'value': '%test%'},
+                    ],
+                    'negate': False,
+                },
+            },
+            'properties': {'data_sources': ['mock_data_source']},
+            'taxons': ['account_id', 'ad_name'],
+        }
+    )
+    with patch(
+        'panoramic.cli.husky.service.model_retriever.component.ModelRetriever.load_models',
+        return_value=[get_mock_entity_model(), get_mock_metric_model()],
+    ), patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons):
+        dataframe = QueryBuilder.build_query(
+            SNOWFLAKE_HUSKY_CONTEXT, request, QueryInfo.create(request), preloaded_taxons=TAXON_MAP
+        )
+
+    return compile_query(dataframe.query, literal_binds=False)
+
+
+def test_compiled_query_is_same_across_processes():
+    script = f'from {__name__} import compile_request_with_bind_params; print(compile_request_with_bind_params())'
+    root_dir = Path(__file__).parents[5]
+    outputs = [
+        subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=root_dir,
+            env={**os.environ, 'PYTHONHASHSEED': str(seed)},
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout
+        for seed in (1, 2)
+    ]
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0].decode().strip() == compile_request_with_bind_params()
+
+
 class TestHuskyBuildQuery(BaseTest):
     @patch('panoramic.cli.husky.service.model_retriever.component.ModelRetriever.load_models')
     @patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons)
-    @mock_alchemy_bind_param
     def test_scope_filters(self, mock__get_taxons, mock__load_models):
         mock__load_models.return_value = [
             get_mock_entity_model(),
@@ -66,7 +116,6 @@ class TestHuskyBuildQuery(BaseTest):
 class TestHuskyDimFormulas(BaseTest):
     @patch('panoramic.cli.husky.service.model_retriever.component.ModelRetriever.load_models')
     @patch.object(Taxonomy, '_get_filtered_taxons', side_effect=mock_get_taxons)
-    @mock_alchemy_bind_param
     def test_simple_concat(self, mock__get_taxons, mock__load_models):
         mock__load_models.return_value = [
             get_mock_entity_model(),
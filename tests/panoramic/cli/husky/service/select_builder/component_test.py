@@ -21,9 +21,6 @@ from tests.panoramic.cli.husky.test.mocks.husky_model import (
     get_mock_metric_model,
     get_mock_metric_time_taxon_model,
 )
-from tests.panoramic.cli.husky.test.mocks.mock_alchemy_bind_param import (
-    mock_alchemy_bind_param,
-)
 from tests.panoramic.cli.husky.test.test_base import BaseTest
 
 
@@ -39,7 +36,6 @@ class TestSelectBuilder(BaseTest):
         ).build_graph()
         self.scope = Scope(dict(company_id='10', project_id='10'))
 
-    @mock_alchemy_bind_param
     def test_basic_build_query(self):
         result, _, effectively_used_models = SelectBuilder(
             SNOWFLAKE_HUSKY_CONTEXT,
@@ -58,7 +54,6 @@ class TestSelectBuilder(BaseTest):
             effectively_used_models.to_primitive(),
         )
 
-    @mock_alchemy_bind_param
     def test_query_with_pre_filter_with_filter_taxon_selected(self):
         filter_clause = TaxonValueFilterClause(
             {
@@ -84,7 +79,6 @@ class TestSelectBuilder(BaseTest):
 
         self.assertEqual(expected, compile_query(result).strip())
 
-    @mock_alchemy_bind_param
     def test_query_with_pre_filter_without_filter_taxons(self):
         filter_clause = TaxonValueFilterClause(
             {
@@ -110,7 +104,6 @@ class TestSelectBuilder(BaseTest):
 
         self.assertEqual(expected, compile_query(result).strip())
 
-    @mock_alchemy_bind_param
     def test_query_with_pre_taxon_taxon_pre_filter(self):
         filter_clause = TaxonTaxonFilterClause(
             {
@@ -136,7 +129,6 @@ class TestSelectBuilder(BaseTest):
 
         self.assertEqual(expected, compile_query(result).strip())
 
-    @mock_alchemy_bind_param
     def test_basic_build_join_query(self):
         taxons = get_specific_select_mocked_taxons(['spend', 'gender', 'impressions', 'ad_id', 'ad_name'])
 
@@ -154,7 +146,6 @@ class TestSelectBuilder(BaseTest):
             effectively_used_models.to_primitive(),
         )
 
-    @mock_alchemy_bind_param
     def test_gender_build_query(self):
         taxons = get_specific_select_mocked_taxons(['spend', 'gender', 'impressions', 'ad_id'])
 
@@ -166,7 +157,6 @@ class TestSelectBuilder(BaseTest):
 
         self.assertEqual(expected, compile_query(result))
 
-    @mock_alchemy_bind_param
     def test_namespaced_dimension_build_query(self):
         result, _, effectively_used_models = SelectBuilder(
             SNOWFLAKE_HUSKY_CONTEXT,
@@ -188,7 +178,6 @@ class TestSelectBuilder(BaseTest):
             effectively_used_models.to_primitive(),
         )
 
-    @mock_alchemy_bind_param
     def test_namespaced_taxons_build_query(self):
         result, _, effectively_used_models = SelectBuilder(
             SNOWFLAKE_HUSKY_CONTEXT,
@@ -223,7 +212,6 @@ class TestSelectBuilderTimeTaxon(BaseTest):
         ).build_graph()
         self.scope = Scope(dict(company_id='10', project_id='10'))
 
-    @mock_alchemy_bind_param
     def test_basic_build_join_query(self):
         taxons = get_specific_select_mocked_taxons(['spend', 'impressions', 'ad_id', 'ad_name', 'week_of_year'])
 
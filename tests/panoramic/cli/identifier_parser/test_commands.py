@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+
+from panoramic.cli.identifier_parser.commands import detect_command
+from panoramic.cli.local.executor import LocalExecutor
+from panoramic.cli.pano_model import (
+    PanoField,
+    PanoModel,
+    PanoModelField,
+    PanoVirtualDataSource,
+)
+from panoramic.cli.state import VirtualState
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path):
+    url = f'sqlite:///{tmp_path / "db.sqlite"}'
+    engine = create_engine(url)
+    engine.execute('CREATE TABLE ads (ad_id INTEGER, date TEXT, spend REAL)')
+    engine.execute("INSERT INTO ads VALUES (1, '2020-01-01', 1.0), (1, '2020-01-02', 2.0), (2, '2020-01-01', 2.0)")
+    engine.execute('CREATE TABLE adsets (adset_id INTEGER, name TEXT)')
+    engine.execute("INSERT INTO adsets VALUES (10, 'a'), (20, 'a')")
+    engine.execute('CREATE TABLE campaigns (campaign_id INTEGER)')
+    engine.execute('INSERT INTO campaigns VALUES (100), (100)')
+    with patch('panoramic.cli.identifier_parser.commands.Connection') as mock_connection:
+        mock_connection.get.return_value = {'url': url}
+        yield
+
+
+def _field(slug: str, data_type: str) -> PanoField:
+    return PanoField(
+        slug=slug, group='group', display_name=slug, data_type=data_type, field_type='dimension', data_source='dataset'
+    )
+
+
+def _model(model_name: str, *columns: str, identifiers=None) -> PanoModel:
+    return PanoModel(
+        model_name=model_name,
+        fields=[PanoModelField(field_map=[column], data_reference=f'"{column}"', data_type=None) for column in columns],
+        joins=[],
+        identifiers=identifiers or [],
+        virtual_data_source='dataset',
+        package='dataset',
+        file_name=f'{model_name}.model.yaml',
+    )
+
+
+@pytest.fixture
+def mock_state():
+    with patch('panoramic.cli.identifier_parser.commands.get_state') as mock_state:
+        mock_state.return_value = VirtualState(
+            data_sources=[PanoVirtualDataSource(dataset_slug='dataset', display_name='Dataset')],
+            models=[
+                _model('ads', 'ad_id', 'date', 'spend'),
+                _model('adsets', 'adset_id', 'name', identifiers=['adset_id']),
+                _model('campaigns', 'campaign_id', 'campaign_name'),
+            ],
+            fields=[
+                _field('ad_id', 'text'),
+                _field('date', 'datetime'),
+                _field('spend', 'money'),
+                _field('adset_id', 'text'),
+                _field('name', 'text'),
+                _field('campaign_id', 'text'),
+            ],
+        )
+        yield mock_state
+
+
+@patch.object(LocalExecutor, '_execute')
+def test_detect_identifiers(mock_execute, mock_state, sqlite_connection, capsys):
+    detect_command(yes=True)
+
+    assert [
+        (action.desired.model_name, action.desired.identifiers) for (action,), _ in mock_execute.call_args_list
+    ] == [('ads', ['ad_id', 'date'])]
+    output = capsys.readouterr().out
+    assert 'Detected identifiers ad_id, date for ads\n' in output
+    assert 'No identifiers detected for campaigns\n' in output
+    assert 'adsets' not in output
+
+
+@patch.object(LocalExecutor, '_execute')
+def test_detect_identifiers_overwrite(mock_execute, mock_state, sqlite_connection):
+    detect_command(yes=True, overwrite=True)
+
+    assert [
+        (action.desired.model_name, action.desired.identifiers) for (action,), _ in mock_execute.call_args_list
+    ] == [('ads', ['ad_id', 'date'])]
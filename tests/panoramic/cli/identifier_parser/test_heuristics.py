@@ -0,0 +1,25 @@
+from panoramic.cli.identifier_parser.heuristics import ColumnFilter
+
+
+def test_find_dimensions():
+    columns = {
+        'spend': 'money',
+        'impressions': 'integer',
+        'campaign_name': 'text',
+        'ad_id': 'integer',
+        'id': 'text',
+        'date': 'datetime',
+        'updated_at': 'datetime',
+        'created_date': 'datetime',
+        '_fivetran_synced': 'datetime',
+        'data': 'text',
+        'unknown': None,
+    }
+
+    assert list(ColumnFilter().find_dimensions(columns)) == ['id', 'ad_id', 'date', 'campaign_name']
+
+
+def test_find_dimensions_ignored_columns():
+    columns = {'account_id': 'text', 'objective': 'text', 'data': 'text'}
+
+    assert list(ColumnFilter(ignored_column_names=['objective']).find_dimensions(columns)) == ['account_id', 'data']
@@ -0,0 +1,117 @@
+import itertools
+import random
+from unittest.mock import patch
+
+from panoramic.cli.identifier_parser import parser
+from panoramic.cli.identifier_parser.parser import find_candidate_ids, parse_identifiers
+
+_COLUMNS = ['account_id', 'campaign_id', 'objective', 'status']
+_ROWS = [
+    (1, 1001, 'link clicks', 'active'),
+    (1, 1002, 'video views', 'active'),
+    (2, 1003, 'link clicks', None),
+]
+
+
+def test_find_candidate_ids():
+    assert find_candidate_ids(_COLUMNS, _ROWS, max_combination_length=2) == [
+        ['campaign_id'],
+        ['account_id', 'objective'],
+        ['objective', 'status'],
+    ]
+
+
+def test_find_candidate_ids_prunes_null_columns():
+    rows = [(1, None), (1, None), (2, 'a')]
+
+    assert find_candidate_ids(['account_id', 'mostly_null'], rows) == []
+
+
+def test_find_candidate_ids_no_rows():
+    assert find_candidate_ids(_COLUMNS, []) == []
+
+
+def test_parse_identifiers_prefers_shortest_combination():
+    assert parse_identifiers(_COLUMNS, _ROWS) == ['campaign_id']
+
+
+def test_parse_identifiers_breaks_ties_by_column_order():
+    columns = ['objective', 'account_id', 'status']
+    rows = [(objective, account_id, status) for account_id, _, objective, status in _ROWS]
+
+    assert parse_identifiers(columns, rows) == ['objective', 'account_id']
+
+
+def test_parse_identifiers_not_found():
+    assert parse_identifiers(['account_id'], [(1,), (1,)]) == []
+
+
+def _find_candidate_ids_exhaustive(columns, rows, max_combination_length):
+    """Reference implementation testing every combination of columns."""
+    candidate_ids = []
+    for length in range(1, max_combination_length + 1):
+        for combination in itertools.combinations(range(len(columns)), length):
+            keys = [tuple(row[idx] for idx in combination) for row in rows]
+            keys = [key for key in keys if None not in key]
+            is_unique = len(set(keys)) == len(keys)
+            is_minimal = not any(set(candidate).issubset(combination) for candidate in candidate_ids)
+            if is_unique and is_minimal:
+                candidate_ids.append(combination)
+
+    return [[columns[idx] for idx in combination] for combination in candidate_ids]
+
+
+def test_find_candidate_ids_matches_exhaustive_search():
+    rng = random.Random(42)
+    for _ in range(50):
+        columns = [f'column_{idx}' for idx in range(rng.randint(1, 7))]
+        cardinalities = [rng.randint(1, 6) for _ in columns]
+        rows = [
+            tuple(rng.choice([None] + list(range(cardinality))) for cardinality in cardinalities)
+            for _ in range(rng.randint(1, 40))
+        ]
+        # the same columns the parser prunes due to null values
+        kept = [idx for idx in range(len(columns)) if sum(row[idx] is not None for row in rows) / len(rows) >= 0.6]
+        expected = _find_candidate_ids_exhaustive(
+            [columns[idx] for idx in kept], [tuple(row[idx] for idx in kept) for row in rows], 4
+        )
+
+        assert find_candidate_ids(columns, rows, max_combination_length=4) == expected
+
+
+def test_parse_identifiers_prunes_wide_tables():
+    rng = random.Random(42)
+    columns = ['account_id', 'ad_id', 'date'] + [f'dimension_{idx}' for idx in range(30)]
+    rows = [
+        (idx % 50, idx // 50 % 20, idx // 1000, *[rng.randint(0, column % 4 + 1) for column in range(30)])
+        for idx in range(2000)
+    ]
+
+    with patch.object(parser, '_count_distinct_keys', wraps=parser._count_distinct_keys) as count_distinct_keys:
+        identifiers = parse_identifiers(columns, rows)
+
+    assert identifiers == ['account_id', 'ad_id', 'date']
+    # exhaustive search tests all 284273 combinations of up to 5 columns (6017 of up to 3 columns)
+    assert count_distinct_keys.call_count == 64
+
+
+def test_factorize_gives_nulls_distinct_codes():
+    assert parser._factorize(['a', None, 'b', 'a', None]) == [0, 3, 1, 0, 6]
+
+
+def test_find_candidate_ids_tests_hundreds_of_combinations():
+    rng = random.Random(42)
+    cardinalities = [2000, 1000, 500, 300, 200, 100, 50, 30, 20, 10, 5, 3]
+    columns = [f'column_{idx}' for idx in range(len(cardinalities))]
+    rows = [
+        tuple(f'value_{rng.randrange(cardinality)}' if rng.random() > 0.05 else None for cardinality in cardinalities)
+        for _ in range(10000)
+    ]
+
+    with patch.object(parser, '_factorize', wraps=parser._factorize) as factorize:
+        with patch.object(parser, '_count_distinct_keys', wraps=parser._count_distinct_keys) as count_distinct_keys:
+            find_candidate_ids(columns, rows, max_combination_length=4)
+
+    assert count_distinct_keys.call_count > 500
+    # raw values are encoded once per column, not once per tested combination
+    assert factorize.call_count == len(columns)
@@ -0,0 +1,117 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from panoramic.cli.errors import ExecuteActionsException
+from panoramic.cli.local.executor import LocalExecutor
+from panoramic.cli.local.transaction import FileTransaction
+from panoramic.cli.local.writer import FileWriter
+from panoramic.cli.pano_model import PanoField
+from panoramic.cli.paths import SystemDirectory
+from panoramic.cli.state import Action
+
+
+def _field(slug: str, **kwargs) -> PanoField:
+    return PanoField(
+        slug=slug,
+        field_type='dimension',
+        display_name=slug,
+        group='group',
+        data_type='text',
+        data_source='dataset',
+        package='dataset',
+        file_name=f'{slug}.field.yaml',
+        **kwargs,
+    )
+
+
+def _fields_dir(tmp_path):
+    return tmp_path / 'dataset' / SystemDirectory.FIELDS.value
+
+
+def test_execute_all(tmp_path):
+    fields_dir = _fields_dir(tmp_path)
+    fields_dir.mkdir(parents=True)
+    (fields_dir / 'updated.field.yaml').write_text('old')
+    (fields_dir / 'deleted.field.yaml').write_text('old')
+
+    writer = FileWriter(cwd=tmp_path, skip_unchanged=True)
+    executor = LocalExecutor(writer)
+    executor.execute_all(
+        [
+            *(Action(desired=_field(f'created_{idx}')) for idx in range(20)),
+            Action(current=_field('updated'), desired=_field('updated', description='new')),
+            Action(current=_field('deleted')),
+        ]
+    )
+
+    assert sorted(path.name for path in fields_dir.iterdir()) == sorted(
+        [*(f'created_{idx}.field.yaml' for idx in range(20)), 'updated.field.yaml']
+    )
+    assert 'description: new' in (fields_dir / 'updated.field.yaml').read_text()
+    assert (executor.success_count, executor.failure_count, executor.total_count) == (22, 0, 22)
+    assert writer.report.written == 21
+    # staged files are cleaned up
+    assert list((tmp_path / SystemDirectory.CACHE.value / 'staging').iterdir()) == []
+
+
+def test_execute_all_failed_action(tmp_path):
+    fields_dir = _fields_dir(tmp_path)
+    fields_dir.mkdir(parents=True)
+    (fields_dir / 'deleted.field.yaml').write_text('old')
+
+    # field without file cannot be deleted
+    broken_field = _field('broken')
+    broken_field.file_name = None
+
+    executor = LocalExecutor(FileWriter(cwd=tmp_path))
+    actions = [Action(desired=_field('created')), Action(current=_field('deleted')), Action(current=broken_field)]
+    with pytest.raises(ExecuteActionsException):
+        executor.execute_all(actions)
+
+    # no file changed
+    assert [path.name for path in fields_dir.iterdir()] == ['deleted.field.yaml']
+    assert (executor.success_count, executor.failure_count, executor.total_count) == (0, 1, 3)
+
+
+def test_execute_all_failed_commit(tmp_path):
+    fields_dir = _fields_dir(tmp_path)
+    fields_dir.mkdir(parents=True)
+    (fields_dir / 'updated.field.yaml').write_text('old')
+    (fields_dir / 'deleted.field.yaml').write_text('old')
+
+    executor = LocalExecutor(FileWriter(cwd=tmp_path))
+    actions = [
+        Action(current=_field('updated'), desired=_field('updated', description='new')),
+        Action(current=_field('deleted')),
+        Action(desired=_field('created')),
+    ]
+
+    original_replace = os.replace
+
+    def fail_last_move(src, dst):
+        if str(dst).endswith('created.field.yaml'):
+            raise OSError('disk full')
+        return original_replace(src, dst)
+
+    with patch('panoramic.cli.local.transaction.os.replace', side_effect=fail_last_move):
+        with pytest.raises(ExecuteActionsException):
+            executor.execute_all(actions)
+
+    # previous files are restored
+    assert sorted(path.name for path in fields_dir.iterdir()) == ['deleted.field.yaml', 'updated.field.yaml']
+    assert (fields_dir / 'updated.field.yaml').read_text() == 'old'
+    assert (executor.success_count, executor.failure_count, executor.total_count) == (0, 3, 3)
+
+
+def test_transaction_rejects_conflicting_changes(tmp_path):
+    transaction = FileTransaction(staging_dir=tmp_path / 'staging')
+    transaction.write_text(tmp_path / 'file.yaml', 'a')
+
+    with pytest.raises(ValueError):
+        transaction.delete(tmp_path / 'file.yaml')
+
+    transaction.rollback()
+    assert not (tmp_path / 'file.yaml').exists()
+    assert not transaction.staging_dir.exists()
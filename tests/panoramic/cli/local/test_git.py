@@ -0,0 +1,41 @@
+import subprocess
+
+import pytest
+
+from panoramic.cli.errors import GitStatusException
+from panoramic.cli.local.git import get_changed_files
+
+
+def _git(cwd, *args):
+    subprocess.run(['git', *args], cwd=cwd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def test_get_changed_files(tmp_path):
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 'test@example.com')
+    _git(tmp_path, 'config', 'user.name', 'test')
+    (tmp_path / 'dataset').mkdir()
+    (tmp_path / 'dataset' / 'unchanged.model.yaml').write_text('a')
+    (tmp_path / 'dataset' / 'changed.model.yaml').write_text('a')
+    (tmp_path / 'dataset' / 'renamed.model.yaml').write_text('renamed')
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'init')
+
+    (tmp_path / 'dataset' / 'changed.model.yaml').write_text('b')
+    (tmp_path / 'fields').mkdir()
+    (tmp_path / 'fields' / 'new.field.yaml').write_text('a')
+    _git(tmp_path, 'mv', 'dataset/renamed.model.yaml', 'dataset/moved.model.yaml')
+
+    changed_files = get_changed_files(tmp_path / 'dataset')
+
+    assert sorted(path.relative_to(tmp_path.resolve()).as_posix() for path in changed_files) == [
+        'dataset/changed.model.yaml',
+        'dataset/moved.model.yaml',
+        'dataset/renamed.model.yaml',
+        'fields/new.field.yaml',
+    ]
+
+
+def test_get_changed_files_outside_repository(tmp_path):
+    with pytest.raises(GitStatusException):
+        get_changed_files(tmp_path)
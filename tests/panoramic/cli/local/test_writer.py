@@ -143,3 +143,36 @@ def test_writer_write_model(mock_write_yaml, tmp_path):
     assert mock_write_yaml.mock_calls == [
         call(tmp_path / 'test_dataset' / f'model{FileExtension.MODEL_YAML.value}', mock_model.to_dict()),
     ]
+
+
+def test_writer_skip_unchanged_model(tmp_path):
+    model = PanoModel(model_name='model', fields=[], joins=[], identifiers=[])
+    writer = FileWriter(cwd=tmp_path, skip_unchanged=True)
+
+    writer.write_model(model, package='test_dataset')
+    path = tmp_path / 'test_dataset' / f'model{FileExtension.MODEL_YAML.value}'
+    mtime_ns = path.stat().st_mtime_ns
+
+    writer.write_model(model, package='test_dataset')
+
+    assert path.stat().st_mtime_ns == mtime_ns
+    assert writer.report.written == 1
+    assert writer.report.skipped == 1
+    assert writer.report.bytes_written == path.stat().st_size
+
+
+def test_writer_skip_unchanged_rewrites_changed_field(tmp_path):
+    writer = FileWriter(cwd=tmp_path, skip_unchanged=True)
+
+    writer.write_field(
+        PanoField(slug='slug', group='CLI', field_type='dimension', display_name='Slug', data_type='text')
+    )
+    writer.write_field(
+        PanoField(slug='slug', group='CLI', field_type='dimension', display_name='New Slug', data_type='text')
+    )
+
+    path = tmp_path / SystemDirectory.FIELDS.value / f'slug{FileExtension.FIELD_YAML.value}'
+    assert 'New Slug' in path.read_text()
+    assert writer.report.written == 2
+    assert writer.report.skipped == 0
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
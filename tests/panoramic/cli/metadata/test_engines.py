@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+
+from panoramic.cli.metadata.engines.inspector import InspectorScanner
+from panoramic.cli.metadata.engines.snowflake import SnowflakeScanner
+from panoramic.cli.scan import column_name_from_data_reference
+
+
+@patch('panoramic.cli.metadata.engines.snowflake.Connection.execute')
+@patch.object(SnowflakeScanner, '_get_connection')
+def test_snowflake_scan_columns(mock_get_connection, mock_execute):
+    mock_execute.side_effect = [
+        [
+            {'table_schema': 'SCHEMA', 'table_name': 'TABLE_A', 'column_name': 'SPEND', 'data_type': 'NUMBER'},
+            {'table_schema': 'SCHEMA', 'table_name': 'TABLE_B', 'column_name': 'NAME', 'data_type': 'TEXT'},
+        ],
+        [{'table_schema': 'SCHEMA', 'table_name': 'TABLE_C', 'column_name': 'DAY', 'data_type': 'DATE'}],
+    ]
+
+    scanner = SnowflakeScanner()
+    scanner.scan_columns(
+        {
+            'DB1.SCHEMA.TABLE_A': {'SPEND'},
+            'DB1.SCHEMA.TABLE_B': {'NAME'},
+            'DB2.SCHEMA.TABLE_C': {'DAY'},
+            'invalid_model_name': {'COLUMN'},
+        }
+    )
+
+    # one query per database
+    assert mock_execute.call_count == 2
+    db1_query, _, db1_params = mock_execute.call_args_list[0][0]
+    assert 'DB1.INFORMATION_SCHEMA.COLUMNS' in db1_query
+    assert db1_params == {
+        'schema_0': 'SCHEMA',
+        'table_0': 'TABLE_A',
+        'column_0_0': 'SPEND',
+        'schema_1': 'SCHEMA',
+        'table_1': 'TABLE_B',
+        'column_1_0': 'NAME',
+    }
+
+    assert {
+        model_name: [(f.data_reference, f.data_type) for f in model.fields]
+        for model_name, model in scanner.models.items()
+    } == {
+        'DB1.SCHEMA.TABLE_A': [('"SPEND"', 'numeric')],
+        'DB1.SCHEMA.TABLE_B': [('"NAME"', 'text')],
+        'DB2.SCHEMA.TABLE_C': [('"DAY"', 'datetime')],
+    }
+
+
+@patch('panoramic.cli.metadata.engines.snowflake.Connection.execute')
+@patch.object(SnowflakeScanner, '_get_connection')
+def test_snowflake_scan_columns_unquoted_reference(mock_get_connection, mock_execute):
+    mock_execute.return_value = [
+        {'table_schema': 'SCHEMA', 'table_name': 'TABLE_A', 'column_name': 'AD_ID', 'data_type': 'NUMBER'}
+    ]
+
+    scanner = SnowflakeScanner()
+    scanner.scan_columns({'DB1.SCHEMA.TABLE_A': {column_name_from_data_reference('ad_id')}})
+
+    query, _, params = mock_execute.call_args[0]
+    assert 'UPPER(column_name) IN (:column_0_0)' in query
+    assert params['column_0_0'] == 'AD_ID'
+    assert [(f.data_reference, f.data_type) for f in scanner.models['DB1.SCHEMA.TABLE_A'].fields] == [
+        ('"AD_ID"', 'numeric')
+    ]
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path):
+    url = f'sqlite:///{tmp_path / "db.sqlite"}'
+    engine = create_engine(url)
+    engine.execute('CREATE TABLE ads (ad_id INTEGER, spend FLOAT, name VARCHAR(100))')
+    with patch.object(InspectorScanner, '_get_connection', return_value={'url': url}):
+        yield
+
+
+def test_inspector_scan_columns(sqlite_connection):
+    scanner = InspectorScanner()
+    scanner.scan_columns({'ads': {'spend', 'ad_id'}, 'missing_table': {'column'}})
+
+    assert list(scanner.models.keys()) == ['ads']
+    assert [(f.data_reference, f.data_type) for f in scanner.models['ads'].fields] == [
+        ('"ad_id"', 'integer'),
+        ('"spend"', 'numeric'),
+    ]
@@ -5,6 +5,8 @@ from click.core import Context
 
 from panoramic.cli.cli import ContextAwareCommand, LocalStateAwareCommand
 from panoramic.cli.errors import SourceNotFoundException, ValidationError
+from panoramic.cli.local import get_state
+from panoramic.cli.state import VirtualState
 
 
 @patch('panoramic.cli.validate.validate_context', side_effect=SourceNotFoundException('test'))
@@ -39,7 +41,10 @@ def test_context_aware_command_valid(_):
 
 
 @patch('panoramic.cli.validate.validate_context')
-@patch('panoramic.cli.validate.validate_local_state', return_value=[ValidationError('test')])
+@patch(
+    'panoramic.cli.validate.load_local_state',
+    return_value=(VirtualState(data_sources=[], models=[], fields=[]), [ValidationError('test')]),
+)
 def test_local_state_aware_command_invalid(_, __, capsys):
     """Check command fails when no context."""
     with pytest.raises(SystemExit):
@@ -49,14 +54,47 @@ def test_local_state_aware_command_invalid(_, __, capsys):
 
 
 @patch('panoramic.cli.validate.validate_context')
-@patch('panoramic.cli.validate.validate_local_state')
-def test_local_state_aware_command_valid(_, __):
+@patch('panoramic.cli.validate.load_local_state')
+@patch('panoramic.cli.tel_validation.validate_tel')
+@patch('panoramic.cli.husky.service.model_retriever.component.ModelRetriever.preload_state')
+@patch('panoramic.cli.husky.core.taxonomy.getters.Taxonomy.preload_taxons')
+@patch('panoramic.cli.local.get._preloaded_state', None)
+@patch('panoramic.cli.local.get.FileReader', side_effect=AssertionError('local files are read again'))
+def test_local_state_aware_command_valid(
+    _, mock_preload_taxons, mock_preload_state, mock_validate_tel, mock_load_local_state, __
+):
     """Check command succeeds when context exists."""
+    state = VirtualState(data_sources=[], models=[], fields=[])
+    taxons = [Mock()]
+    mock_load_local_state.return_value = (state, [])
+    mock_validate_tel.return_value = (taxons, [])
 
     def test_callback():
-        return 10
+        # command gets the already loaded state
+        return get_state()
 
     command = LocalStateAwareCommand(name='test-command', callback=test_callback)
     context = Context(command)
 
-    assert command.invoke(context) == 10
+    assert command.invoke(context) is state
+    # local files are loaded only once and taxons are preloaded with TEL metadata
+    mock_validate_tel.assert_called_once_with(state)
+    mock_preload_taxons.assert_called_once_with(taxons)
+    mock_preload_state.assert_called_once_with(state)
+
+
+@patch('panoramic.cli.validate.validate_context')
+@patch('panoramic.cli.validate.load_local_state')
+@patch('panoramic.cli.tel_validation.validate_tel')
+@patch('panoramic.cli.husky.service.model_retriever.component.ModelRetriever.preload_state')
+@patch('panoramic.cli.husky.core.taxonomy.getters.Taxonomy.preload_taxons')
+@patch('panoramic.cli.local.get._preloaded_state', None)
+def test_local_state_aware_command_invalid_tel(_, __, mock_validate_tel, mock_load_local_state, ___, capsys):
+    """Check command only warns when TEL expression is invalid, `pano validate` fails on it."""
+    mock_load_local_state.return_value = (VirtualState(data_sources=[], models=[], fields=[]), [])
+    mock_validate_tel.return_value = ([], [ValidationError('test')])
+
+    command = LocalStateAwareCommand(name='test-command', callback=lambda: 10)
+
+    assert command.invoke(Context(command)) == 10
+    assert capsys.readouterr().out == '\nWarning: test\n\n'
@@ -2,9 +2,21 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from panoramic.cli.command import delete_orphaned_fields, scaffold_missing_fields
-from panoramic.cli.errors import OrphanFieldFileError
+from panoramic.cli.command import (
+    delete_orphaned_fields,
+    detect_joins,
+    field_usages,
+    scaffold_missing_fields,
+)
 from panoramic.cli.local.executor import LocalExecutor
+from panoramic.cli.pano_model import (
+    PanoField,
+    PanoModel,
+    PanoModelField,
+    PanoModelJoin,
+    PanoVirtualDataSource,
+)
+from panoramic.cli.state import VirtualState
 
 
 @pytest.fixture
@@ -37,15 +49,28 @@ def mock_physical_data_source_client():
         yield client_class()
 
 
+def _field(slug: str, package: str = 'test_dataset', calculation=None) -> PanoField:
+    return PanoField(
+        slug=slug,
+        group='group',
+        display_name=slug,
+        data_type='text',
+        field_type='dimension',
+        calculation=calculation,
+        data_source=package,
+        package=package,
+        file_name=f'{slug}.field.yaml',
+    )
+
+
 @patch('panoramic.cli.command.get_local_state')
-@patch('panoramic.cli.command.validate_orphaned_files')
 @patch.object(LocalExecutor, '_execute')
-def test_delete_orphaned_fields(mock_execute, mock_validate, mock_state, capsys):
-    mock_state.return_value.get_objects_by_package.return_value.items.return_value = [
-        ('test_dataset', ([Mock(slug='test_slug', data_source='test_dataset')], [Mock()])),
-    ]
-
-    mock_validate.return_value = [OrphanFieldFileError(field_slug='test_slug', dataset_slug='test_dataset')]
+def test_delete_orphaned_fields(mock_execute, mock_state, capsys):
+    mock_state.return_value = VirtualState(
+        data_sources=[],
+        models=[_model_with_ids('model', 'test_dataset', ['used_slug'])],
+        fields=[_field('test_slug'), _field('used_slug'), _field('calculated_slug', calculation='used_slug')],
+    )
 
     delete_orphaned_fields(yes=True)
 
@@ -59,18 +84,61 @@ def test_delete_orphaned_fields(mock_execute, mock_validate, mock_state, capsys)
     )
 
 
+@patch('panoramic.cli.command.get_local_state')
+def test_field_usages(mock_state, capsys, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    mock_state.return_value = VirtualState(
+        data_sources=[],
+        models=[_model_with_ids('model', 'test_dataset', ['used_slug'])],
+        fields=[
+            _field('used_slug'),
+            _field('calculated_slug', calculation='used_slug + other_dataset|used_slug'),
+            _field('other_slug', calculation='other_slug_2'),
+        ],
+    )
+
+    field_usages('used_slug')
+
+    assert capsys.readouterr().out == (
+        "Loading local state...\n\n"
+        "Models mapping field used_slug:\n"
+        "  test_dataset/model: \"used_slug\" (identifier)\n\n"
+        "Fields using field used_slug in calculation:\n"
+        "  test_dataset/calculated_slug: used_slug + other_dataset|used_slug\n"
+    )
+
+    field_usages('other_dataset|used_slug')
+
+    assert capsys.readouterr().out == (
+        "Loading local state...\n\n"
+        "Fields using field other_dataset|used_slug in calculation:\n"
+        "  test_dataset/calculated_slug: used_slug + other_dataset|used_slug\n"
+    )
+
+    field_usages('unused_slug')
+
+    assert (
+        capsys.readouterr().out == "Loading local state...\nField unused_slug is not used by any model or calculation\n"
+    )
+
+
 @patch('panoramic.cli.command.get_local_state')
 @patch.object(LocalExecutor, '_execute')
 def test_scaffold_missing_files(mock_execute, mock_state, capsys):
-    mock_state.return_value.get_objects_by_package.return_value.items.return_value = [
-        (
-            'test_dataset',
-            (
-                [],
-                [Mock(identifiers=['id'], fields=[Mock(field_map=['test_slug'])])],
-            ),
-        ),
-    ]
+    mock_state.return_value = VirtualState(
+        data_sources=[],
+        models=[
+            PanoModel(
+                model_name='model',
+                fields=[PanoModelField(field_map=['test_slug'], data_reference='"TEST_SLUG"', data_type=None)],
+                joins=[],
+                identifiers=['id'],
+                virtual_data_source='test_dataset',
+                package='test_dataset',
+            )
+        ],
+        fields=[],
+    )
 
     scaffold_missing_fields(yes=True)
 
@@ -82,4 +150,142 @@ def test_scaffold_missing_files(mock_execute, mock_state, capsys):
         "Scanning fields...\n"
         "Updating local state...\n"
         "Updated 1/1 fields\n"
+        "Files: 0 files written (0 bytes), 0 unchanged files skipped\n"
+    )
+
+
+@patch('panoramic.cli.command.Scanner')
+@patch('panoramic.cli.command.Connection')
+@patch('panoramic.cli.command.get_local_state')
+@patch.object(LocalExecutor, '_execute')
+def test_scaffold_missing_files_remote(mock_execute, mock_state, mock_connection, mock_scanner_cls):
+    mock_state.return_value = VirtualState(
+        data_sources=[],
+        models=[
+            PanoModel(
+                model_name='db.schema.table',
+                fields=[PanoModelField(field_map=['test_slug'], data_reference='"TEST_COLUMN"', data_type=None)],
+                joins=[],
+                identifiers=[],
+                virtual_data_source='test_dataset',
+                package='test_dataset',
+            )
+        ],
+        fields=[],
     )
+    mock_connection.get_dialect_name.return_value = 'snowflake'
+    mock_scanner = mock_scanner_cls.get_scanner.return_value.return_value
+    mock_scanner.models = {}
+
+    scaffold_missing_fields(yes=True, no_remote=False)
+
+    assert mock_scanner.scan.call_count == 0
+    mock_scanner.scan_columns.assert_called_once_with({'db.schema.table': {'TEST_COLUMN'}})
+    assert mock_execute.call_count == 1
+
+
+def _model_with_ids(model_name: str, dataset: str, identifiers: list) -> PanoModel:
+    return PanoModel(
+        model_name=model_name,
+        fields=[PanoModelField(field_map=[id], data_reference=f'"{id}"', data_type=None) for id in identifiers],
+        joins=[],
+        identifiers=identifiers,
+        virtual_data_source=dataset,
+        package=dataset,
+        file_name=f'{model_name}.model.yaml',
+    )
+
+
+@patch('panoramic.cli.command.get_local_state')
+@patch.object(LocalExecutor, '_execute')
+def test_detect_joins_multiple_datasets(mock_execute, mock_state, capsys):
+    mock_state.return_value = VirtualState(
+        data_sources=[
+            PanoVirtualDataSource(dataset_slug='dataset_b', display_name='B'),
+            PanoVirtualDataSource(dataset_slug='dataset_a', display_name='A'),
+            PanoVirtualDataSource(dataset_slug='dataset_c', display_name='C'),
+        ],
+        models=[
+            _model_with_ids('ads', 'dataset_a', ['ad_id', 'adset_id']),
+            _model_with_ids('adsets', 'dataset_a', ['adset_id']),
+            _model_with_ids('campaigns', 'dataset_b', ['campaign_id']),
+            _model_with_ids('campaign_stats', 'dataset_b', ['campaign_id']),
+            # identifier without field makes the model invalid
+            PanoModel(model_name='broken', fields=[], joins=[], identifiers=['id'], virtual_data_source='dataset_c'),
+        ],
+        fields=[],
+    )
+
+    detect_joins(yes=True)
+
+    assert [call[0][0].desired.joins for call in mock_execute.call_args_list] == [
+        [PanoModelJoin(fields=['campaign_id'], join_type='left', relationship='one_to_one', to_model='campaign_stats')],
+        [PanoModelJoin(fields=['adset_id'], join_type='left', relationship='many_to_one', to_model='adsets')],
+    ]
+    progress = [line for line in capsys.readouterr().out.splitlines() if line.startswith(('Detect', 'Error'))]
+    assert progress == [
+        'Detecting joins for dataset dataset_b',
+        'Detected 1 joins for campaigns under dataset dataset_b',
+        'Detecting joins for dataset dataset_a',
+        'Detected 1 joins for ads under dataset dataset_a',
+        'Detecting joins for dataset dataset_c',
+        'Error: An unexpected error occured when detecting joins for dataset_c',
+    ]
+
+
+@patch('panoramic.cli.command.Connection')
+@patch('panoramic.cli.command.get_local_state')
+@patch('panoramic.cli.command.verify_join')
+def test_detect_joins_verify(mock_verify_join, mock_state, mock_connection, capsys):
+    mock_state.return_value = VirtualState(
+        data_sources=[PanoVirtualDataSource(dataset_slug='dataset', display_name='Dataset')],
+        models=[
+            _model_with_ids('adsets', 'dataset', ['adset_id']),
+            _model_with_ids('adset_stats', 'dataset', ['adset_id']),
+        ],
+        fields=[],
+    )
+    mock_verify_join.return_value.verified_join.return_value = None
+    mock_verify_join.return_value.__str__.return_value = '2/3 unique keys in adset_stats'
+
+    detect_joins(yes=True, verify=True, sample_size=100)
+
+    model, join, to_model, connection, sample_size = mock_verify_join.call_args[0]
+    assert (model.model_name, join.to_model, to_model.model_name) == ('adsets', 'adset_stats', 'adset_stats')
+    assert (connection, sample_size) == (mock_connection.get.return_value, 100)
+    output = capsys.readouterr().out
+    assert 'Dropped join adsets -> adset_stats: 2/3 unique keys in adset_stats\n' in output
+    assert output.endswith('No joins detected\n')
+
+
+@patch.object(LocalExecutor, '_execute')
+@patch('panoramic.cli.command.Connection')
+@patch('panoramic.cli.command.get_local_state')
+@patch('panoramic.cli.command.verify_join')
+def test_detect_joins_verify_keeps_joins_failing_to_verify(
+    mock_verify_join, mock_state, mock_connection, mock_execute, capsys, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    mock_state.return_value = VirtualState(
+        data_sources=[PanoVirtualDataSource(dataset_slug='dataset', display_name='Dataset')],
+        models=[
+            _model_with_ids('ads', 'dataset', ['ad_id', 'adset_id']),
+            _model_with_ids('adsets', 'dataset', ['adset_id']),
+            _model_with_ids('adset_stats', 'dataset', ['adset_id']),
+        ],
+        fields=[],
+    )
+    verified_result = Mock()
+    verified_result.verified_join.return_value = None
+    mock_verify_join.side_effect = [Exception('SQL compilation error'), verified_result, verified_result]
+
+    detect_joins(yes=True, verify=True)
+
+    assert mock_verify_join.call_count == 3
+    output = capsys.readouterr().out
+    assert 'Could not verify join ads -> adsets: SQL compilation error\n' in output
+    assert [call[0][0].desired.joins for call in mock_execute.call_args_list] == [
+        [PanoModelJoin(fields=['adset_id'], join_type='left', relationship='many_to_one', to_model='adsets')]
+    ]
+    # model files are written only by the patched action execution
+    assert [path for path in tmp_path.rglob('*') if path.is_file()] == []
@@ -0,0 +1,120 @@
+import json
+from copy import deepcopy
+
+import pytest
+
+from panoramic.cli.diff import (
+    Change,
+    ChangeType,
+    DiffOptions,
+    diff_dicts,
+    diff_to_dict,
+    echo_diff,
+)
+from panoramic.cli.pano_model import PanoModel, PanoModelJoin
+from panoramic.cli.state import Action, ActionList
+
+
+def _model(model_name: str, package: str = 'dataset') -> PanoModel:
+    return PanoModel.from_dict(
+        {
+            'model_name': model_name,
+            'fields': [{'field_map': ['ad_id'], 'data_reference': '"AD_ID"'}],
+            'joins': [],
+            'identifiers': ['ad_id'],
+            'package': package,
+            'virtual_data_source': package,
+        }
+    )
+
+
+@pytest.fixture
+def actions():
+    current = _model('ads')
+    desired = deepcopy(current)
+    desired.identifiers = ['ad_id', 'date']
+    desired.joins.append(
+        PanoModelJoin(to_model='adsets', join_type='left', relationship='many_to_one', fields=['ad_id'])
+    )
+    return ActionList(
+        actions=[
+            Action(current=current, desired=desired),
+            Action(desired=_model('campaigns')),
+            Action(current=_model('adsets', package='other_dataset')),
+        ]
+    )
+
+
+def test_diff_dicts_equal():
+    assert diff_dicts({'a': [1, {'b': 2}]}, {'a': [1, {'b': 2}]}) == []
+
+
+def test_diff_dicts():
+    current = {'name': 'a', 'removed': 1, 'nested': {'value': 1}, 'items': [1, 2, 3]}
+    desired = {'name': 'a', 'nested': {'value': 2}, 'items': [0, 1, 3], 'added': True}
+
+    assert diff_dicts(current, desired) == [
+        Change(type=ChangeType.REMOVED, path='removed', old=1),
+        Change(type=ChangeType.CHANGED, path='nested.value', old=1, new=2),
+        Change(type=ChangeType.REMOVED, path='items[]', old=2),
+        Change(type=ChangeType.ADDED, path='items[]', new=0),
+        Change(type=ChangeType.ADDED, path='added', new=True),
+    ]
+
+
+def test_diff_dicts_reordered_list():
+    assert diff_dicts({'items': [1, 2]}, {'items': [2, 1]}) == [
+        Change(type=ChangeType.REORDERED, path='items', old=[1, 2], new=[2, 1])
+    ]
+
+
+def test_echo_diff(actions, capsys):
+    echo_diff(actions)
+
+    assert capsys.readouterr().out == (
+        'UPDATE: dataset.ads\n'
+        '  + joins[]: {"fields": ["ad_id"], "join_type": "left", "relationship": "many_to_one", "to_model": "adsets"}\n'
+        '  + identifiers[]: "date"\n'
+        '\n'
+        'CREATE: dataset.campaigns\n'
+        '\n'
+        'DELETE: other_dataset.adsets\n'
+        '\n'
+    )
+
+
+def test_echo_diff_max_lines(actions, capsys):
+    echo_diff(actions, DiffOptions(max_lines=2))
+
+    assert capsys.readouterr().out == (
+        'UPDATE: dataset.ads\n'
+        '  + joins[]: {"fields": ["ad_id"], "join_type": "left", "relationship": "many_to_one", "to_model": "adsets"}\n'
+        '... 6 more lines not shown\n'
+    )
+
+
+def test_echo_diff_summary(actions, capsys):
+    echo_diff(actions, DiffOptions(summary=True))
+
+    assert capsys.readouterr().out == ('Summary:\n  dataset: 1 to create, 1 to update\n  other_dataset: 1 to delete\n')
+
+
+def test_echo_diff_json(actions, tmp_path, capsys):
+    json_path = tmp_path / 'diff.json'
+    echo_diff(actions, DiffOptions(summary=True, json_path=json_path))
+
+    assert json.loads(json_path.read_text()) == json.loads(json.dumps(diff_to_dict(actions)))
+    assert json.loads(json_path.read_text())['actions'][0] == {
+        'type': 'update',
+        'dataset': 'dataset',
+        'id': ['dataset', 'ads'],
+        'changes': [
+            {
+                'type': 'added',
+                'path': 'joins[]',
+                'old': None,
+                'new': {'fields': ['ad_id'], 'join_type': 'left', 'relationship': 'many_to_one', 'to_model': 'adsets'},
+            },
+            {'type': 'added', 'path': 'identifiers[]', 'old': None, 'new': 'date'},
+        ],
+    }
@@ -0,0 +1,20 @@
+from panoramic.cli.file_utils import read_yaml, write_yaml, write_yaml_if_changed
+
+
+def test_write_yaml_replaces_file(tmp_path):
+    path = tmp_path / 'dir' / 'file.yaml'
+
+    write_yaml(path, {'key': 'value'})
+    write_yaml(path, {'key': 'other value'})
+
+    assert read_yaml(path) == {'key': 'other value'}
+    assert [p.name for p in path.parent.iterdir()] == ['file.yaml']
+
+
+def test_write_yaml_if_changed(tmp_path):
+    path = tmp_path / 'file.yaml'
+
+    assert write_yaml_if_changed(path, {'key': 'value'}) == len('key: value\n')
+    assert write_yaml_if_changed(path, {'key': 'value'}) is None
+    assert write_yaml_if_changed(path, {'key': 'new'}) == len('key: new\n')
+    assert read_yaml(path) == {'key': 'new'}
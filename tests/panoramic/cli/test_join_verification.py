@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy import create_engine
+
+from panoramic.cli.errors import JoinVerificationException
+from panoramic.cli.join_verification import verify_join
+from panoramic.cli.pano_model import PanoModel, PanoModelField, PanoModelJoin
+
+
+@pytest.fixture
+def sqlite_connection(tmp_path):
+    url = f'sqlite:///{tmp_path / "db.sqlite"}'
+    engine = create_engine(url)
+    engine.execute('CREATE TABLE ads (ad_id INTEGER, adset_id INTEGER)')
+    engine.execute('INSERT INTO ads VALUES (1, 10), (2, 10), (3, 20), (4, NULL)')
+    engine.execute('CREATE TABLE adsets (adset_id INTEGER)')
+    engine.execute('INSERT INTO adsets VALUES (10), (20), (30)')
+    engine.execute('CREATE TABLE adset_stats (adset_id INTEGER)')
+    engine.execute('INSERT INTO adset_stats VALUES (10), (10), (20)')
+    engine.execute('CREATE TABLE campaigns (campaign_id INTEGER)')
+    engine.execute('INSERT INTO campaigns VALUES (100)')
+    return {'url': url}
+
+
+def _model(model_name: str, *columns: str) -> PanoModel:
+    return PanoModel(
+        model_name=model_name,
+        fields=[PanoModelField(field_map=[column], data_reference=f'"{column}"', data_type=None) for column in columns],
+        joins=[],
+        identifiers=[],
+    )
+
+
+def _join(to_model: str, relationship: str, field: str) -> PanoModelJoin:
+    return PanoModelJoin(fields=[field], join_type='left', relationship=relationship, to_model=to_model)
+
+
+def test_verify_many_to_one_join(sqlite_connection):
+    join = _join('adsets', 'many_to_one', 'adset_id')
+
+    result = verify_join(_model('ads', 'ad_id', 'adset_id'), join, _model('adsets', 'adset_id'), sqlite_connection)
+
+    assert (result.many_side_rows, result.many_side_distinct_keys) == (3, 2)
+    assert (result.one_side_rows, result.one_side_distinct_keys) == (3, 3)
+    assert result.match_rate == 1.0
+    assert result.verified_join() == join
+
+
+def test_verify_drops_many_to_many_join(sqlite_connection):
+    join = _join('adset_stats', 'many_to_one', 'adset_id')
+
+    result = verify_join(_model('ads', 'adset_id'), join, _model('adset_stats', 'adset_id'), sqlite_connection)
+
+    assert not result.is_one_side_unique
+    assert result.verified_join() is None
+
+
+def test_verify_corrects_one_to_one_join(sqlite_connection):
+    join = _join('adsets', 'one_to_one', 'adset_id')
+
+    result = verify_join(_model('adset_stats', 'adset_id'), join, _model('adsets', 'adset_id'), sqlite_connection)
+
+    assert result.verified_join() == _join('adsets', 'many_to_one', 'adset_id')
+
+
+def test_verify_drops_join_without_matches(sqlite_connection):
+    join = _join('campaigns', 'many_to_one', 'adset_id')
+    to_model = PanoModel(
+        model_name='campaigns',
+        fields=[PanoModelField(field_map=['adset_id'], data_reference='"campaign_id"', data_type=None)],
+        joins=[],
+        identifiers=[],
+    )
+
+    result = verify_join(_model('adsets', 'adset_id'), join, to_model, sqlite_connection)
+
+    assert result.match_rate == 0.0
+    assert result.verified_join() is None
+
+
+def test_verify_uses_sample_size(sqlite_connection):
+    join = _join('adset_stats', 'many_to_one', 'adset_id')
+
+    result = verify_join(
+        _model('ads', 'adset_id'), join, _model('adset_stats', 'adset_id'), sqlite_connection, sample_size=1
+    )
+
+    assert (result.many_side_rows, result.one_side_rows) == (1, 1)
+
+
+def test_verify_join_on_expression_fails(sqlite_connection):
+    model = PanoModel(
+        model_name='ads',
+        fields=[PanoModelField(field_map=['adset_id'], data_reference='"adset_id" + 1', data_type=None)],
+        joins=[],
+        identifiers=[],
+    )
+
+    with pytest.raises(JoinVerificationException):
+        verify_join(model, _join('adsets', 'many_to_one', 'adset_id'), _model('adsets', 'adset_id'), sqlite_connection)
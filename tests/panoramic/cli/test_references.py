@@ -0,0 +1,71 @@
+from panoramic.cli.pano_model import PanoField, PanoModel, PanoModelField
+from panoramic.cli.references import CalculationSlugsCache, ReferenceIndex
+
+
+def _field(slug: str, calculation=None) -> PanoField:
+    return PanoField(
+        slug=slug,
+        group='group',
+        display_name=slug,
+        data_type='text',
+        field_type='dimension',
+        calculation=calculation,
+        data_source='dataset',
+        package='dataset',
+        file_name=f'{slug}.field.yaml',
+    )
+
+
+def _model(model_name: str, slugs: list) -> PanoModel:
+    return PanoModel(
+        model_name=model_name,
+        fields=[PanoModelField(field_map=[slug], data_reference=f'"{slug}"', data_type=None) for slug in slugs],
+        joins=[],
+        identifiers=[],
+        virtual_data_source='dataset',
+        package='dataset',
+    )
+
+
+def test_reference_index_model_references():
+    model_a = _model('model_a', ['slug_1', 'slug_2'])
+    model_b = _model('model_b', ['slug_2'])
+    index = ReferenceIndex.from_objects([_field('slug_1'), _field('slug_3')], [model_a, model_b])
+
+    assert [r.model_name for r in index.model_references('slug_2')] == ['model_a', 'model_b']
+    assert index.missing_field_slugs('dataset') == ['slug_2']
+    assert [f.slug for f in index.orphaned_fields('dataset')] == ['slug_3']
+
+
+def test_reference_index_calculation_references():
+    calculated_field = _field('calculated', calculation='slug_1 / other|slug_2 + slug_2')
+    index = ReferenceIndex.from_objects([_field('slug_1'), calculated_field], [])
+
+    assert [r.field_slug for r in index.calculation_references('dataset|slug_1')] == ['calculated']
+    assert [r.field_slug for r in index.calculation_references('other|slug_2')] == ['calculated']
+    # slug without namespace not defined in the dataset is company-scoped
+    assert index.calculation_references('dataset|slug_2') == []
+    assert [r.field_slug for r in index.calculation_references('slug_2')] == ['calculated']
+
+
+def test_reference_index_resolves_namespace_to_package():
+    field = _field('slug_1')
+    field.package = 'dataset_dir'
+    # company-scoped calculation using the field from the dataset
+    calculated_field = _field('calculated', calculation='dataset|slug_1')
+    calculated_field.package = calculated_field.data_source = None
+    index = ReferenceIndex.from_objects([field, calculated_field], [])
+
+    assert [r.field_slug for r in index.calculation_references('dataset|slug_1')] == ['calculated']
+    assert index._calculation_references is not None
+    assert list(index._calculation_references['slug_1']) == ['dataset_dir']
+
+
+def test_calculation_slugs_cache(tmp_path):
+    cache_path = tmp_path / 'calculations.json'
+    cache = CalculationSlugsCache.load(cache_path)
+    assert cache.used_slugs('a + b + ds|c') == ['a', 'b', 'ds|c']
+    cache.save()
+
+    loaded_cache = CalculationSlugsCache.load(cache_path)
+    assert loaded_cache._slugs_by_calculation == {'a + b + ds|c': ['a', 'b', 'ds|c']}
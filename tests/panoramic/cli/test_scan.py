@@ -0,0 +1,26 @@
+from panoramic.cli.errors import MissingFieldFileError
+from panoramic.cli.scan import columns_by_model_for_errors
+
+
+def _error(slug: str, data_reference: str, model_name: str) -> MissingFieldFileError:
+    return MissingFieldFileError(
+        field_slug=slug,
+        dataset_slug='test_dataset',
+        data_reference=data_reference,
+        identifier=False,
+        model_name=model_name,
+    )
+
+
+def test_columns_by_model_for_errors():
+    errors = [
+        _error('spend', '"SPEND"', 'db.schema.ads'),
+        _error('ad_id', 'ad_id', 'db.schema.ads'),
+        _error('clicks', '"CLICKS"', 'db.schema.stats'),
+        _error('ctr', '"CLICKS" / "IMPRESSIONS"', 'db.schema.stats'),
+    ]
+
+    assert columns_by_model_for_errors(errors) == {
+        'db.schema.ads': {'SPEND', 'ad_id'},
+        'db.schema.stats': {'CLICKS'},
+    }
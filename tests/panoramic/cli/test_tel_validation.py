@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+
+from panoramic.cli.pano_model import PanoField, PanoModel
+from panoramic.cli.state import VirtualState
+from panoramic.cli.tel_validation import validate_tel
+
+
+def _field(slug: str, calculation=None, **kwargs) -> PanoField:
+    return PanoField.from_dict(
+        {
+            'slug': slug,
+            'group': 'group',
+            'display_name': slug,
+            'data_type': 'numeric',
+            'field_type': 'metric',
+            'calculation': calculation,
+            'aggregation': None if calculation else {'type': 'sum'},
+            'file_name': f'{slug}.field.yaml',
+            **kwargs,
+        }
+    )
+
+
+@pytest.fixture
+def state():
+    model = PanoModel.from_dict(
+        {
+            'model_name': 'model',
+            'fields': [
+                {'field_map': ['spend'], 'data_reference': '"SPEND"'},
+                {'field_map': ['impressions'], 'data_reference': 'spend +'},
+                {'field_map': ['clicks'], 'data_reference': 'unknown'},
+            ],
+            'joins': [],
+            'identifiers': [],
+            'package': 'dataset',
+            'file_name': 'model.model.yaml',
+            'virtual_data_source': 'dataset',
+        }
+    )
+    fields = [
+        _field('spend'),
+        _field('impressions'),
+        _field('cpm', '?spend / ?impressions * 1000'),
+        _field('unknown_taxon', 'spend + unknown'),
+        _field('syntax_error', 'spend +'),
+        _field('type_error', 'contains(spend, "x")'),
+    ]
+    return VirtualState(data_sources=[], models=[model], fields=fields)
+
+
+def test_validate_tel(state):
+    taxons, errors = validate_tel(state)
+
+    assert [str(error) for error in errors] == [
+        'Taxon(s) not found: unknown\n  for calculation of field unknown_taxon\n  in fields/unknown_taxon.field.yaml',
+        'Unexpected symbol "<EOF>". Occurred at position 8, line 1 in expression "spend +"\n'
+        '  for calculation of field syntax_error\n  in fields/syntax_error.field.yaml',
+        'Argument 1 in function contains must be of type: string. '
+        'Occurred at position 10, line 1 in expression "contains(spend, "x")"\n'
+        '  for calculation of field type_error\n'
+        'Argument 1 in function contains must have a phase lower or equal than dimension. '
+        'Occurred at position 10, line 1 in expression "contains(spend, "x")"\n'
+        '  for calculation of field type_error\n  in fields/type_error.field.yaml',
+        'Unexpected symbol "<EOF>". Occurred at position 8, line 1 in expression "spend +"\n'
+        '  for data reference spend + of model model\n  in dataset/model.model.yaml',
+        'unknown not available in this model\n  for data reference unknown of model model\n  in dataset/model.model.yaml',
+    ]
+    # TEL metadata is precalculated for valid fields
+    assert {taxon.slug: taxon.tel_metadata is not None for taxon in taxons} == {
+        'spend': True,
+        'impressions': True,
+        'cpm': True,
+        'unknown_taxon': False,
+        'syntax_error': False,
+        'type_error': False,
+    }
+    assert {taxon.slug: taxon.tel_metadata.used_taxons for taxon in taxons if taxon.slug == 'cpm'} == {
+        'cpm': ['impressions', 'spend']
+    }
+
+
+def test_validate_tel_in_worker_processes(state):
+    _, expected_errors = validate_tel(state)
+
+    with patch('panoramic.cli.tel_validation.MIN_EXPRESSIONS_PER_WORKER', 1), patch(
+        'panoramic.cli.tel_validation.os.cpu_count', return_value=2
+    ):
+        taxons, errors = validate_tel(state)
+
+    assert errors == expected_errors
+    assert len([taxon for taxon in taxons if taxon.tel_metadata is not None]) == 3
+
+
+def test_validate_tel_same_model_name_in_packages(state):
+    model = PanoModel.from_dict(
+        {
+            'model_name': 'model',
+            'fields': [{'field_map': ['spend'], 'data_reference': 'spend +'}],
+            'joins': [],
+            'identifiers': [],
+            'package': 'other_dataset',
+            'file_name': 'model.model.yaml',
+            'virtual_data_source': 'other_dataset',
+        }
+    )
+    state = VirtualState(data_sources=[], models=[model, *state.models], fields=state.fields)
+
+    _, errors = validate_tel(state)
+
+    assert [str(error).splitlines()[-1] for error in errors if 'of model model' in str(error)] == [
+        '  in dataset/model.model.yaml',
+        '  in dataset/model.model.yaml',
+        '  in other_dataset/model.model.yaml',
+    ]
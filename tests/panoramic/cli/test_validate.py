@@ -1,7 +1,11 @@
+import datetime
+from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pytest
 import yaml
+from jsonschema import Draft7Validator
 
 from panoramic.cli.errors import (
     FileMissingError,
@@ -10,9 +14,20 @@ from panoramic.cli.errors import (
     MissingFieldFileError,
     OrphanFieldFileError,
 )
-from panoramic.cli.local.get import get_state
+from panoramic.cli.file_utils import read_yaml
+from panoramic.cli.local.get import get_state, preload_state
+from panoramic.cli.local.validation_cache import ValidationCache
 from panoramic.cli.paths import Paths, PresetFileName
-from panoramic.cli.validate import validate_context, validate_local_state
+from panoramic.cli.validate import (
+    JsonSchemaValidators,
+    _build_validator,
+    _load_file,
+    _validate_data,
+    _validate_package_fields,
+    load_local_state,
+    validate_context,
+    validate_local_state,
+)
 
 VALID_CONTEXT = {
     'api_version': 'v1',
@@ -568,3 +583,163 @@ def test_validate_local_state_orphan_field_files(tmp_path, monkeypatch):
     errors = validate_local_state()
 
     assert errors == [OrphanFieldFileError(field_slug='orphan_slug', dataset_slug='test_dataset')]
+
+
+def test_validate_local_state_reports_all_schema_errors_in_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    global_field_dir = tmp_path / 'fields'
+    global_field_dir.mkdir()
+
+    with (global_field_dir / 'a_field.field.yaml').open('w') as f:
+        f.write(yaml.dump({**VALID_FIELD_MINIMAL, 'slug': 123, 'calculation': 1}))
+
+    errors = validate_local_state()
+
+    assert len(errors) == 1
+    assert str(errors[0]) == (
+        "1 is not of type 'string'\n  for path calculation\n"
+        "123 is not of type 'string'\n  for path slug\n"
+        "  in fields/a_field.field.yaml"
+    )
+
+
+class _InMemoryPackage:
+    def __init__(self, fields):
+        self.fields = dict(fields)
+
+    @property
+    def field_files(self):
+        return list(self.fields)
+
+
+def test_validate_package_fields_builds_validator_once():
+    package = _InMemoryPackage(
+        (Path(f'fields/field_{idx}.field.yaml'), {**VALID_FIELD_FULL, 'slug': f'field_{idx}'}) for idx in range(1000)
+    )
+    JsonSchemaValidators.field.cache_clear()
+
+    with patch('panoramic.cli.validate.read_yaml', side_effect=package.fields.__getitem__):
+        with patch('panoramic.cli.validate._build_validator', wraps=_build_validator) as build_validator:
+            fields, errors = _validate_package_fields(package)
+
+    assert (len(fields), errors) == (1000, [])
+    # checking the schema and building the validator for every file took over a minute for 40000 files
+    assert build_validator.call_count == 1
+
+
+def _write_invalid_package(tmp_path):
+    dataset_dir = tmp_path / 'test_dataset'
+    Paths.fields_dir(dataset_dir).mkdir(parents=True)
+    (dataset_dir / PresetFileName.DATASET_YAML.value).write_text(yaml.dump(VALID_DATASET))
+    (dataset_dir / 'test_model.model.yaml').write_text(
+        yaml.dump(
+            {
+                **VALID_MODEL_MINIMAL,
+                'fields': [{'field_map': ['field_slug'], 'data_reference': '"FIELD_SLUG"'}],
+            }
+        )
+    )
+    (Paths.fields_dir(dataset_dir) / 'invalid.field.yaml').write_text(yaml.dump({**VALID_FIELD_MINIMAL, 'slug': 1}))
+    return dataset_dir
+
+
+def test_validate_local_state_reuses_cached_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_invalid_package(tmp_path)
+
+    errors = validate_local_state()
+    assert Paths.validation_cache_file().exists()
+
+    with patch('panoramic.cli.validate._validate_data') as mock_validate_data:
+        cached_errors = validate_local_state()
+
+    assert mock_validate_data.call_count == 0
+    assert [(e.severity, str(e)) for e in cached_errors] == [(e.severity, str(e)) for e in errors]
+    assert len(errors) == 2  # invalid field file and field file missing for the model
+
+
+def test_validate_local_state_revalidates_changed_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset_dir = _write_invalid_package(tmp_path)
+    assert len(validate_local_state()) == 2
+
+    (Paths.fields_dir(dataset_dir) / 'invalid.field.yaml').write_text(yaml.dump(VALID_FIELD_MINIMAL))
+
+    with patch('panoramic.cli.validate._validate_data', wraps=_validate_data) as mock_validate_data:
+        assert validate_local_state() == []
+
+    # only the changed file is validated again
+    assert mock_validate_data.call_count == 1
+
+
+def test_load_file_keeps_yaml_types_of_cached_files(tmp_path):
+    path = tmp_path / 'file.yaml'
+    path.write_text('date: 2020-01-01\n')
+    validator = Draft7Validator({})
+    cache = ValidationCache(path=tmp_path / 'validation.json')
+    _load_file(path, validator, cache)
+    cache.save()
+
+    cache = ValidationCache.load(tmp_path / 'validation.json')
+
+    assert cache.read_file(path).is_validated
+    assert _load_file(path, validator, cache) == {'date': datetime.date(2020, 1, 1)}
+
+
+def test_validate_local_state_changed_files_only(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset_dir = _write_invalid_package(tmp_path)
+    Paths.fields_dir(tmp_path).mkdir()
+    (Paths.fields_dir(tmp_path) / 'company.field.yaml').write_text(yaml.dump(VALID_FIELD_FULL))
+
+    assert validate_local_state(changed_files=[tmp_path / 'fields' / 'company.field.yaml']) == []
+    assert len(validate_local_state(changed_files=[dataset_dir / 'test_model.model.yaml'])) == 2
+
+
+def test_load_local_state_builds_state_in_single_pass(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dataset_dir = tmp_path / 'test_dataset'
+    Paths.fields_dir(dataset_dir).mkdir(parents=True)
+    Paths.fields_dir(tmp_path).mkdir()
+    (dataset_dir / PresetFileName.DATASET_YAML.value).write_text(yaml.dump(VALID_DATASET))
+    (dataset_dir / 'test_model.model.yaml').write_text(
+        yaml.dump({**VALID_MODEL_MINIMAL, 'fields': [{'field_map': ['field_slug'], 'data_reference': '"FIELD_SLUG"'}]})
+    )
+    (Paths.fields_dir(dataset_dir) / 'field_slug.field.yaml').write_text(
+        yaml.dump({**VALID_FIELD_MINIMAL, 'slug': 'field_slug'})
+    )
+    (Paths.fields_dir(tmp_path) / 'company_field.field.yaml').write_text(yaml.dump(VALID_FIELD_FULL))
+
+    with patch('panoramic.cli.validate.read_yaml', wraps=read_yaml) as mock_read_yaml:
+        state, errors = load_local_state()
+
+    assert errors == []
+    # every file is parsed exactly once
+    assert mock_read_yaml.call_count == 4
+    expected_state = get_state()
+    assert (state.data_sources, state.models, state.fields) == (
+        expected_state.data_sources,
+        expected_state.models,
+        expected_state.fields,
+    )
+    assert [(m.package, m.file_name, m.virtual_data_source) for m in state.models] == [
+        ('test_dataset', 'test_model.model.yaml', VALID_DATASET['dataset_slug'])
+    ]
+    assert [(f.package, f.file_name, f.data_source) for f in state.fields] == [
+        (None, 'company_field.field.yaml', None),
+        ('test_dataset', 'field_slug.field.yaml', VALID_DATASET['dataset_slug']),
+    ]
+
+    # preloaded state is shared with commands, filtered same way as state read from files
+    expected_dataset_state = get_state(target_dataset=VALID_DATASET['dataset_slug'])
+    with patch('panoramic.cli.local.get._preloaded_state', None):
+        preload_state(state)
+        assert get_state() is state
+        dataset_state = get_state(target_dataset=VALID_DATASET['dataset_slug'])
+        assert get_state(target_dataset='other_dataset').is_empty
+    assert (dataset_state.data_sources, dataset_state.models, dataset_state.fields) == (
+        expected_dataset_state.data_sources,
+        expected_dataset_state.models,
+        expected_dataset_state.fields,
+    )
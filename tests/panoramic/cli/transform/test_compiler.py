@@ -1,12 +1,23 @@
 from unittest.mock import patch
 
 from panoramic.cli.husky.federated.transform.service import TransformService
+from panoramic.cli.husky.service.blending.features.override_mapping.staging import (
+    OverrideMappingStage,
+)
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
 from panoramic.cli.transform.compiler import TransformCompiler
-from panoramic.cli.transform.pano_transform import PanoTransform
+from panoramic.cli.transform.pano_transform import (
+    PanoTransform,
+    TransformMaterialization,
+)
 
 
 def test_wraps_with_create_view_statement():
-    with patch.object(TransformService, 'compile_transformation_request', lambda req, c_id: ('SELECT 1', None)):
+    with patch.object(
+        TransformService,
+        'compile_transformation_request',
+        lambda req, c_id, stage: ('SELECT 1', HuskyQueryRuntime.snowflake),
+    ):
         transform = PanoTransform(name='test', fields=['a'], target='schema.view_name')
 
         transform_compiler = TransformCompiler(company_id="company_id")
@@ -14,3 +25,74 @@ def test_wraps_with_create_view_statement():
 
         assert compiled_transform.company_id == 'company_id'
         assert compiled_transform.compiled_query == 'CREATE OR REPLACE VIEW schema.view_name AS (SELECT 1)'
+        assert compiled_transform.comment_query == (
+            f"COMMENT ON VIEW schema.view_name IS 'pano fingerprint: {compiled_transform.fingerprint}'"
+        )
+        assert compiled_transform.correctness_query == 'EXPLAIN SELECT * from schema.view_name'
+
+
+def test_passes_override_mapping_stage():
+    stage = OverrideMappingStage()
+    with patch.object(
+        TransformService,
+        'compile_transformation_request',
+        lambda req, c_id, stage: (f'SELECT {id(stage)}', HuskyQueryRuntime.snowflake),
+    ):
+        transform = PanoTransform(name='test', fields=['a'], target='schema.view_name')
+
+        compiled_transform = TransformCompiler(company_id="company_id", override_mapping_stage=stage).compile(
+            transform=transform
+        )
+
+        assert compiled_transform.compiled_query == f'CREATE OR REPLACE VIEW schema.view_name AS (SELECT {id(stage)})'
+
+
+def test_parameterized_keeps_literal_compiled_query():
+    with patch.object(
+        TransformService,
+        'compile_parameterized_transformation_request',
+        lambda req, c_id, stage: ("SELECT 'a'", 'SELECT :param_1', {'param_1': 'a'}, HuskyQueryRuntime.snowflake),
+    ):
+        transform = PanoTransform(name='test', fields=['a'], target='schema.view_name')
+
+        compiled_transform = TransformCompiler(company_id="company_id").compile(transform=transform, parameterized=True)
+
+        assert compiled_transform.compiled_query == "CREATE OR REPLACE VIEW schema.view_name AS (SELECT 'a')"
+        assert compiled_transform.parameterized_query == 'CREATE OR REPLACE VIEW schema.view_name AS (SELECT :param_1)'
+        assert compiled_transform.parameters == {'param_1': 'a'}
+
+
+def test_incremental_adds_setup_queries():
+    with patch.object(
+        TransformService,
+        'compile_parameterized_transformation_request',
+        lambda req, c_id, stage: (
+            "SELECT 'a' AS a",
+            'SELECT :param_1 AS a',
+            {'param_1': 'a'},
+            HuskyQueryRuntime.snowflake,
+        ),
+    ):
+        transform = PanoTransform(
+            name='test',
+            fields=['a'],
+            target='schema.table_name',
+            materialization=TransformMaterialization.INCREMENTAL,
+            time_field='a',
+        )
+
+        compiled_transform = TransformCompiler(company_id="company_id").compile(transform=transform, parameterized=True)
+
+        assert compiled_transform.setup_queries == [
+            "CREATE TABLE IF NOT EXISTS schema.table_name AS SELECT * FROM (SELECT 'a' AS a) AS new_rows WHERE 1 = 0",
+            'DELETE FROM schema.table_name WHERE a >= (SELECT MAX(a) FROM schema.table_name)',
+        ]
+        assert compiled_transform.parameterized_setup_queries == [
+            'CREATE TABLE IF NOT EXISTS schema.table_name AS SELECT * FROM (SELECT :param_1 AS a) AS new_rows '
+            'WHERE 1 = 0',
+            'DELETE FROM schema.table_name WHERE a >= (SELECT MAX(a) FROM schema.table_name)',
+        ]
+        assert compiled_transform.compiled_query.startswith("INSERT INTO schema.table_name SELECT * FROM (SELECT 'a'")
+        assert compiled_transform.parameterized_queries[-1].startswith(
+            'INSERT INTO schema.table_name SELECT * FROM (SELECT :param_1'
+        )
@@ -2,7 +2,7 @@ from unittest.mock import call, patch
 
 import pytest
 
-from panoramic.cli.errors import ConnectionNotFound
+from panoramic.cli.errors import ConnectionNotFound, TransformVerificationFailed
 from panoramic.cli.transform.executor import TransformExecutor
 from panoramic.cli.transform.pano_transform import CompiledTransform, PanoTransform
 
@@ -25,6 +25,99 @@ def test_executes_on_a_connection(mock_create_engine, mock_connections_get, mock
     ]
 
 
+@patch('panoramic.cli.connection.Connection.execute')
+@patch('panoramic.cli.connection.Connection.get')
+@patch('sqlalchemy.engine.create_engine')
+def test_executes_with_parameters(mock_create_engine, mock_connections_get, mock_connections_execute):
+    transform = PanoTransform(name='test', fields=['a'], target='connection.schema.view_name')
+    compiled_transform = CompiledTransform(
+        transform=transform,
+        company_id='company_id',
+        compiled_query="q 'a'",
+        parameterized_query='q :param_1',
+        parameters={'param_1': 'a'},
+    )
+
+    mock_connections_get.return_value = {}
+
+    TransformExecutor.execute(compiled_transform)
+
+    assert mock_connections_execute.mock_calls == [
+        call(sql='q :param_1', connection={}, parameters={'param_1': 'a'}),
+        call(sql=compiled_transform.correctness_query, connection={}),
+    ]
+
+
+@patch('panoramic.cli.connection.Connection.execute')
+@patch('panoramic.cli.connection.Connection.get')
+@patch('sqlalchemy.engine.create_engine')
+def test_executes_setup_queries_first(mock_create_engine, mock_connections_get, mock_connections_execute):
+    transform = PanoTransform(name='test', fields=['a'], target='connection.schema.table_name')
+    compiled_transform = CompiledTransform(
+        transform=transform, company_id='company_id', compiled_query='insert', setup_queries=['create', 'delete']
+    )
+
+    mock_connections_get.return_value = {}
+
+    TransformExecutor.execute(compiled_transform)
+
+    assert mock_connections_execute.mock_calls == [
+        call(sql='create', connection={}),
+        call(sql='delete', connection={}),
+        call(sql='insert', connection={}),
+        call(sql=compiled_transform.correctness_query, connection={}),
+    ]
+
+
+@patch('panoramic.cli.connection.Connection.execute')
+@patch('panoramic.cli.connection.Connection.get')
+@patch('sqlalchemy.engine.create_engine')
+def test_executes_comment_query(mock_create_engine, mock_connections_get, mock_connections_execute):
+    transform = PanoTransform(name='test', fields=['a'], target='connection.schema.view_name')
+    compiled_transform = CompiledTransform(
+        transform=transform, company_id='company_id', compiled_query='q', comment_query='comment'
+    )
+
+    mock_connections_get.return_value = {}
+
+    TransformExecutor.execute(compiled_transform, comment=True)
+
+    assert mock_connections_execute.mock_calls == [
+        call(sql='q', connection={}),
+        call(sql=compiled_transform.correctness_query, connection={}),
+        call(sql='comment', connection={}),
+    ]
+
+
+@patch('panoramic.cli.connection.Connection.fetch_all')
+@patch('panoramic.cli.connection.Connection.execute')
+@patch('panoramic.cli.connection.Connection.get')
+@patch('sqlalchemy.engine.create_engine')
+def test_verifies_columns_of_target(
+    mock_create_engine, mock_connections_get, mock_connections_execute, mock_connections_fetch_all
+):
+    transform = PanoTransform(name='test', fields=['a', 'b'], target='connection.schema.view_name')
+    compiled_transform = CompiledTransform(
+        transform=transform,
+        company_id='company_id',
+        compiled_query='q',
+        correctness_query='columns',
+        expected_columns=['a', 'b'],
+    )
+
+    mock_connections_get.return_value = {}
+    mock_connections_fetch_all.return_value = [('A',), ('B',)]
+
+    TransformExecutor.execute(compiled_transform)
+
+    mock_connections_fetch_all.assert_called_once_with(sql='columns', connection={})
+
+    mock_connections_fetch_all.return_value = [('A',)]
+
+    with pytest.raises(TransformVerificationFailed, match='missing columns b'):
+        TransformExecutor.execute(compiled_transform)
+
+
 @patch('panoramic.cli.connection.Connection.execute')
 @patch('panoramic.cli.connection.Connection.get')
 @patch('sqlalchemy.engine.create_engine')
@@ -0,0 +1,65 @@
+from unittest.mock import call, patch
+
+from panoramic.cli.transform.commands import exec_command
+from panoramic.cli.transform.fingerprints import TransformFingerprints
+from panoramic.cli.transform.pano_transform import (
+    CompiledTransform,
+    PanoTransform,
+    TransformMaterialization,
+)
+
+_CONNECTION = {'url': 'sqlite://'}
+
+
+def _compiled_transform(
+    query: str, materialization: TransformMaterialization = TransformMaterialization.VIEW
+) -> CompiledTransform:
+    transform = PanoTransform(name='test', fields=['a'], target='schema.view_name', materialization=materialization)
+    return CompiledTransform(transform=transform, company_id='company_id', compiled_query=query)
+
+
+def test_fingerprints_are_persisted(tmp_path):
+    path = tmp_path / 'transforms.json'
+    fingerprints = TransformFingerprints.load(path)
+    fingerprints.store(_compiled_transform('q'), _CONNECTION)
+    fingerprints.save()
+
+    fingerprints = TransformFingerprints.load(path)
+
+    assert fingerprints.is_deployed(_compiled_transform('q'), _CONNECTION)
+    assert not fingerprints.is_deployed(_compiled_transform('changed q'), _CONNECTION)
+    assert not fingerprints.is_deployed(_compiled_transform('q'), {'url': 'sqlite:///other.db'})
+
+
+def test_tables_are_never_deployed(tmp_path):
+    compiled_transform = _compiled_transform('q', TransformMaterialization.TABLE)
+    fingerprints = TransformFingerprints.load(tmp_path / 'transforms.json')
+    fingerprints.store(compiled_transform, _CONNECTION)
+
+    assert not fingerprints.is_deployed(compiled_transform, _CONNECTION)
+
+
+@patch('panoramic.cli.transform.commands.echo_info')
+@patch('panoramic.cli.transform.commands.TransformExecutor')
+@patch('panoramic.cli.transform.commands.TransformCompiler')
+@patch('panoramic.cli.transform.commands.get_company_id')
+@patch('panoramic.cli.transform.commands.get_transforms')
+def test_exec_skips_unchanged_transforms(
+    mock_get_transforms, _, mock_compiler, mock_executor, mock_echo_info, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    mock_get_transforms.return_value = [(PanoTransform(name='test', fields=['a'], target='t'), tmp_path)]
+    mock_executor.get_connection.return_value = _CONNECTION
+
+    mock_compiler.return_value.compile.return_value = _compiled_transform('q')
+    exec_command(yes=True)
+    exec_command(yes=True)
+    exec_command(yes=True, force=True)
+    mock_compiler.return_value.compile.return_value = _compiled_transform('changed q')
+    exec_command(yes=True)
+
+    assert mock_executor.execute.call_count == 3
+    assert call('Executed 1 transforms, skipped 0 unchanged transforms, 0 transforms failed') in (
+        mock_echo_info.mock_calls
+    )
+    assert call('No changed transforms to execute, skipped 1 unchanged transforms...') in mock_echo_info.mock_calls
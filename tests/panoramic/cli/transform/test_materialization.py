@@ -0,0 +1,142 @@
+from typing import List, Optional, Tuple
+
+import pytest
+from sqlalchemy import create_engine
+
+from panoramic.cli.errors import InvalidTransformMaterialization
+from panoramic.cli.husky.service.helpers import RUNTIME_DIALECTS
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
+from panoramic.cli.transform.materialization import TransformMaterializer
+from panoramic.cli.transform.pano_transform import (
+    PanoTransform,
+    TransformMaterialization,
+)
+
+_FIELDS = ['day', 'key', 'value']
+
+
+def _transform(
+    materialization: TransformMaterialization, time_field: Optional[str] = None, unique_key: Optional[str] = None
+) -> PanoTransform:
+    return PanoTransform(
+        name='test',
+        fields=_FIELDS,
+        target='target_table',
+        materialization=materialization,
+        time_field=time_field,
+        unique_key=unique_key,
+    )
+
+
+def _query(rows: List[Tuple[int, str, int]]) -> str:
+    return ' UNION ALL '.join(f"SELECT {day} AS day, '{key}' AS key, {value} AS value" for day, key, value in rows)
+
+
+def _materializer(transform: PanoTransform, runtime: HuskyQueryRuntime = HuskyQueryRuntime.snowflake):
+    return TransformMaterializer(transform, RUNTIME_DIALECTS[runtime], {field: field for field in _FIELDS})
+
+
+def _run(engine, transform: PanoTransform, rows: List[Tuple[int, str, int]]) -> List[Tuple[int, str, int]]:
+    materializer = TransformMaterializer(transform, engine.dialect, {field: field for field in _FIELDS})
+    query = _query(rows)
+    # every statement is committed on its own, same as by the transform executor
+    for statement in [*materializer.setup_statements(query), materializer.statement(query)]:
+        engine.execute(statement)
+
+    return engine.execute('SELECT day, key, value FROM target_table ORDER BY day, key').fetchall()
+
+
+def test_incremental_inserts_newer_rows():
+    # in-memory database stands in for the warehouse, DELETE and INSERT with the time filter are plain SQL
+    engine = create_engine('sqlite://')
+    transform = _transform(TransformMaterialization.INCREMENTAL, time_field='day')
+
+    # target is empty on the first execution, so all rows are inserted
+    assert _run(engine, transform, [(1, 'a', 1), (2, 'b', 2)]) == [(1, 'a', 1), (2, 'b', 2)]
+    # rows of the last day are written again, including rows arriving later for it
+    assert _run(engine, transform, [(1, 'a', 10), (2, 'b', 20), (2, 'd', 40), (3, 'c', 30)]) == [
+        (1, 'a', 1),
+        (2, 'b', 20),
+        (2, 'd', 40),
+        (3, 'c', 30),
+    ]
+
+
+@pytest.mark.parametrize('runtime', [HuskyQueryRuntime.snowflake, HuskyQueryRuntime.bigquery])
+def test_table_is_replaced(runtime):
+    materializer = _materializer(_transform(TransformMaterialization.TABLE), runtime)
+
+    assert materializer.setup_statements('q') == []
+    assert materializer.statement('q') == 'CREATE OR REPLACE TABLE target_table AS (q)'
+
+
+def test_incremental_inserts_rows_newer_than_target():
+    materializer = _materializer(_transform(TransformMaterialization.INCREMENTAL, time_field='day'))
+
+    assert materializer.setup_statements('q') == [
+        'CREATE TABLE IF NOT EXISTS target_table AS SELECT * FROM (q) AS new_rows WHERE 1 = 0',
+        'DELETE FROM target_table WHERE day >= (SELECT MAX(day) FROM target_table)',
+    ]
+    assert materializer.statement('q') == (
+        'INSERT INTO target_table SELECT * FROM (q) AS new_rows '
+        'WHERE (SELECT MAX(day) FROM target_table) IS NULL OR new_rows.day > (SELECT MAX(day) FROM target_table)'
+    )
+
+
+def test_incremental_merges_rows_by_unique_key():
+    materializer = _materializer(_transform(TransformMaterialization.INCREMENTAL, unique_key='key'))
+
+    assert materializer.setup_statements('q') == [
+        'CREATE TABLE IF NOT EXISTS target_table AS SELECT * FROM (q) AS new_rows WHERE 1 = 0'
+    ]
+    assert materializer.statement('q') == (
+        'MERGE INTO target_table AS existing_rows USING (SELECT * FROM (q) AS new_rows) AS new_rows '
+        'ON existing_rows.key = new_rows.key '
+        'WHEN MATCHED THEN UPDATE SET day = new_rows.day, key = new_rows.key, value = new_rows.value '
+        'WHEN NOT MATCHED THEN INSERT (day, key, value) VALUES (new_rows.day, new_rows.key, new_rows.value)'
+    )
+
+
+def test_incremental_merges_rows_of_last_time_and_newer():
+    materializer = _materializer(_transform(TransformMaterialization.INCREMENTAL, time_field='day', unique_key='key'))
+
+    assert materializer.setup_statements('q') == [
+        'CREATE TABLE IF NOT EXISTS target_table AS SELECT * FROM (q) AS new_rows WHERE 1 = 0'
+    ]
+    # rows of the last day in the target are merged again
+    assert materializer.statement('q') == (
+        'MERGE INTO target_table AS existing_rows USING (SELECT * FROM (q) AS new_rows '
+        'WHERE (SELECT MAX(day) FROM target_table) IS NULL OR new_rows.day >= (SELECT MAX(day) FROM target_table)) '
+        'AS new_rows ON existing_rows.key = new_rows.key '
+        'WHEN MATCHED THEN UPDATE SET day = new_rows.day, key = new_rows.key, value = new_rows.value '
+        'WHEN NOT MATCHED THEN INSERT (day, key, value) VALUES (new_rows.day, new_rows.key, new_rows.value)'
+    )
+
+
+@pytest.mark.parametrize('time_field,unique_key', [(None, None), ('missing', None), (None, 'missing')])
+def test_invalid_incremental_transform(time_field, unique_key):
+    transform = _transform(TransformMaterialization.INCREMENTAL, time_field=time_field, unique_key=unique_key)
+
+    with pytest.raises(InvalidTransformMaterialization):
+        TransformMaterializer(transform, RUNTIME_DIALECTS[HuskyQueryRuntime.snowflake], {})
+
+
+@pytest.mark.parametrize(
+    'runtime,materialization,expected',
+    [
+        (
+            HuskyQueryRuntime.snowflake,
+            TransformMaterialization.VIEW,
+            "COMMENT ON VIEW target_table IS 'it''s'",
+        ),
+        (
+            HuskyQueryRuntime.bigquery,
+            TransformMaterialization.TABLE,
+            "ALTER TABLE target_table SET OPTIONS (description = 'it''s')",
+        ),
+    ],
+)
+def test_comment_statement(runtime, materialization, expected):
+    materializer = TransformMaterializer(_transform(materialization), RUNTIME_DIALECTS[runtime], {})
+
+    assert materializer.comment_statement("it's") == expected
@@ -0,0 +1,83 @@
+from typing import Optional
+
+import pytest
+
+from panoramic.cli.errors import InvalidTransformVerification
+from panoramic.cli.husky.service.helpers import RUNTIME_DIALECTS
+from panoramic.cli.husky.service.types.enums import HuskyQueryRuntime
+from panoramic.cli.transform.pano_transform import (
+    PanoTransform,
+    TransformVerification,
+)
+from panoramic.cli.transform.verification import TransformVerifier
+
+_COLUMN_NAMES = {'a': 'a', 'b|c': 'b_c'}
+
+
+def _verifier(
+    runtime: HuskyQueryRuntime,
+    target: str = 'db.schema.view_name',
+    transform_verification: Optional[TransformVerification] = None,
+    verification: Optional[TransformVerification] = None,
+) -> TransformVerifier:
+    transform = PanoTransform(name='test', fields=['a', 'b|c'], target=target, verification=transform_verification)
+    return TransformVerifier(transform, RUNTIME_DIALECTS[runtime], _COLUMN_NAMES, verification)
+
+
+@pytest.mark.parametrize(
+    'runtime,expected',
+    [
+        (HuskyQueryRuntime.snowflake, TransformVerification.EXPLAIN),
+        (HuskyQueryRuntime.bigquery, TransformVerification.COLUMNS),
+        (HuskyQueryRuntime.postgres, TransformVerification.LIMIT_ZERO),
+    ],
+)
+def test_default_verification_of_dialect(runtime, expected):
+    assert _verifier(runtime).verification is expected
+
+
+def test_transform_verification_overrides_execution_verification():
+    verifier = _verifier(
+        HuskyQueryRuntime.snowflake,
+        transform_verification=TransformVerification.LIMIT_ONE,
+        verification=TransformVerification.COLUMNS,
+    )
+    assert verifier.query() == 'SELECT * from db.schema.view_name limit 1'
+    assert verifier.expected_columns() is None
+
+    verifier = _verifier(HuskyQueryRuntime.snowflake, verification=TransformVerification.LIMIT_ZERO)
+    assert verifier.query() == 'SELECT * from db.schema.view_name limit 0'
+
+
+@pytest.mark.parametrize(
+    'runtime,target,expected',
+    [
+        (
+            HuskyQueryRuntime.snowflake,
+            'db.schema.view_name',
+            "SELECT column_name FROM db.information_schema.columns "
+            "WHERE UPPER(table_schema) = UPPER('schema') AND UPPER(table_name) = UPPER('view_name')",
+        ),
+        (
+            HuskyQueryRuntime.snowflake,
+            'view_name',
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = CURRENT_SCHEMA() AND UPPER(table_name) = UPPER('view_name')",
+        ),
+        (
+            HuskyQueryRuntime.bigquery,
+            '`project.dataset.view_name`',
+            "SELECT column_name FROM `project.dataset`.INFORMATION_SCHEMA.COLUMNS WHERE table_name = 'view_name'",
+        ),
+    ],
+)
+def test_columns_verification(runtime, target, expected):
+    verifier = _verifier(runtime, target=target, verification=TransformVerification.COLUMNS)
+
+    assert verifier.query() == expected
+    assert verifier.expected_columns() == ['a', 'b_c']
+
+
+def test_explain_verification_is_not_supported_by_bigquery():
+    with pytest.raises(InvalidTransformVerification):
+        _verifier(HuskyQueryRuntime.bigquery, verification=TransformVerification.EXPLAIN)